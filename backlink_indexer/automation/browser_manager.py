@@ -3,6 +3,8 @@ Advanced browser manager with anti-detection capabilities
 """
 
 import asyncio
+import contextlib
+import os
 import random
 import logging
 from typing import Optional, Dict, List
@@ -18,12 +20,40 @@ from fake_useragent import UserAgent
 class StealthBrowserManager:
     """Advanced browser manager with anti-detection capabilities"""
     
+    # Chromium switches applied to every browser
+    _STEALTH_ARGS = (
+        '--no-sandbox',
+        '--disable-dev-shm-usage',
+        '--disable-blink-features=AutomationControlled'
+    )
+    
+    # Script that hides the navigator.webdriver automation flag
+    _HIDE_WEBDRIVER_JS = "Object.defineProperty(navigator, 'webdriver', {get: () => undefined})"
+    
+    # Window-size arguments to pick from when launching a browser
+    _WINDOW_SIZES = (
+        '--window-size=1920,1080',
+        '--window-size=1366,768',
+        '--window-size=1440,900'
+    )
+    
+    # Fallback user agents if fake_useragent fails
+    _FALLBACK_AGENTS = (
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
+        "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
+        "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
+    )
+    
     def __init__(self, config):
         self.config = config
         self.user_agent = UserAgent()
         self.active_sessions = {}
         self.current_proxy_index = 0
+        # Private PRNG so concurrent managers don't contend on the global one
+        self._rng = random.Random(os.urandom(16))
         self.setup_logging()
+        # Warm browsers shared by engines instead of a cold start per task
+        self.browser_pool = BrowserPool(self, config.browser_pool_size)
         
     def setup_logging(self):
         """Configure logging for browser operations"""
@@ -34,13 +64,7 @@ class StealthBrowserManager:
         try:
             return self.user_agent.random
         except:
-            # Fallback user agents if fake_useragent fails
-            fallback_agents = [
-                "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
-                "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
-                "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
-            ]
-            return random.choice(fallback_agents)
+            return self._rng.choice(self._FALLBACK_AGENTS)
     
     def create_stealth_browser(self):
         """Create a browser instance with stealth capabilities"""
@@ -49,36 +73,34 @@ class StealthBrowserManager:
         if hasattr(self.config, 'mock_mode') and self.config.mock_mode:
             return MockBrowser()
         
-        options = Options()
+        # Anti-detection arguments, randomized window size and user agent
+        args = list(self._STEALTH_ARGS)
+        args.append(self._rng.choice(self._WINDOW_SIZES))
+        args.append(f'--user-agent={self.get_random_user_agent()}')
         
         if self.config.headless_mode:
-            options.add_argument('--headless')
-        
-        # Anti-detection arguments
-        options.add_argument('--no-sandbox')
-        options.add_argument('--disable-dev-shm-usage')
-        options.add_argument('--disable-blink-features=AutomationControlled')
-        options.add_experimental_option("excludeSwitches", ["enable-automation"])
-        options.add_experimental_option('useAutomationExtension', False)
-        
-        # Randomize window size
-        window_sizes = ['--window-size=1920,1080', '--window-size=1366,768', '--window-size=1440,900']
-        options.add_argument(random.choice(window_sizes))
-        
-        # Set random user agent
-        options.add_argument(f'--user-agent={self.get_random_user_agent()}')
+            args.append('--headless')
         
         # Proxy configuration (if enabled)
         if self.config.enable_proxy_rotation and self.config.proxy_pool:
             proxy = self.get_next_proxy()
             if proxy:
-                options.add_argument(f'--proxy-server={proxy}')
+                args.append(f'--proxy-server={proxy}')
+        
+        options = Options()
+        options.arguments.extend(args)
+        options.add_experimental_option("excludeSwitches", ["enable-automation"])
+        options.add_experimental_option('useAutomationExtension', False)
         
         try:
             driver = webdriver.Chrome(options=options)
             
-            # Execute JavaScript to hide automation indicators
-            driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
+            # Register the automation-hiding script once over CDP so Chrome
+            # re-applies it to every new document before page scripts run
+            driver.execute_cdp_cmd(
+                "Page.addScriptToEvaluateOnNewDocument",
+                {"source": self._HIDE_WEBDRIVER_JS}
+            )
             
             return driver
         except Exception as e:
@@ -99,7 +121,7 @@ class StealthBrowserManager:
         """Simulate human-like delays between actions"""
         min_delay = min_delay or self.config.min_delay_between_actions
         max_delay = max_delay or self.config.max_delay_between_actions
-        delay = random.uniform(min_delay, max_delay)
+        delay = self._rng.uniform(min_delay, max_delay)
         await asyncio.sleep(delay)
     
     async def human_like_typing(self, element, text: str):
@@ -109,25 +131,32 @@ class StealthBrowserManager:
         for char in text:
             element.send_keys(char)
             # Random typing speed with occasional pauses
-            typing_delay = random.uniform(*typing_speed_range)
-            if random.random() < 0.1:  # 10% chance of longer pause
-                typing_delay *= random.uniform(2, 4)
+            typing_delay = self._rng.uniform(*typing_speed_range)
+            if self._rng.random() < 0.1:  # 10% chance of longer pause
+                typing_delay *= self._rng.uniform(2, 4)
             await asyncio.sleep(typing_delay)
     
     async def simulate_human_behavior(self, driver: webdriver.Chrome):
         """Simulate various human behaviors on the page"""
         
+        # Sample every random decision up front so the scripted actions run
+        # back to back and the page only waits once
+        pause = 0.0
+        
         # Random mouse movements (simulated via JavaScript)
-        if random.random() < self.config.mouse_movement_probability:
-            x = random.randint(100, 800)
-            y = random.randint(100, 600)
+        if self._rng.random() < self.config.mouse_movement_probability:
+            x = self._rng.randint(100, 800)
+            y = self._rng.randint(100, 600)
             driver.execute_script(f"document.dispatchEvent(new MouseEvent('mousemove', {{clientX: {x}, clientY: {y}}}));")
         
         # Random scrolling
-        if random.random() < 0.3:  # 30% chance to scroll
-            scroll_amount = random.randint(100, 500)
+        if self._rng.random() < 0.3:  # 30% chance to scroll
+            scroll_amount = self._rng.randint(100, 500)
+            pause += self._rng.uniform(0.5, 2.0)
             driver.execute_script(f"window.scrollBy(0, {scroll_amount});")
-            await asyncio.sleep(random.uniform(0.5, 2.0))
+        
+        if pause:
+            await asyncio.sleep(pause)
     
     async def safe_navigate(self, driver: webdriver.Chrome, url: str, timeout: int = 10) -> bool:
         """Safely navigate to a URL with error handling"""
@@ -163,10 +192,11 @@ class StealthBrowserManager:
         try:
             # Scroll element into view
             driver.execute_script("arguments[0].scrollIntoView(true);", element)
-            await asyncio.sleep(random.uniform(0.2, 0.8))
             
-            # Simulate mouse hover before click
-            await asyncio.sleep(random.uniform(0.1, 0.5))
+            # Settle after scrolling plus a mouse hover before the click,
+            # awaited as a single sleep
+            pre_click_delay = self._rng.uniform(0.2, 0.8) + self._rng.uniform(0.1, 0.5)
+            await asyncio.sleep(pre_click_delay)
             
             element.click()
             await self.human_like_delay(0.5, 2.0)
@@ -187,13 +217,145 @@ class StealthBrowserManager:
         """Cleanup all resources"""
         self.logger.info("Shutting down browser manager")
         
-        # Close all active sessions
-        for session_id, driver in self.active_sessions.items():
-            self.cleanup_driver(driver)
+        await self.browser_pool.close()
+        
+        # Close all active sessions; driver.quit() blocks, so quit them in
+        # parallel worker threads
+        await asyncio.gather(*(
+            asyncio.to_thread(self.cleanup_driver, driver)
+            for driver in self.active_sessions.values()
+        ))
         
         self.active_sessions.clear()
 
 
+class BrowserPool:
+    """
+    Bounded pool of stealth browsers reused across tasks
+    Browsers are launched on demand up to the pool size and reset between
+    borrowers; entering the pool as a context manager warms every slot up front
+    """
+    
+    def __init__(self, browser_manager, size: int):
+        self.browser_manager = browser_manager
+        self.size = max(1, size)
+        self._idle: Optional[asyncio.Queue] = None
+        self._idle_loop = None
+        self._drivers = []
+        self._launching = 0
+        self.launch_attempts = 3
+        self.logger = logging.getLogger(f"{__name__}.BrowserPool")
+    
+    async def __aenter__(self) -> 'BrowserPool':
+        await self.warm()
+        return self
+    
+    async def __aexit__(self, *exc_info):
+        await self.close()
+    
+    async def warm(self):
+        """Launch every remaining browser in parallel"""
+        idle = self._idle_queue()
+        missing = self.size - len(self._drivers) - self._launching
+        
+        # Count launches in flight so concurrent borrowers don't overshoot the size
+        self._launching += missing
+        try:
+            launched = await asyncio.gather(*(self._launch() for _ in range(missing)), return_exceptions=True)
+        finally:
+            self._launching -= missing
+        
+        for driver in launched:
+            if isinstance(driver, Exception):
+                self.logger.error(f"Failed to warm browser: {str(driver)}")
+                continue
+            self._drivers.append(driver)
+            idle.put_nowait(driver)
+    
+    @contextlib.asynccontextmanager
+    async def acquire(self):
+        """Borrow a browser for the duration of the block"""
+        idle = self._idle_queue()
+        while True:
+            if idle.empty() and len(self._drivers) + self._launching < self.size:
+                driver = await self._launch_slot()
+                break
+            
+            driver = await idle.get()
+            # None marks the slot of a discarded browser; go round again to
+            # launch its replacement if nobody else has taken the slot
+            if driver is not None:
+                break
+        
+        try:
+            yield driver
+        finally:
+            if self._reset(driver):
+                idle.put_nowait(driver)
+            else:
+                await self._discard(driver)
+    
+    async def close(self):
+        """Quit every browser the pool launched"""
+        drivers, self._drivers = self._drivers, []
+        self._idle = None
+        
+        # driver.quit() blocks, so quit them in parallel worker threads
+        cleanup = self.browser_manager.cleanup_driver
+        await asyncio.gather(*(asyncio.to_thread(cleanup, driver) for driver in drivers))
+    
+    def _idle_queue(self) -> asyncio.Queue:
+        """Idle browsers for the running loop; a new loop starts from a fresh queue"""
+        loop = asyncio.get_running_loop()
+        if self._idle is None or self._idle_loop is not loop:
+            self._idle = asyncio.Queue()
+            self._idle_loop = loop
+            for driver in self._drivers:
+                self._idle.put_nowait(driver)
+        return self._idle
+    
+    async def _launch(self):
+        """Create one real browser without blocking the event loop"""
+        mock_mode = getattr(self.browser_manager.config, 'mock_mode', False)
+        for attempt in range(1, self.launch_attempts + 1):
+            driver = await asyncio.to_thread(self.browser_manager.create_stealth_browser)
+            
+            # create_stealth_browser falls back to a MockBrowser when Chrome
+            # fails; outside mock mode that would silently fake every submission
+            if mock_mode or not isinstance(driver, MockBrowser):
+                return driver
+            self.logger.warning(f"Browser launch fell back to a mock (attempt {attempt}/{self.launch_attempts})")
+        
+        raise WebDriverException(f"Could not launch a browser after {self.launch_attempts} attempts")
+    
+    async def _launch_slot(self):
+        """Launch a browser into a free slot, counting it while it starts"""
+        self._launching += 1
+        try:
+            driver = await self._launch()
+        finally:
+            self._launching -= 1
+        self._drivers.append(driver)
+        return driver
+    
+    async def _discard(self, driver):
+        """Quit a browser that can't be reused and free its slot for a replacement"""
+        with contextlib.suppress(ValueError):
+            self._drivers.remove(driver)
+        await asyncio.to_thread(self.browser_manager.cleanup_driver, driver)
+        self._idle_queue().put_nowait(None)
+    
+    def _reset(self, driver) -> bool:
+        """Clear cookies and storage so the next borrower starts clean; False if that failed"""
+        try:
+            driver.delete_all_cookies()
+            driver.execute_script("window.localStorage.clear();")
+            return True
+        except Exception as e:
+            self.logger.warning(f"Browser reset failed, discarding it: {str(e)}")
+            return False
+
+
 class ProxyRotator:
     """Manages proxy rotation for browser sessions"""
     
@@ -252,7 +414,12 @@ class MockBrowser:
         return MockElement()
     
     def execute_script(self, script, element=None):
-        """Mock script execution"""
+        """Mock script execution; every page reports it has finished loading"""
+        if 'document.readyState' in script:
+            return 'complete'
+    
+    def delete_all_cookies(self):
+        """Mock cookie reset"""
         pass
     
     def quit(self):
@@ -7,7 +7,19 @@ import time
 import logging
 from typing import List, Optional
 import requests
+from collections import deque
 from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlparse
+
+try:
+    import resource
+except ImportError:  # Not available on Windows
+    resource = None
+
+try:
+    import maxminddb
+except ImportError:  # GeoIP classification is optional
+    maxminddb = None
 
 
 class ProxyRotator:
@@ -15,7 +27,8 @@ class ProxyRotator:
     
     def __init__(self, config):
         self.config = config
-        self.proxy_pool = config.proxy_pool.copy()
+        # Drop duplicate entries (order preserved) so each proxy is probed once
+        self.proxy_pool = list(dict.fromkeys(config.proxy_pool))
         self.working_proxies = []
         self.failed_proxies = []
         self.current_index = 0
@@ -32,10 +45,16 @@ class ProxyRotator:
         self.logger = logging.getLogger(f"{__name__}.ProxyRotator")
     
     def validate_proxy_pool(self):
-        """Validate all proxies in the pool asynchronously"""
+        """Validate all proxies in the pool concurrently on a thread pool"""
+        self.proxy_pool = list(dict.fromkeys(self.proxy_pool))
         self.logger.info(f"Validating {len(self.proxy_pool)} proxies...")
         
-        with ThreadPoolExecutor(max_workers=20) as executor:
+        # Probing is pure socket I/O, so size the pool to the proxy count
+        # up to the configured ceiling
+        max_workers = max(1, min(len(self.proxy_pool), getattr(self.config, 'max_proxy_workers', 200)))
+        self._raise_open_file_limit(max_workers)
+        
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
             # Test each proxy
             results = list(executor.map(self._test_single_proxy, self.proxy_pool))
             
@@ -51,6 +70,21 @@ class ProxyRotator:
         # Update the proxy pool to only include working proxies
         self.proxy_pool = self.working_proxies.copy()
     
+    def _raise_open_file_limit(self, max_workers: int):
+        """Raise the soft open-file limit so every probe can hold a socket"""
+        if resource is None:
+            return
+        
+        try:
+            soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+            wanted = max(4096, max_workers * 2)
+            if hard != resource.RLIM_INFINITY:
+                wanted = min(wanted, hard)
+            if soft != resource.RLIM_INFINITY and soft < wanted:
+                resource.setrlimit(resource.RLIMIT_NOFILE, (wanted, hard))
+        except (ValueError, OSError) as e:
+            self.logger.debug(f"Could not raise open file limit: {str(e)}")
+    
     def _test_single_proxy(self, proxy: str, timeout: int = 10) -> bool:
         """Test a single proxy for connectivity"""
         try:
@@ -192,32 +226,67 @@ class ResidentialProxyManager(ProxyRotator):
 class GeoTargetedProxyManager(ProxyRotator):
     """Proxy manager with geographical targeting capabilities"""
     
+    # GeoIP ISO codes that map onto a differently named regional pool
+    _COUNTRY_ALIASES = {'GB': 'UK'}
+    
     def __init__(self, config):
         super().__init__(config)
         self.geo_proxies = {
-            'US': [],
-            'UK': [],
-            'CA': [],
-            'AU': [],
-            'DE': [],
-            'Global': self.proxy_pool.copy()
+            'US': deque(),
+            'UK': deque(),
+            'CA': deque(),
+            'AU': deque(),
+            'DE': deque(),
+            'Global': deque()
         }
+        self._geo = self._open_geoip_database()
         self.classify_proxies_by_geo()
     
-    def classify_proxies_by_geo(self):
-        """Classify proxies by geographical location (basic implementation)"""
-        # This is a simplified implementation
-        # In production, you'd use a GeoIP service to classify proxies
+    def _open_geoip_database(self):
+        """Memory-map the local GeoIP database once, if one is configured"""
+        db_path = getattr(self.config, 'geoip_db_path', '')
+        if not db_path or maxminddb is None:
+            return None
+        
+        try:
+            return maxminddb.open_database(db_path, mode=maxminddb.MODE_MMAP)
+        except (OSError, ValueError) as e:
+            self.logger.warning(f"Could not open GeoIP database {db_path}: {str(e)}")
+            return None
+    
+    def _lookup_country(self, proxy: str) -> Optional[str]:
+        """Resolve a proxy's country code from the local GeoIP database"""
+        if self._geo is None:
+            return None
+        
+        host = urlparse(proxy if '://' in proxy else f'//{proxy}').hostname
+        if not host:
+            return None
         
+        try:
+            record = self._geo.get(host)
+        except ValueError:
+            # Hostnames can't be looked up without a DNS round-trip
+            return None
+        
+        country = ((record or {}).get('country') or {}).get('iso_code')
+        return self._COUNTRY_ALIASES.get(country, country)
+    
+    def classify_proxies_by_geo(self):
+        """Classify proxies by geographical location using the local GeoIP database"""
         for proxy in self.proxy_pool:
-            # Extract IP and classify (simplified)
-            # In real implementation, use GeoIP lookup
+            country = self._lookup_country(proxy)
+            if country:
+                self.geo_proxies.setdefault(country, deque()).append(proxy)
             self.geo_proxies['Global'].append(proxy)
     
     def get_geo_proxy(self, country_code: str = 'Global') -> Optional[str]:
         """Get a proxy from specific geographical region"""
-        if country_code in self.geo_proxies and self.geo_proxies[country_code]:
-            return random.choice(self.geo_proxies[country_code])
+        pool = self.geo_proxies.get(country_code)
+        if pool:
+            proxy = pool[0]
+            pool.rotate(-1)
+            return proxy
         
         # Fallback to global pool
-        return self.get_next_proxy()
\ No newline at end of file
+        return self.get_next_proxy()
@@ -0,0 +1,42 @@
+"""
+Pre-sampled randomness for high-frequency stealth decisions
+"""
+
+from typing import Sequence, Any
+import numpy as np
+
+
+class RandomPool:
+    """Serves uniform draws from a NumPy-filled ring buffer"""
+    
+    def __init__(self, size: int = 4096):
+        self._size = size
+        self._generator = np.random.default_rng()
+        self._refill()
+    
+    def _refill(self):
+        """Draw the next block of uniform samples in one vectorized call"""
+        # Plain floats index much faster than NumPy scalars
+        self._pool = self._generator.random(self._size).tolist()
+        self._index = 0
+    
+    def random(self) -> float:
+        """Uniform float in [0, 1)"""
+        if self._index >= self._size:
+            self._refill()
+        
+        value = self._pool[self._index]
+        self._index += 1
+        return value
+    
+    def uniform(self, low: float, high: float) -> float:
+        """Uniform float in [low, high)"""
+        return low + (high - low) * self.random()
+    
+    def randint(self, low: int, high: int) -> int:
+        """Uniform integer in [low, high], inclusive like random.randint"""
+        return low + int(self.random() * (high - low + 1))
+    
+    def choice(self, seq: Sequence[Any]) -> Any:
+        """Uniformly chosen element of a non-empty sequence"""
+        return seq[int(self.random() * len(seq))]
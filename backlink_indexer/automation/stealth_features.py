@@ -3,19 +3,102 @@ Advanced stealth and anti-detection measures
 """
 
 import asyncio
-import random
 import time
 import logging
-from typing import Dict, List, Optional, Any
+import weakref
+from typing import Dict, List, Optional, Any, Tuple
+import numpy as np
 from selenium.webdriver.common.action_chains import ActionChains
 from selenium.webdriver.common.keys import Keys
+from .random_pool import RandomPool
+
+try:
+    from numba import njit
+except ImportError:  # Numba is optional; schedules fall back to vectorized NumPy
+    njit = None
+
+
+if njit is not None:
+    @njit(cache=True)
+    def _jit_keystroke_schedule(spaces, low, high, seed):
+        """Per-character delays and typo flags, compiled to a single native loop"""
+        np.random.seed(seed)
+        n = spaces.shape[0]
+        delays = np.empty(n)
+        typos = np.zeros(n, dtype=np.bool_)
+        
+        for i in range(n):
+            delay = np.random.uniform(low, high)
+            if np.random.random() < 0.1:
+                delay *= np.random.uniform(2.0, 4.0)
+            if spaces[i] and np.random.random() < 0.3:
+                delay += np.random.uniform(0.2, 1.0)
+            delays[i] = delay
+            typos[i] = i > 0 and np.random.random() < 0.05
+        
+        return delays, typos
+else:
+    _jit_keystroke_schedule = None
 
 
 class StealthFeatures:
     """Advanced anti-detection and human behavior simulation"""
     
+    # JavaScript that hides automation indicators
+    _ANTI_DETECTION_SCRIPTS = (
+        # Hide webdriver property
+        "Object.defineProperty(navigator, 'webdriver', {get: () => undefined})",
+        
+        # Override plugins
+        """
+        Object.defineProperty(navigator, 'plugins', {
+            get: () => [1, 2, 3, 4, 5].map(() => ({
+                0: {type: "application/x-google-chrome-pdf", suffixes: "pdf", description: "Portable Document Format"},
+                description: "Portable Document Format",
+                filename: "internal-pdf-viewer",
+                length: 1,
+                name: "Chrome PDF Plugin"
+            }))
+        });
+        """,
+        
+        # Override languages
+        "Object.defineProperty(navigator, 'languages', {get: () => ['en-US', 'en']});",
+        
+        # Override permissions
+        """
+        const originalQuery = window.navigator.permissions.query;
+        window.navigator.permissions.query = (parameters) => (
+            parameters.name === 'notifications' ?
+            Promise.resolve({ state: Notification.permission }) :
+            originalQuery(parameters)
+        );
+        """,
+        
+        # Override chrome runtime
+        "delete window.chrome.runtime.onConnect;",
+        "delete window.chrome.runtime.onMessage;",
+    )
+    
+    # Resolves each form field name to its element, trying
+    # input[name], textarea[name], #id and .class in that order
+    _FIELD_LOOKUP_JS = """
+        return arguments[0].map(function(name) {
+            var escaped = CSS.escape(name);
+            return document.querySelector('input[name="' + escaped + '"]') ||
+                document.querySelector('textarea[name="' + escaped + '"]') ||
+                document.querySelector('#' + escaped) ||
+                document.querySelector('.' + escaped);
+        });
+    """
+    
+    # Granularity of idle sleeps, in seconds
+    _IDLE_CHUNK = 0.1
+    
     def __init__(self, config):
         self.config = config
+        self._random = RandomPool()
+        self._stop_requested = False
         self.setup_logging()
         
         # Human behavior parameters
@@ -35,6 +118,20 @@ class StealthFeatures:
             'typing': (0.1, 0.5),
             'clicking': (0.2, 0.8)
         }
+        
+        # Inner viewport size per live driver
+        self._viewport_cache = weakref.WeakKeyDictionary()
+        
+        # Drivers that already run the anti-detection bundle on every new document
+        self._bundle_registered = weakref.WeakSet()
+        
+        # All anti-detection scripts as one payload; each runs in its own
+        # try block so a failing override doesn't abort the rest, and the
+        # failures come back as one list
+        self._stealth_bundle = "(function() { var errors = [];\n" + "\n".join(
+            f"try {{ (function() {{ {script} }})(); }} catch (e) {{ errors.push('{index}: ' + e); }}"
+            for index, script in enumerate(self._ANTI_DETECTION_SCRIPTS)
+        ) + "\nreturn errors; })()"
     
     def setup_logging(self):
         """Configure logging for stealth operations"""
@@ -53,8 +150,8 @@ class StealthFeatures:
         min_delay, max_delay = base_delays.get(action_type, base_delays['normal'])
         
         # Add natural variance
-        delay = random.uniform(min_delay, max_delay)
-        variance_factor = random.uniform(1 - variance, 1 + variance)
+        delay = self._random.uniform(min_delay, max_delay)
+        variance_factor = self._random.uniform(1 - variance, 1 + variance)
         final_delay = delay * variance_factor
         
         await asyncio.sleep(final_delay)
@@ -65,33 +162,83 @@ class StealthFeatures:
             return
         
         speed_range = self.typing_speeds.get(typing_style, self.typing_speeds['normal'])
+        delays, typos = self._keystroke_schedule(text, speed_range)
+        driver = getattr(element, 'parent', None)
+        # Input.insertText types into whatever has focus, so it is only used
+        # once the element is confirmed to be the focused one
+        use_cdp = self._focus(driver, element)
         
-        for i, char in enumerate(text):
-            # Variable typing speed
-            char_delay = random.uniform(*speed_range)
+        # Type the text in runs that end where a typo is due. Delays between
+        # two browser commands are accumulated and awaited as one sleep, so
+        # each run appears once its keystroke time has elapsed
+        pending_delay = 0.0
+        start = 0
+        for end in np.flatnonzero(typos).tolist() + [len(text)]:
+            if end > start:
+                pending_delay += float(delays[start:end].sum())
+                await asyncio.sleep(pending_delay)
+                pending_delay = 0.0
+                self._insert_text(driver, element, text[start:end], use_cdp)
             
-            # Occasional longer pauses (thinking)
-            if random.random() < 0.1:  # 10% chance
-                char_delay *= random.uniform(2, 4)
-            
-            # Occasional typos and corrections
-            if random.random() < 0.05 and i > 0:  # 5% chance of typo
+            if end < len(text):
                 # Type wrong character
-                wrong_char = chr(ord(char) + random.randint(-2, 2))
+                wrong_char = chr(ord(text[end]) + self._random.randint(-2, 2))
                 element.send_keys(wrong_char)
-                await asyncio.sleep(random.uniform(0.1, 0.3))
+                await asyncio.sleep(self._random.uniform(0.1, 0.3))
                 
                 # Backspace and correct
                 element.send_keys(Keys.BACKSPACE)
-                await asyncio.sleep(random.uniform(0.1, 0.5))
-            
-            # Type the actual character
-            element.send_keys(char)
-            await asyncio.sleep(char_delay)
+                pending_delay += self._random.uniform(0.1, 0.5)
             
-            # Occasional pauses within words
-            if char == ' ' and random.random() < 0.3:
-                await asyncio.sleep(random.uniform(0.2, 1.0))
+            start = end
+    
+    def _keystroke_schedule(self, text: str, speed_range: Tuple[float, float]) -> Tuple[np.ndarray, np.ndarray]:
+        """Draw per-character delays and typo positions for a text in one pass"""
+        n = len(text)
+        spaces = np.frombuffer(text.encode('utf-32-le'), dtype=np.uint32) == ord(' ')
+        
+        if _jit_keystroke_schedule is not None:
+            return _jit_keystroke_schedule(
+                spaces, speed_range[0], speed_range[1], self._random.randint(0, 2**32 - 1)
+            )
+        
+        # Variable typing speed with occasional longer pauses (thinking)
+        delays = np.random.uniform(speed_range[0], speed_range[1], n)
+        long_pauses = np.random.random(n) < 0.1  # 10% chance
+        delays[long_pauses] *= np.random.uniform(2, 4, int(long_pauses.sum()))
+        
+        # Occasional pauses within words
+        word_pauses = spaces & (np.random.random(n) < 0.3)
+        delays[word_pauses] += np.random.uniform(0.2, 1.0, int(word_pauses.sum()))
+        
+        # Occasional typos and corrections, never on the first character
+        typos = np.random.random(n) < 0.05  # 5% chance of typo
+        typos[0] = False
+        
+        return delays, typos
+    
+    def _focus(self, driver, element) -> bool:
+        """Focus element and report whether it now holds the document's focus"""
+        if not hasattr(driver, 'execute_cdp_cmd'):
+            return False
+        try:
+            return bool(driver.execute_script(
+                "arguments[0].focus(); return document.activeElement === arguments[0];", element
+            ))
+        except Exception as e:
+            self.logger.debug(f"Could not focus element, using send_keys: {str(e)}")
+            return False
+    
+    def _insert_text(self, driver, element, text: str, use_cdp: bool):
+        """Insert a run of text into the focused element with one browser command"""
+        if use_cdp:
+            try:
+                driver.execute_cdp_cmd("Input.insertText", {"text": text})
+                return
+            except Exception as e:
+                self.logger.debug(f"CDP text insertion failed, using send_keys: {str(e)}")
+        
+        element.send_keys(text)
     
     async def simulate_mouse_movement(self, driver, target_element=None):
         """Simulate natural mouse movements"""
@@ -117,12 +264,12 @@ class StealthFeatures:
             # In real implementation, you'd track actual mouse position
             
             # Add slight offset and curve to movement
-            offset_x = random.randint(-5, 5)
-            offset_y = random.randint(-5, 5)
+            offset_x = self._random.randint(-5, 5)
+            offset_y = self._random.randint(-5, 5)
             
             # Move with slight pause
             actions.move_to_element_with_offset(element, offset_x, offset_y)
-            await asyncio.sleep(random.uniform(0.1, 0.3))
+            await asyncio.sleep(self._random.uniform(0.1, 0.3))
             
         except Exception as e:
             self.logger.debug(f"Natural mouse movement failed: {str(e)}")
@@ -130,25 +277,31 @@ class StealthFeatures:
     async def _random_mouse_movement(self, actions, driver):
         """Perform random mouse movements for realism"""
         try:
-            # Get viewport size
-            viewport_width = driver.execute_script("return window.innerWidth;")
-            viewport_height = driver.execute_script("return window.innerHeight;")
+            viewport_width, viewport_height = self._get_viewport_size(driver)
             
             # Random movement within viewport
-            x = random.randint(50, viewport_width - 50)
-            y = random.randint(50, viewport_height - 50)
+            x = self._random.randint(50, viewport_width - 50)
+            y = self._random.randint(50, viewport_height - 50)
             
             actions.move_by_offset(x, y)
-            await asyncio.sleep(random.uniform(0.1, 0.5))
+            await asyncio.sleep(self._random.uniform(0.1, 0.5))
             
         except Exception as e:
             self.logger.debug(f"Random mouse movement failed: {str(e)}")
     
+    def _get_viewport_size(self, driver) -> Tuple[int, int]:
+        """Get the driver's inner viewport size, querying the page only once per window size"""
+        size = self._viewport_cache.get(driver)
+        if size is None:
+            width, height = driver.execute_script("return [window.innerWidth, window.innerHeight];")
+            size = self._viewport_cache[driver] = (width, height)
+        return size
+    
     async def simulate_reading_behavior(self, driver, element=None):
         """Simulate natural reading patterns with scrolling"""
         try:
             # Simulate reading by scrolling
-            scroll_pause_time = random.uniform(1.0, 3.0)
+            scroll_pause_time = self._random.uniform(1.0, 3.0)
             
             if element:
                 # Scroll to element and read
@@ -156,15 +309,15 @@ class StealthFeatures:
                 await asyncio.sleep(scroll_pause_time)
             else:
                 # Random scrolling behavior
-                scroll_distance = random.randint(100, 500)
+                scroll_distance = self._random.randint(100, 500)
                 driver.execute_script(f"window.scrollBy(0, {scroll_distance});")
                 await asyncio.sleep(scroll_pause_time)
                 
                 # Occasional scroll back up
-                if random.random() < 0.3:
-                    scroll_back = random.randint(50, 200)
+                if self._random.random() < 0.3:
+                    scroll_back = self._random.randint(50, 200)
                     driver.execute_script(f"window.scrollBy(0, -{scroll_back});")
-                    await asyncio.sleep(random.uniform(0.5, 1.5))
+                    await asyncio.sleep(self._random.uniform(0.5, 1.5))
             
         except Exception as e:
             self.logger.debug(f"Reading simulation failed: {str(e)}")
@@ -172,35 +325,25 @@ class StealthFeatures:
     async def simulate_form_interaction(self, driver, form_data: Dict[str, str]):
         """Simulate realistic form filling behavior"""
         try:
-            for field_name, value in form_data.items():
-                # Find form field
-                field_selectors = [
-                    f"input[name='{field_name}']",
-                    f"textarea[name='{field_name}']",
-                    f"#{field_name}",
-                    f".{field_name}"
-                ]
-                
-                field_element = None
-                for selector in field_selectors:
-                    try:
-                        field_element = driver.find_element("css selector", selector)
-                        break
-                    except:
-                        continue
+            # Resolve every field in one round-trip
+            field_names = list(form_data)
+            field_elements = driver.execute_script(self._FIELD_LOOKUP_JS, field_names) or []
+            
+            for field_name, field_element in zip(field_names, field_elements):
+                value = form_data[field_name]
                 
                 if not field_element:
                     continue
                 
                 # Simulate clicking on field
                 await self.simulate_mouse_movement(driver, field_element)
-                await asyncio.sleep(random.uniform(0.2, 0.8))
+                await asyncio.sleep(self._random.uniform(0.2, 0.8))
                 field_element.click()
                 
                 # Clear field if needed
                 if field_element.get_attribute('value'):
                     field_element.clear()
-                    await asyncio.sleep(random.uniform(0.1, 0.3))
+                    await asyncio.sleep(self._random.uniform(0.1, 0.3))
                 
                 # Human-like typing
                 await self.simulate_human_typing(field_element, value)
@@ -212,47 +355,27 @@ class StealthFeatures:
             self.logger.error(f"Form interaction simulation failed: {str(e)}")
     
     def inject_anti_detection_scripts(self, driver):
-        """Inject JavaScript to hide automation indicators"""
-        scripts = [
-            # Hide webdriver property
-            "Object.defineProperty(navigator, 'webdriver', {get: () => undefined})",
-            
-            # Override plugins
-            """
-            Object.defineProperty(navigator, 'plugins', {
-                get: () => [1, 2, 3, 4, 5].map(() => ({
-                    0: {type: "application/x-google-chrome-pdf", suffixes: "pdf", description: "Portable Document Format"},
-                    description: "Portable Document Format",
-                    filename: "internal-pdf-viewer",
-                    length: 1,
-                    name: "Chrome PDF Plugin"
-                }))
-            });
-            """,
-            
-            # Override languages
-            "Object.defineProperty(navigator, 'languages', {get: () => ['en-US', 'en']});",
-            
-            # Override permissions
-            """
-            const originalQuery = window.navigator.permissions.query;
-            window.navigator.permissions.query = (parameters) => (
-                parameters.name === 'notifications' ?
-                Promise.resolve({ state: Notification.permission }) :
-                originalQuery(parameters)
-            );
-            """,
-            
-            # Override chrome runtime
-            "delete window.chrome.runtime.onConnect;",
-            "delete window.chrome.runtime.onMessage;",
-        ]
-        
-        for script in scripts:
+        """Apply the anti-detection bundle to the current page and every page after it"""
+        # Each registration persists for the driver's lifetime, so register
+        # once; later calls only need to cover the current document
+        if driver not in self._bundle_registered:
             try:
-                driver.execute_script(script)
+                driver.execute_cdp_cmd(
+                    "Page.addScriptToEvaluateOnNewDocument",
+                    {"source": self._stealth_bundle}
+                )
+                self._bundle_registered.add(driver)
             except Exception as e:
-                self.logger.debug(f"Failed to inject script: {str(e)}")
+                self.logger.debug(f"Failed to register anti-detection bundle: {str(e)}")
+        
+        try:
+            errors = driver.execute_script(f"return {self._stealth_bundle};")
+        except Exception as e:
+            self.logger.debug(f"Failed to inject anti-detection bundle: {str(e)}")
+            return
+        
+        if errors:
+            self.logger.debug(f"Anti-detection scripts failed: {'; '.join(errors)}")
     
     def randomize_viewport(self, driver):
         """Randomize browser viewport for fingerprint variation"""
@@ -263,14 +386,17 @@ class StealthFeatures:
                 (1600, 900), (1280, 720), (1680, 1050)
             ]
             
-            width, height = random.choice(viewports)
+            width, height = self._random.choice(viewports)
             
             # Add slight variance
-            width += random.randint(-50, 50)
-            height += random.randint(-50, 50)
+            width += self._random.randint(-50, 50)
+            height += self._random.randint(-50, 50)
             
             driver.set_window_size(width, height)
             
+            # The inner viewport changed; re-measure on next use
+            self._viewport_cache.pop(driver, None)
+            
         except Exception as e:
             self.logger.debug(f"Viewport randomization failed: {str(e)}")
     
@@ -278,16 +404,16 @@ class StealthFeatures:
         """Simulate natural tab and window behavior"""
         try:
             # Occasionally open new tab and close it
-            if random.random() < 0.1:  # 10% chance
+            if self._random.random() < 0.1:  # 10% chance
                 # Open new tab
                 driver.execute_script("window.open('about:blank', '_blank');")
-                await asyncio.sleep(random.uniform(1.0, 3.0))
+                await asyncio.sleep(self._random.uniform(1.0, 3.0))
                 
                 # Switch to new tab
                 tabs = driver.window_handles
                 if len(tabs) > 1:
                     driver.switch_to.window(tabs[-1])
-                    await asyncio.sleep(random.uniform(0.5, 2.0))
+                    await asyncio.sleep(self._random.uniform(0.5, 2.0))
                     
                     # Close tab and return to original
                     driver.close()
@@ -296,11 +422,30 @@ class StealthFeatures:
         except Exception as e:
             self.logger.debug(f"Tab behavior simulation failed: {str(e)}")
     
-    async def simulate_idle_time(self, min_idle: float = 5.0, max_idle: float = 30.0):
-        """Simulate periods of user inactivity"""
-        idle_time = random.uniform(min_idle, max_idle)
+    async def simulate_idle_time(self, min_idle: float = 5.0, max_idle: float = 30.0) -> bool:
+        """Simulate periods of user inactivity; False when request_stop() cut it short"""
+        if self._stop_requested:
+            return False
+        
+        idle_time = self._random.uniform(min_idle, max_idle)
         self.logger.debug(f"Simulating idle time: {idle_time:.2f} seconds")
-        await asyncio.sleep(idle_time)
+        
+        # Sleep in short chunks so request_stop() ends the idle period promptly
+        chunks, remainder = divmod(idle_time, self._IDLE_CHUNK)
+        for _ in range(int(chunks)):
+            await asyncio.sleep(self._IDLE_CHUNK)
+            if self._stop_requested:
+                return False
+        await asyncio.sleep(remainder)
+        return not self._stop_requested
+    
+    def request_stop(self):
+        """Ask idle simulations to return early; the stop holds until resume()"""
+        self._stop_requested = True
+    
+    def resume(self):
+        """Clear a requested stop when a new run begins"""
+        self._stop_requested = False
     
     def get_behavioral_stats(self) -> Dict[str, Any]:
         """Get statistics about behavioral patterns"""
@@ -308,5 +453,5 @@ class StealthFeatures:
             'available_typing_styles': list(self.typing_speeds.keys()),
             'mouse_patterns': self.mouse_patterns,
             'pause_patterns': list(self.pause_patterns.keys()),
-            'anti_detection_scripts': 5  # Number of scripts available
+            'anti_detection_scripts': len(self._ANTI_DETECTION_SCRIPTS)
         }
\ No newline at end of file
@@ -2,86 +2,201 @@
 User-agent rotation and browser fingerprint randomization
 """
 
-import random
+import re
 import logging
+from functools import cached_property
+from secrets import token_hex
 from typing import List, Dict, Optional
+import numpy as np
 from fake_useragent import UserAgent
+from .random_pool import RandomPool
+
+
+# Version patterns for user-agent parsing
+_CHROME_VERSION_RE = re.compile(r'Chrome/(\d+\.\d+\.\d+\.\d+)')
+_FIREFOX_VERSION_RE = re.compile(r'Firefox/(\d+\.\d+)')
+_SAFARI_VERSION_RE = re.compile(r'Version/(\d+\.\d+)')
+
+# Pre-defined user agent pools for different browser types
+_BROWSER_POOLS = {
+    'chrome': (
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+        "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+        "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/119.0.0.0 Safari/537.36",
+        "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/119.0.0.0 Safari/537.36"
+    ),
+    'firefox': (
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:109.0) Gecko/20100101 Firefox/121.0",
+        "Mozilla/5.0 (Macintosh; Intel Mac OS X 10.15; rv:109.0) Gecko/20100101 Firefox/121.0",
+        "Mozilla/5.0 (X11; Linux x86_64; rv:109.0) Gecko/20100101 Firefox/121.0",
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:109.0) Gecko/20100101 Firefox/120.0",
+        "Mozilla/5.0 (Macintosh; Intel Mac OS X 10.15; rv:109.0) Gecko/20100101 Firefox/120.0"
+    ),
+    'safari': (
+        "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.1 Safari/605.1.15",
+        "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.0 Safari/605.1.15",
+        "Mozilla/5.0 (iPhone; CPU iPhone OS 17_1 like Mac OS X) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.1 Mobile/15E148 Safari/604.1",
+        "Mozilla/5.0 (iPad; CPU OS 17_1 like Mac OS X) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.1 Mobile/15E148 Safari/604.1"
+    )
+}
+
+# Screen resolutions for fingerprint variation
+_SCREEN_RESOLUTIONS = (
+    (1920, 1080), (1366, 768), (1440, 900), (1536, 864),
+    (1600, 900), (1280, 720), (1920, 1200), (2560, 1440),
+    (1680, 1050), (1280, 1024), (1024, 768)
+)
+
+# Language preferences
+_LANGUAGES = (
+    'en-US,en;q=0.9',
+    'en-GB,en;q=0.9',
+    'en-CA,en;q=0.9',
+    'en-AU,en;q=0.9',
+    'en-US,en;q=0.9,es;q=0.8',
+    'en-US,en;q=0.9,fr;q=0.8'
+)
+
+# Time zones
+_TIMEZONES = (
+    'America/New_York',
+    'America/Los_Angeles',
+    'America/Chicago',
+    'Europe/London',
+    'Europe/Paris',
+    'America/Toronto',
+    'Australia/Sydney',
+    'America/Denver'
+)
+
+
+def _parse_user_agent_string(user_agent: str) -> Dict[str, str]:
+    """Parse user agent string to extract browser info"""
+    browser_info = {
+        'browser': 'Chrome',
+        'version': '120.0.0.0',
+        'platform': 'Windows'
+    }
+    
+    if 'Chrome' in user_agent:
+        browser_info['browser'] = 'Chrome'
+        # Extract Chrome version
+        match = _CHROME_VERSION_RE.search(user_agent)
+        if match:
+            browser_info['version'] = match.group(1)
+    elif 'Firefox' in user_agent:
+        browser_info['browser'] = 'Firefox'
+        match = _FIREFOX_VERSION_RE.search(user_agent)
+        if match:
+            browser_info['version'] = match.group(1)
+    elif 'Safari' in user_agent:
+        browser_info['browser'] = 'Safari'
+        match = _SAFARI_VERSION_RE.search(user_agent)
+        if match:
+            browser_info['version'] = match.group(1)
+    
+    # Extract platform
+    if 'Windows' in user_agent:
+        browser_info['platform'] = 'Windows'
+    elif 'Macintosh' in user_agent or 'Mac OS X' in user_agent:
+        browser_info['platform'] = 'macOS'
+    elif 'Linux' in user_agent:
+        browser_info['platform'] = 'Linux'
+    elif 'iPhone' in user_agent:
+        browser_info['platform'] = 'iOS'
+    elif 'Android' in user_agent:
+        browser_info['platform'] = 'Android'
+    
+    return browser_info
+
+
+# Every pooled user agent, for uniform selection across browsers
+_UNION_POOL = tuple(ua for pool in _BROWSER_POOLS.values() for ua in pool)
+
+# Browser info for every pooled user agent, parsed once at import
+_UA_META = {
+    ua: _parse_user_agent_string(ua)
+    for pool in _BROWSER_POOLS.values()
+    for ua in pool
+}
 
 
 class UserAgentRotator:
     """Advanced user-agent rotation and browser fingerprint management"""
     
+    # Mobile user agents for get_mobile_user_agent
+    _MOBILE_AGENTS = (
+        "Mozilla/5.0 (iPhone; CPU iPhone OS 17_1 like Mac OS X) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.1 Mobile/15E148 Safari/604.1",
+        "Mozilla/5.0 (iPad; CPU OS 17_1 like Mac OS X) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.1 Mobile/15E148 Safari/604.1",
+        "Mozilla/5.0 (Linux; Android 13; SM-G998B) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Mobile Safari/537.36",
+        "Mozilla/5.0 (Linux; Android 13; Pixel 7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Mobile Safari/537.36"
+    )
+    
+    # Hardware attributes for fingerprint variation
+    _COLOR_DEPTHS = (24, 32)
+    _PIXEL_RATIOS = (1, 1.25, 1.5, 2)
+    _HARDWARE_CONCURRENCY = (2, 4, 6, 8, 12, 16)
+    _DEVICE_MEMORY = (2, 4, 8, 16, 32)
+    
+    # WebGL vendors per browser and renderers
+    _WEBGL_VENDORS = {
+        'Chrome': ('Google Inc.', 'Google Inc. (NVIDIA)', 'Google Inc. (Intel)', 'Google Inc. (AMD)'),
+        'Firefox': ('Mozilla', 'Mozilla (NVIDIA)', 'Mozilla (Intel)', 'Mozilla (AMD)'),
+        'Safari': ('Apple Inc.', 'Apple Inc. (Intel)', 'Apple Inc. (AMD)')
+    }
+    _WEBGL_RENDERERS = (
+        'ANGLE (Intel, Intel(R) HD Graphics 620 Direct3D11 vs_5_0 ps_5_0, D3D11)',
+        'ANGLE (NVIDIA, NVIDIA GeForce GTX 1060 Direct3D11 vs_5_0 ps_5_0, D3D11)',
+        'ANGLE (AMD, AMD Radeon RX 580 Direct3D11 vs_5_0 ps_5_0, D3D11)',
+        'Intel Iris OpenGL Engine',
+        'AMD Radeon Pro 560X OpenGL Engine',
+        'NVIDIA GeForce GTX 1080 OpenGL Engine'
+    )
+    
+    # Fixed pools shared by every rotator
+    browser_pools = _BROWSER_POOLS
+    screen_resolutions = _SCREEN_RESOLUTIONS
+    languages = _LANGUAGES
+    timezones = _TIMEZONES
+    _ua_meta = _UA_META
+    
     def __init__(self, config):
         self.config = config
-        self.user_agent = UserAgent()
         self.rotation_counter = 0
         self.current_ua_index = 0
+        self._random = RandomPool()
+        self._generator = np.random.default_rng()
         self.setup_logging()
         
-        # Pre-defined user agent pools for different browser types
-        self.browser_pools = {
-            'chrome': [
-                "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-                "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-                "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-                "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/119.0.0.0 Safari/537.36",
-                "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/119.0.0.0 Safari/537.36"
-            ],
-            'firefox': [
-                "Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:109.0) Gecko/20100101 Firefox/121.0",
-                "Mozilla/5.0 (Macintosh; Intel Mac OS X 10.15; rv:109.0) Gecko/20100101 Firefox/121.0",
-                "Mozilla/5.0 (X11; Linux x86_64; rv:109.0) Gecko/20100101 Firefox/121.0",
-                "Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:109.0) Gecko/20100101 Firefox/120.0",
-                "Mozilla/5.0 (Macintosh; Intel Mac OS X 10.15; rv:109.0) Gecko/20100101 Firefox/120.0"
-            ],
-            'safari': [
-                "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.1 Safari/605.1.15",
-                "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.0 Safari/605.1.15",
-                "Mozilla/5.0 (iPhone; CPU iPhone OS 17_1 like Mac OS X) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.1 Mobile/15E148 Safari/604.1",
-                "Mozilla/5.0 (iPad; CPU OS 17_1 like Mac OS X) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.1 Mobile/15E148 Safari/604.1"
-            ]
-        }
-        
-        # Screen resolutions for fingerprint variation
-        self.screen_resolutions = [
-            (1920, 1080), (1366, 768), (1440, 900), (1536, 864),
-            (1600, 900), (1280, 720), (1920, 1200), (2560, 1440),
-            (1680, 1050), (1280, 1024), (1024, 768)
-        ]
-        
-        # Language preferences
-        self.languages = [
-            'en-US,en;q=0.9',
-            'en-GB,en;q=0.9',
-            'en-CA,en;q=0.9',
-            'en-AU,en;q=0.9',
-            'en-US,en;q=0.9,es;q=0.8',
-            'en-US,en;q=0.9,fr;q=0.8'
-        ]
-        
-        # Time zones
-        self.timezones = [
-            'America/New_York',
-            'America/Los_Angeles', 
-            'America/Chicago',
-            'Europe/London',
-            'Europe/Paris',
-            'America/Toronto',
-            'Australia/Sydney',
-            'America/Denver'
-        ]
+        # Preshuffled cycle over all pooled agents for 'pooled' selection
+        self._cycle = list(_UNION_POOL)
+        self._generator.shuffle(self._cycle)
+        self._cycle_idx = 0
+    
+    @cached_property
+    def user_agent(self) -> UserAgent:
+        """fake_useragent dataset, loaded on first random selection"""
+        return UserAgent()
     
     def setup_logging(self):
         """Configure logging for user agent operations"""
         self.logger = logging.getLogger(f"{__name__}.UserAgentRotator")
     
     def get_random_user_agent(self, browser_type: str = 'random') -> str:
-        """Get a random user agent string"""
+        """
+        Get a random user agent string
+        'random' draws from the fake_useragent dataset; 'pooled' cycles
+        through the predefined pools; a browser name picks from that pool
+        """
+        if browser_type == 'pooled':
+            return self._next_pooled_agent()
+        
         try:
             # Check rotation interval
             if self.rotation_counter >= self.config.user_agent_rotation_interval:
                 self.rotation_counter = 0
-                self.current_ua_index = random.randint(0, 1000)  # Randomize selection
+                self.current_ua_index = self._random.randint(0, 1000)  # Randomize selection
             
             self.rotation_counter += 1
             
@@ -91,147 +206,137 @@ class UserAgentRotator:
                     return self.user_agent.random
                 except:
                     # Fallback to predefined pools
-                    browser_type = random.choice(['chrome', 'firefox', 'safari'])
+                    browser_type = self._random.choice(['chrome', 'firefox', 'safari'])
             
             if browser_type in self.browser_pools:
-                return random.choice(self.browser_pools[browser_type])
+                return self._random.choice(self.browser_pools[browser_type])
             
             # Ultimate fallback
             return self.browser_pools['chrome'][0]
-            
+        
         except Exception as e:
             self.logger.error(f"Error getting user agent: {str(e)}")
             return "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
     
+    def _next_pooled_agent(self) -> str:
+        """Next agent from the preshuffled cycle, reshuffled every rotation interval"""
+        if self.rotation_counter >= self.config.user_agent_rotation_interval:
+            self.rotation_counter = 0
+            self._generator.shuffle(self._cycle)
+        
+        self.rotation_counter += 1
+        user_agent = self._cycle[self._cycle_idx]
+        self._cycle_idx = (self._cycle_idx + 1) % len(self._cycle)
+        return user_agent
+    
     def generate_browser_fingerprint(self) -> Dict[str, any]:
         """Generate a complete browser fingerprint for anti-detection"""
-        user_agent = self.get_random_user_agent()
-        resolution = random.choice(self.screen_resolutions)
+        return self.generate_browser_fingerprints(1)[0]
+    
+    def generate_browser_fingerprints(self, n: int) -> List[Dict[str, any]]:
+        """Generate n browser fingerprints, drawing each attribute for the whole batch at once"""
+        if n <= 0:
+            return []
+        
+        def pick(options):
+            return [options[i] for i in self._generator.integers(0, len(options), n).tolist()]
+        
+        user_agents = self._draw_user_agents(n, pick)
+        resolutions = pick(self.screen_resolutions)
+        color_depths = pick(self._COLOR_DEPTHS)
+        pixel_ratios = pick(self._PIXEL_RATIOS)
+        languages = pick(self.languages)
+        timezones = pick(self.timezones)
+        renderers = pick(self._WEBGL_RENDERERS)
+        concurrency = pick(self._HARDWARE_CONCURRENCY)
+        memory = pick(self._DEVICE_MEMORY)
+        # Vendor pools differ in size per browser, so scale one uniform draw each
+        vendor_draws = self._generator.random(n).tolist()
+        # 16 hex characters per fingerprint, sliced from one token each
+        canvas = token_hex(8 * n)
+        audio = token_hex(8 * n)
+        
+        return [
+            self._build_fingerprint(
+                user_agent=user_agents[i],
+                resolution=resolutions[i],
+                color_depth=color_depths[i],
+                pixel_ratio=pixel_ratios[i],
+                language=languages[i],
+                timezone=timezones[i],
+                vendor_draw=vendor_draws[i],
+                webgl_renderer=renderers[i],
+                hardware_concurrency=concurrency[i],
+                device_memory=memory[i],
+                canvas_fingerprint=canvas[16 * i:16 * (i + 1)],
+                audio_fingerprint=audio[16 * i:16 * (i + 1)]
+            )
+            for i in range(n)
+        ]
+    
+    def _draw_user_agents(self, n: int, pick) -> List[str]:
+        """Draw n random user agents, advancing the rotation counter once for the batch"""
+        interval = max(1, self.config.user_agent_rotation_interval)
+        if self.rotation_counter + n > interval:
+            self.current_ua_index = self._random.randint(0, 1000)  # Randomize selection
+        self.rotation_counter = (self.rotation_counter + n - 1) % interval + 1
         
+        try:
+            # Use fake_useragent library for maximum variety
+            dataset = self.user_agent
+            return [dataset.random for _ in range(n)]
+        except Exception:
+            # Fallback to predefined pools
+            return pick(_UNION_POOL)
+    
+    def _build_fingerprint(self, user_agent: str, resolution, color_depth: int, pixel_ratio: float,
+                           language: str, timezone: str, vendor_draw: float, webgl_renderer: str,
+                           hardware_concurrency: int, device_memory: int, canvas_fingerprint: str,
+                           audio_fingerprint: str) -> Dict[str, any]:
+        """Assemble one fingerprint from pre-drawn attribute values"""
         # Extract browser info from user agent
         browser_info = self._parse_user_agent(user_agent)
+        width, height = resolution
+        vendors = self._WEBGL_VENDORS.get(browser_info['browser'], self._WEBGL_VENDORS['Chrome'])
         
-        fingerprint = {
+        return {
             'user_agent': user_agent,
             'viewport': {
-                'width': resolution[0],
-                'height': resolution[1]
+                'width': width,
+                'height': height
             },
             'screen': {
-                'width': resolution[0],
-                'height': resolution[1],
-                'color_depth': random.choice([24, 32]),
-                'pixel_ratio': random.choice([1, 1.25, 1.5, 2])
+                'width': width,
+                'height': height,
+                'color_depth': color_depth,
+                'pixel_ratio': pixel_ratio
             },
-            'language': random.choice(self.languages),
-            'timezone': random.choice(self.timezones),
+            'language': language,
+            'timezone': timezone,
             'platform': browser_info['platform'],
             'browser': {
                 'name': browser_info['browser'],
                 'version': browser_info['version']
             },
-            'webgl_vendor': self._get_webgl_vendor(browser_info['browser']),
-            'webgl_renderer': self._get_webgl_renderer(),
-            'hardware_concurrency': random.choice([2, 4, 6, 8, 12, 16]),
-            'device_memory': random.choice([2, 4, 8, 16, 32]),
-            'canvas_fingerprint': self._generate_canvas_fingerprint(),
-            'audio_fingerprint': self._generate_audio_fingerprint()
+            'webgl_vendor': vendors[int(vendor_draw * len(vendors))],
+            'webgl_renderer': webgl_renderer,
+            'hardware_concurrency': hardware_concurrency,
+            'device_memory': device_memory,
+            'canvas_fingerprint': canvas_fingerprint,
+            'audio_fingerprint': audio_fingerprint
         }
-        
-        return fingerprint
     
     def _parse_user_agent(self, user_agent: str) -> Dict[str, str]:
-        """Parse user agent string to extract browser info"""
-        browser_info = {
-            'browser': 'Chrome',
-            'version': '120.0.0.0',
-            'platform': 'Windows'
-        }
-        
-        if 'Chrome' in user_agent:
-            browser_info['browser'] = 'Chrome'
-            # Extract Chrome version
-            import re
-            match = re.search(r'Chrome/(\d+\.\d+\.\d+\.\d+)', user_agent)
-            if match:
-                browser_info['version'] = match.group(1)
-        elif 'Firefox' in user_agent:
-            browser_info['browser'] = 'Firefox'
-            match = re.search(r'Firefox/(\d+\.\d+)', user_agent)
-            if match:
-                browser_info['version'] = match.group(1)
-        elif 'Safari' in user_agent:
-            browser_info['browser'] = 'Safari'
-            match = re.search(r'Version/(\d+\.\d+)', user_agent)
-            if match:
-                browser_info['version'] = match.group(1)
-        
-        # Extract platform
-        if 'Windows' in user_agent:
-            browser_info['platform'] = 'Windows'
-        elif 'Macintosh' in user_agent or 'Mac OS X' in user_agent:
-            browser_info['platform'] = 'macOS'
-        elif 'Linux' in user_agent:
-            browser_info['platform'] = 'Linux'
-        elif 'iPhone' in user_agent:
-            browser_info['platform'] = 'iOS'
-        elif 'Android' in user_agent:
-            browser_info['platform'] = 'Android'
-        
-        return browser_info
-    
-    def _get_webgl_vendor(self, browser: str) -> str:
-        """Get appropriate WebGL vendor for browser"""
-        vendors = {
-            'Chrome': ['Google Inc.', 'Google Inc. (NVIDIA)', 'Google Inc. (Intel)', 'Google Inc. (AMD)'],
-            'Firefox': ['Mozilla', 'Mozilla (NVIDIA)', 'Mozilla (Intel)', 'Mozilla (AMD)'],
-            'Safari': ['Apple Inc.', 'Apple Inc. (Intel)', 'Apple Inc. (AMD)']
-        }
-        
-        return random.choice(vendors.get(browser, vendors['Chrome']))
-    
-    def _get_webgl_renderer(self) -> str:
-        """Get appropriate WebGL renderer"""
-        renderers = [
-            'ANGLE (Intel, Intel(R) HD Graphics 620 Direct3D11 vs_5_0 ps_5_0, D3D11)',
-            'ANGLE (NVIDIA, NVIDIA GeForce GTX 1060 Direct3D11 vs_5_0 ps_5_0, D3D11)',
-            'ANGLE (AMD, AMD Radeon RX 580 Direct3D11 vs_5_0 ps_5_0, D3D11)',
-            'Intel Iris OpenGL Engine',
-            'AMD Radeon Pro 560X OpenGL Engine',
-            'NVIDIA GeForce GTX 1080 OpenGL Engine'
-        ]
-        
-        return random.choice(renderers)
-    
-    def _generate_canvas_fingerprint(self) -> str:
-        """Generate a unique canvas fingerprint"""
-        # Simplified canvas fingerprint generation
-        import hashlib
-        
-        # Create a pseudo-unique fingerprint based on timestamp and randomness
-        fingerprint_data = f"{random.random()}_{random.randint(1000, 9999)}"
-        return hashlib.md5(fingerprint_data.encode()).hexdigest()[:16]
-    
-    def _generate_audio_fingerprint(self) -> str:
-        """Generate a unique audio context fingerprint"""
-        # Simplified audio fingerprint generation
-        import hashlib
-        
-        # Simulate audio context variations
-        sample_rate = random.choice([44100, 48000])
-        fingerprint_data = f"audio_{sample_rate}_{random.random()}"
-        return hashlib.md5(fingerprint_data.encode()).hexdigest()[:16]
+        """Look up browser info for a user agent, parsing unknown ones on demand"""
+        try:
+            return self._ua_meta[user_agent]
+        except KeyError:
+            # fake_useragent strings aren't in the pools
+            return _parse_user_agent_string(user_agent)
     
     def get_mobile_user_agent(self) -> str:
         """Get a mobile user agent string"""
-        mobile_agents = [
-            "Mozilla/5.0 (iPhone; CPU iPhone OS 17_1 like Mac OS X) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.1 Mobile/15E148 Safari/604.1",
-            "Mozilla/5.0 (iPad; CPU OS 17_1 like Mac OS X) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.1 Mobile/15E148 Safari/604.1",
-            "Mozilla/5.0 (Linux; Android 13; SM-G998B) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Mobile Safari/537.36",
-            "Mozilla/5.0 (Linux; Android 13; Pixel 7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Mobile Safari/537.36"
-        ]
-        
-        return random.choice(mobile_agents)
+        return self._random.choice(self._MOBILE_AGENTS)
     
     def get_stats(self) -> Dict[str, any]:
         """Get user agent rotation statistics"""
@@ -0,0 +1,62 @@
+"""
+Persistent Bloom filter for remembering already-indexed URLs
+"""
+
+import hashlib
+import math
+import struct
+from pathlib import Path
+from typing import Iterable
+
+_HEADER = struct.Struct('<QQ')  # bit count, hash count
+
+
+class BloomFilter:
+    """Fixed-size bit array probed with k double-hashed indices"""
+    
+    def __init__(self, capacity: int, error_rate: float = 1e-4):
+        capacity = max(1, capacity)
+        self.num_bits = max(8, int(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.num_hashes = max(1, round(self.num_bits / capacity * math.log(2)))
+        self._bits = bytearray((self.num_bits + 7) // 8)
+    
+    def _indices(self, item: str):
+        """Derive k bit positions from two 64-bit hashes as h1 + i*h2"""
+        digest = hashlib.blake2b(item.encode('utf-8'), digest_size=16).digest()
+        h1, h2 = struct.unpack('<QQ', digest)
+        # A zero step would collapse all k positions onto h1
+        h2 |= 1
+        return ((h1 + i * h2) % self.num_bits for i in range(self.num_hashes))
+    
+    def add(self, item: str):
+        """Add one item"""
+        bits = self._bits
+        for index in self._indices(item):
+            bits[index >> 3] |= 1 << (index & 7)
+    
+    def update(self, items: Iterable[str]):
+        """Add many items"""
+        for item in items:
+            self.add(item)
+    
+    def __contains__(self, item: str) -> bool:
+        bits = self._bits
+        return all(bits[index >> 3] & (1 << (index & 7)) for index in self._indices(item))
+    
+    def save(self, filepath: str):
+        """Write the filter to disk"""
+        Path(filepath).write_bytes(_HEADER.pack(self.num_bits, self.num_hashes) + bytes(self._bits))
+    
+    @classmethod
+    def load_or_create(cls, filepath: str, capacity: int, error_rate: float = 1e-4) -> 'BloomFilter':
+        """Load a saved filter of the same geometry, or start an empty one"""
+        bloom = cls(capacity, error_rate)
+        path = Path(filepath) if filepath else None
+        if path is None or not path.exists():
+            return bloom
+        
+        data = path.read_bytes()
+        if len(data) == _HEADER.size + len(bloom._bits):
+            if _HEADER.unpack_from(data) == (bloom.num_bits, bloom.num_hashes):
+                bloom._bits[:] = data[_HEADER.size:]
+        return bloom
@@ -3,10 +3,46 @@ Configuration management for the backlink indexing system
 """
 
 import os
-from dataclasses import dataclass, field
-from typing import Dict, Any, List, Tuple
+import json
+from functools import lru_cache
+from dataclasses import dataclass, field, fields, asdict
+from enum import IntEnum, IntFlag
+from typing import Dict, Any, List, Set, Tuple
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; stdlib json is the fallback
+    orjson = None
+
+
+@lru_cache(maxsize=1)
+def _read_env_settings() -> Dict[str, Any]:
+    """
+    Parse environment settings once per process
+    Call _read_env_settings.cache_clear() after changing the environment
+    """
+    env = os.environ
+    settings = {
+        'max_concurrent_browsers': int(env.get('MAX_CONCURRENT_BROWSERS', '10')),
+        'headless_mode': env.get('HEADLESS_MODE', 'true').lower() == 'true',
+        'enable_proxy_rotation': env.get('ENABLE_PROXY_ROTATION', 'true').lower() == 'true',
+        'success_threshold': float(env.get('SUCCESS_THRESHOLD', '0.95')),
+        'proxy_pool': ()
+    }
+    
+    # Load proxy pool from environment or file
+    proxy_list = env.get('PROXY_LIST', '')
+    proxy_file = Path('proxies.txt')
+    if proxy_list:
+        settings['proxy_pool'] = tuple(proxy_list.split(','))
+    elif proxy_file.exists():
+        settings['proxy_pool'] = tuple(
+            line.strip() for line in proxy_file.read_text().splitlines() if line.strip()
+        )
+    
+    return settings
+
 
 @dataclass
 class IndexingConfig:
@@ -29,6 +65,8 @@ class IndexingConfig:
     proxy_rotation_interval: int = 50  # requests
     user_agent_rotation_interval: int = 25
     proxy_pool: List[str] = field(default_factory=list)
+    max_proxy_workers: int = 200  # concurrent proxy validation probes
+    geoip_db_path: str = ""  # MaxMind .mmdb used to classify proxies by country
     
     # Indexing method settings
     social_bookmarking_enabled: bool = True
@@ -40,11 +78,26 @@ class IndexingConfig:
     
     # Performance settings
     batch_size: int = 100
+    batch_concurrency: int = 5  # URLs in flight per engine batch
+    max_concurrent_submissions: int = 5  # directory submissions in flight per URL
+    require_js_rendering: bool = False  # analyze sites in a browser instead of a plain fetch
+    min_authority_score: int = 0  # directory platforms below this authority are never used
+    max_http_connections: int = 100  # shared HTTP connection pool size
+    max_http_connections_per_host: int = 10
+    http_timeout: float = 30.0  # total seconds per pooled HTTP request
+    initial_chunk_size: int = 64  # URLs per coordinator chunk, adapted at runtime
+    max_chunk_size: int = 1024
+    max_concurrent_chunks: int = 2
+    chunk_url_latency_target: float = 10.0  # seconds per URL before chunks stop growing
+    verification_timeout: float = 60.0  # total seconds of SERP checks per URL collection
     retry_attempts: int = 3
     success_threshold: float = 0.95  # 95% target success rate
     
     # Database settings
     database_path: str = "backlink_indexer.db"
+    indexed_urls_bloom_path: str = ""  # set a path to skip URLs indexed in earlier runs
+    bloom_capacity: int = 1_000_000
+    bloom_error_rate: float = 1e-4
     enable_analytics: bool = True
     
     # Platform-specific settings
@@ -78,66 +131,64 @@ class IndexingConfig:
     @classmethod
     def from_env(cls) -> 'IndexingConfig':
         """Create configuration from environment variables"""
-        config = cls()
-        
-        # Load basic settings from environment
-        config.max_concurrent_browsers = int(os.getenv('MAX_CONCURRENT_BROWSERS', '10'))
-        config.headless_mode = os.getenv('HEADLESS_MODE', 'true').lower() == 'true'
-        config.enable_proxy_rotation = os.getenv('ENABLE_PROXY_ROTATION', 'true').lower() == 'true'
-        config.success_threshold = float(os.getenv('SUCCESS_THRESHOLD', '0.95'))
-        
-        # Load proxy pool from environment or file
-        proxy_list = os.getenv('PROXY_LIST', '')
-        if proxy_list:
-            config.proxy_pool = proxy_list.split(',')
-        elif os.path.exists('proxies.txt'):
-            with open('proxies.txt', 'r') as f:
-                config.proxy_pool = [line.strip() for line in f if line.strip()]
-        
-        return config
+        settings = dict(_read_env_settings())
+        # Every config gets its own proxy list
+        settings['proxy_pool'] = list(settings['proxy_pool'])
+        return cls(**settings)
     
     def save_to_file(self, filepath: str):
         """Save configuration to JSON file"""
-        import json
+        config_dict = asdict(self)
         
-        # Convert to dict, handling non-serializable types
-        config_dict = {}
-        for key, value in self.__dict__.items():
-            if isinstance(value, tuple):
-                config_dict[key] = list(value)
-            else:
-                config_dict[key] = value
-        
-        with open(filepath, 'w') as f:
-            json.dump(config_dict, f, indent=2)
+        if orjson is not None:
+            Path(filepath).write_bytes(orjson.dumps(config_dict, option=orjson.OPT_INDENT_2))
+        else:
+            Path(filepath).write_text(json.dumps(config_dict, indent=2))
     
     @classmethod
     def load_from_file(cls, filepath: str) -> 'IndexingConfig':
         """Load configuration from JSON file"""
-        import json
+        if orjson is not None:
+            config_dict = orjson.loads(Path(filepath).read_bytes())
+        else:
+            config_dict = json.loads(Path(filepath).read_text())
         
-        with open(filepath, 'r') as f:
-            config_dict = json.load(f)
+        # Build the config in one construction rather than field-by-field
+        names = {f.name for f in fields(cls)}
+        settings = {key: value for key, value in config_dict.items() if key in names}
         
-        config = cls()
-        for key, value in config_dict.items():
-            if hasattr(config, key):
-                # Convert lists back to tuples where needed
-                if key == 'human_typing_speed_range' and isinstance(value, list):
-                    setattr(config, key, tuple(value))
-                else:
-                    setattr(config, key, value)
+        # Convert lists back to tuples where needed
+        if isinstance(settings.get('human_typing_speed_range'), list):
+            settings['human_typing_speed_range'] = tuple(settings['human_typing_speed_range'])
         
-        return config
+        return cls(**settings)
+
+
+class URLStatus(IntEnum):
+    """Indexing status of a URL record"""
+    PENDING = 0
+    FAILED = 1
+    PARTIAL_SUCCESS = 2
+    SUCCESS = 3
+
+
+class MethodFlag(IntFlag):
+    """Bit per indexing method, for cheap sets of methods"""
+    SOCIAL_BOOKMARKING = 1
+    RSS_DISTRIBUTION = 2
+    WEB2_POSTING = 4
+    FORUM_COMMENTING = 8
+    DIRECTORY_SUBMISSION = 16
+    SOCIAL_SIGNALS = 32
 
 
-@dataclass 
+@dataclass(slots=True)
 class URLRecord:
     """Data model for tracking URL indexing status"""
     url: str
-    status: str = "pending"
-    methods_attempted: List[str] = field(default_factory=list)
-    methods_successful: List[str] = field(default_factory=list)
+    status: URLStatus = URLStatus.PENDING
+    methods_attempted: Set[str] = field(default_factory=set)
+    methods_successful: Set[str] = field(default_factory=set)
     attempts: int = 0
     last_attempt: str = ""  # ISO format datetime string
     indexed_date: str = ""  # ISO format datetime string
@@ -4,14 +4,42 @@ Main coordinator for the backlink indexing system
 
 import asyncio
 import logging
+import time
+import aiohttp
+from collections import Counter
+from dataclasses import asdict
 from datetime import datetime
-from typing import List, Dict, Any, Optional
-from .config import IndexingConfig, URLRecord, EXPECTED_SUCCESS_RATES
+from urllib.parse import urlsplit, urlunsplit
+from typing import List, Dict, Any, Optional, Sequence
+from .config import IndexingConfig, URLRecord, URLStatus, EXPECTED_SUCCESS_RATES
+from .logging_setup import install_queue_logging
 from ..automation.browser_manager import StealthBrowserManager
 from ..indexing_methods.social_bookmarking import SocialBookmarkingEngine
 from ..indexing_methods.rss_distribution import RSSDistributionEngine
 from ..indexing_methods.web2_posting import Web2PostingEngine
 
+# Python 3.12+: tasks that finish without blocking complete inline
+_eager_task_factory = getattr(asyncio, 'eager_task_factory', None)
+
+
+def _normalize_url(url: str) -> str:
+    """Canonical form used to spot duplicate submissions"""
+    try:
+        parts = urlsplit(url)
+    except ValueError:
+        return url
+    
+    # Only the scheme and host are case-insensitive; a different path (even
+    # just a trailing slash) may be a different resource
+    userinfo, at, host = parts.netloc.rpartition('@')
+    return urlunsplit((
+        parts.scheme.lower(),
+        userinfo + at + host.lower(),
+        parts.path,
+        parts.query,
+        parts.fragment
+    ))
+
 
 class BacklinkIndexingCoordinator:
     """
@@ -19,6 +47,9 @@ class BacklinkIndexingCoordinator:
     following the "Steal Like an Artist" multi-method approach
     """
     
+    # Floor for adaptive chunking so repeated failures can't stall progress
+    _MIN_CHUNK_SIZE = 8
+    
     def __init__(self, config: IndexingConfig):
         self.config = config
         self.browser_manager = StealthBrowserManager(config)
@@ -27,6 +58,13 @@ class BacklinkIndexingCoordinator:
         self.primary_methods = []
         self.secondary_methods = []
         
+        # URLs handed to the methods per chunk, adapted as chunks complete
+        self._chunk_size = config.initial_chunk_size
+        
+        # Pooled HTTP session shared by all engines, opened on first use
+        self.http_session = None
+        self._http_loop = None
+        
         self._setup_logging()
         self._setup_indexing_methods()
         
@@ -40,14 +78,7 @@ class BacklinkIndexingCoordinator:
     
     def _setup_logging(self):
         """Configure logging for the coordinator"""
-        logging.basicConfig(
-            level=logging.INFO,
-            format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-            handlers=[
-                logging.FileHandler('backlink_indexer.log'),
-                logging.StreamHandler()
-            ]
-        )
+        install_queue_logging()
         self.logger = logging.getLogger(f"{__name__}.Coordinator")
     
     def _setup_indexing_methods(self):
@@ -73,137 +104,240 @@ class BacklinkIndexingCoordinator:
         # if self.config.forum_commenting_enabled:
         #     self.secondary_methods.append(ForumCommentingEngine(...))
         
+        # Every method in dispatch order; rebuild if methods are added later
+        self._all_methods = tuple(self.primary_methods + self.secondary_methods)
+        
+        # Expected success rate per engine class, resolved once
+        self._rate_by_method = {}
+        for method in self._all_methods:
+            method_name = method.__class__.__name__
+            rate_key = method_name.lower().replace('engine', '')
+            if rate_key in EXPECTED_SUCCESS_RATES:
+                self._rate_by_method[method_name] = EXPECTED_SUCCESS_RATES[rate_key]
+        
         self.logger.info(f"Initialized {len(self.primary_methods)} primary methods "
                         f"and {len(self.secondary_methods)} secondary methods")
     
-    async def process_url_collection(self, urls: List[str], metadata: Optional[Dict] = None) -> Dict[str, Any]:
+    async def process_url_collection(self, urls: List[str], metadata: Optional[Dict] = None,
+                                     include_records: bool = True) -> Dict[str, Any]:
         """
         Process a collection of URLs using multi-method approach
-        Returns comprehensive results with success rates and statistics
+        Returns comprehensive results with success rates and statistics;
+        large batches can pass include_records=False to skip the per-URL records
         """
+        if not urls:
+            empty_results = {
+                'total_urls': 0,
+                'successful_urls': 0,
+                'partial_success_urls': 0,
+                'failed_urls': 0,
+                'overall_success_rate': 0.0,
+                'method_performance': {},
+                'processing_timestamp': datetime.now().isoformat(),
+                'duplicate_urls': {}
+            }
+            if include_records:
+                empty_results['url_records'] = []
+            return empty_results
+        
         self.logger.info(f"Starting processing of {len(urls)} URLs")
         
-        url_records = [URLRecord(url=url) for url in urls]
+        # Submit each distinct URL once; duplicates map to the URL that was submitted
+        unique_urls = {}
+        duplicate_urls = {}
+        for url in urls:
+            key = _normalize_url(url)
+            if key in unique_urls:
+                duplicate_urls[url] = unique_urls[key]
+            else:
+                unique_urls[key] = url
+        
+        if duplicate_urls:
+            self.logger.info(f"Skipping {len(duplicate_urls)} duplicate URLs")
         
-        # Phase 1: Execute primary methods in parallel
-        primary_results = await self._execute_primary_methods(url_records)
+        url_records = [URLRecord(url=url) for url in unique_urls.values()]
+        self._ensure_http_session()
         
-        # Phase 2: Use secondary methods for failed URLs
-        failed_records = [record for record in url_records if record.success_score < self.config.success_threshold]
-        secondary_results = await self._execute_secondary_methods(failed_records)
+        # Phases 1 and 2: primary methods in parallel, then secondary methods
+        # on each chunk's failed URLs as soon as that chunk's primaries finish
+        if not self.primary_methods:
+            self.logger.warning("No primary methods enabled")
         
-        # Phase 3: Compile final results
-        final_results = self._compile_final_results(url_records)
+        self.logger.info(f"Executing {len(self.primary_methods)} primary methods "
+                        f"and {len(self.secondary_methods)} secondary methods")
+        await self._execute_in_chunks(url_records)
+        
+        # Phase 3: Compile final results; the per-record passes run on a
+        # worker thread so large collections don't stall the event loop
+        status_counts = await asyncio.to_thread(self._tally, url_records)
+        perf_by_method = {
+            method.__class__.__name__: method.get_performance_stats()
+            for method in self._all_methods
+        }
+        final_results = self._compile_final_results(url_records, status_counts, perf_by_method)
+        final_results['duplicate_urls'] = duplicate_urls
+        if include_records:
+            final_results['url_records'] = await asyncio.to_thread(self._serialize_records, url_records)
         
         # Update statistics
-        self._update_statistics(url_records)
+        self._update_statistics(url_records, status_counts, perf_by_method)
         
         self.logger.info(f"Processing completed. Success rate: {final_results['overall_success_rate']:.2%}")
         
         return final_results
     
-    async def _execute_primary_methods(self, url_records: List[URLRecord]) -> Dict[str, Any]:
-        """Execute all primary indexing methods in parallel"""
-        
-        if not self.primary_methods:
-            self.logger.warning("No primary methods enabled")
-            return {}
-        
-        self.logger.info(f"Executing {len(self.primary_methods)} primary methods")
-        
-        # Execute all primary methods concurrently
-        method_tasks = []
-        for method in self.primary_methods:
-            urls = [record.url for record in url_records]
-            task = method.process_batch(urls)
-            method_tasks.append(task)
+    def _ensure_http_session(self):
+        """Open the shared HTTP session for the running loop and hand it to every engine"""
+        loop = asyncio.get_running_loop()
+        if self.http_session is not None and not self.http_session.closed and self._http_loop is loop:
+            return
+        
+        # A session can't outlive the loop it was created on
+        connector = aiohttp.TCPConnector(
+            limit=self.config.max_http_connections,
+            limit_per_host=self.config.max_http_connections_per_host,
+            ttl_dns_cache=300,
+            keepalive_timeout=60
+        )
+        self.http_session = aiohttp.ClientSession(connector=connector)
+        self._http_loop = loop
         
-        # Wait for all methods to complete
-        method_results = await asyncio.gather(*method_tasks, return_exceptions=True)
+        for method in self._all_methods:
+            method.http_session = self.http_session
+    
+    async def _execute_in_chunks(self, url_records: List[URLRecord]):
+        """Pipeline records through the methods in chunks, a bounded number at a time"""
+        semaphore = asyncio.Semaphore(self.config.max_concurrent_chunks)
+        chunk_tasks = []
+        start = 0
+        
+        while start < len(url_records):
+            await semaphore.acquire()
+            # Sized at dispatch time so each chunk sees the latest adaptation
+            chunk = url_records[start:start + self._chunk_size]
+            start += len(chunk)
+            chunk_tasks.append(self._start_task(self._process_chunk(chunk, semaphore)))
+        
+        await asyncio.gather(*chunk_tasks)
+    
+    async def _process_chunk(self, chunk: List[URLRecord], semaphore: asyncio.Semaphore):
+        """Run the primary methods on one chunk, then the secondary methods on its failures"""
+        started = time.monotonic()
+        method_errors = 0
         
-        # Update URL records with results
-        for method_idx, results in enumerate(method_results):
-            if isinstance(results, Exception):
-                self.logger.error(f"Primary method {method_idx} failed: {results}")
-                continue
+        try:
+            method_errors += await self._run_methods(chunk, self.primary_methods, 'Primary')
             
-            method_name = self.primary_methods[method_idx].__class__.__name__
-            self._update_records_with_results(url_records, results, method_name)
-        
-        return {'primary_methods_completed': len(self.primary_methods)}
+            # No need to wait for other chunks before retrying this one's failures
+            if self.secondary_methods:
+                success_threshold = self.config.success_threshold
+                failed_records = [record for record in chunk if record.success_score < success_threshold]
+                if failed_records:
+                    self.logger.info(f"Executing secondary methods on {len(failed_records)} failed URLs")
+                    method_errors += await self._run_methods(failed_records, self.secondary_methods, 'Secondary')
+        finally:
+            semaphore.release()
+        
+        self._adapt_chunk_size(len(chunk), time.monotonic() - started, method_errors)
     
-    async def _execute_secondary_methods(self, failed_records: List[URLRecord]) -> Dict[str, Any]:
-        """Execute secondary methods on URLs that failed primary methods"""
-        
-        if not self.secondary_methods or not failed_records:
-            return {}
-        
-        self.logger.info(f"Executing secondary methods on {len(failed_records)} failed URLs")
+    async def _run_methods(self, url_records: List[URLRecord], methods: List, phase: str) -> int:
+        """Run methods concurrently on the records, folding results in as each finishes"""
+        method_errors = 0
         
-        # Execute secondary methods
-        method_tasks = []
-        for method in self.secondary_methods:
-            urls = [record.url for record in failed_records]
-            task = method.process_batch(urls)
-            method_tasks.append(task)
+        # One immutable snapshot shared by every concurrently running engine
+        urls = tuple(record.url for record in url_records)
+        tasks = [self._start_task(self._run_method(method, urls)) for method in methods]
         
-        method_results = await asyncio.gather(*method_tasks, return_exceptions=True)
-        
-        # Update records with secondary results
-        for method_idx, results in enumerate(method_results):
+        for next_done in asyncio.as_completed(tasks):
+            method, results = await next_done
+            method_name = method.__class__.__name__
+            
             if isinstance(results, Exception):
-                self.logger.error(f"Secondary method {method_idx} failed: {results}")
+                method_errors += 1
+                self.logger.error(f"{phase} method {method_name} failed: {results}")
                 continue
             
-            method_name = self.secondary_methods[method_idx].__class__.__name__
-            self._update_records_with_results(failed_records, results, method_name)
+            self._update_records_with_results(url_records, results, method_name)
         
-        return {'secondary_methods_completed': len(self.secondary_methods)}
+        return method_errors
+    
+    def _adapt_chunk_size(self, chunk_len: int, elapsed: float, method_errors: int):
+        """Halve the chunk size after failures, grow it while chunks stay fast"""
+        if method_errors:
+            self._chunk_size = max(self._MIN_CHUNK_SIZE, self._chunk_size // 2)
+        elif elapsed / chunk_len <= self.config.chunk_url_latency_target:
+            self._chunk_size = min(self.config.max_chunk_size, int(self._chunk_size * 1.5))
+    
+    def _start_task(self, coro) -> asyncio.Task:
+        """Start a task eagerly where supported, without changing the loop's task factory"""
+        loop = asyncio.get_running_loop()
+        if _eager_task_factory is not None:
+            return _eager_task_factory(loop, coro)
+        return loop.create_task(coro)
+    
+    async def _run_method(self, method, urls: Sequence[str]):
+        """Run one method's batch, returning the method with its results or exception"""
+        try:
+            return method, await method.process_batch(urls)
+        except Exception as e:
+            return method, e
     
     def _update_records_with_results(self, url_records: List[URLRecord], 
                                    method_results: List[Dict], method_name: str):
         """Update URL records with results from a specific method"""
         
+        # Index results by URL once; the first result for a URL wins
+        result_by_url = {}
+        for result in method_results:
+            result_by_url.setdefault(result['url'], result)
+        
+        success_credit = self._rate_by_method.get(method_name, 0.1)
+        success_threshold = self.config.success_threshold
+        # All records in a batch share the batch's completion time
+        now_iso = datetime.now().isoformat()
+        
         for record in url_records:
             # Find the result for this URL
-            url_result = next((r for r in method_results if r['url'] == record.url), None)
+            url_result = result_by_url.get(record.url)
             
             if url_result:
-                record.methods_attempted.append(method_name)
+                record.methods_attempted.add(method_name)
                 
                 if url_result.get('success', False):
-                    record.methods_successful.append(method_name)
-                    record.success_score += EXPECTED_SUCCESS_RATES.get(
-                        method_name.lower().replace('engine', ''), 0.1
-                    )
+                    record.methods_successful.add(method_name)
+                    record.success_score += success_credit
                 else:
                     error_msg = url_result.get('error', 'Unknown error')
                     record.error_messages.append(f"{method_name}: {error_msg}")
                 
                 record.attempts += 1
-                record.last_attempt = datetime.now().isoformat()
+                record.last_attempt = now_iso
                 
                 # Update status based on success score
-                if record.success_score >= self.config.success_threshold:
-                    record.status = "success"
-                    record.indexed_date = datetime.now().isoformat()
+                if record.success_score >= success_threshold:
+                    record.status = URLStatus.SUCCESS
+                    record.indexed_date = now_iso
                 elif record.success_score > 0:
-                    record.status = "partial_success"
+                    record.status = URLStatus.PARTIAL_SUCCESS
                 else:
-                    record.status = "failed"
+                    record.status = URLStatus.FAILED
     
-    def _compile_final_results(self, url_records: List[URLRecord]) -> Dict[str, Any]:
+    def _tally(self, url_records: List[URLRecord]) -> Counter:
+        """Count records per status in a single pass"""
+        return Counter(record.status for record in url_records)
+    
+    def _compile_final_results(self, url_records: List[URLRecord], status_counts: Counter,
+                               perf_by_method: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
         """Compile final results summary"""
         
         total_urls = len(url_records)
-        successful_urls = len([r for r in url_records if r.status == "success"])
-        partial_success = len([r for r in url_records if r.status == "partial_success"])
-        failed_urls = len([r for r in url_records if r.status == "failed"])
+        successful_urls = status_counts[URLStatus.SUCCESS]
+        partial_success = status_counts[URLStatus.PARTIAL_SUCCESS]
+        failed_urls = status_counts[URLStatus.FAILED]
         
         # Method-specific performance
         method_performance = {}
-        for method in self.primary_methods + self.secondary_methods:
-            stats = method.get_performance_stats()
+        for stats in perf_by_method.values():
             method_performance[stats['method']] = {
                 'success_rate': stats['success_rate'],
                 'total_attempts': stats['total_attempts'],
@@ -217,40 +351,49 @@ class BacklinkIndexingCoordinator:
             'failed_urls': failed_urls,
             'overall_success_rate': (successful_urls + partial_success) / total_urls if total_urls > 0 else 0,
             'method_performance': method_performance,
-            'url_records': [record.__dict__ for record in url_records],
             'processing_timestamp': datetime.now().isoformat()
         }
     
-    def _update_statistics(self, url_records: List[URLRecord]):
+    def _serialize_records(self, url_records: List[URLRecord]) -> List[Dict[str, Any]]:
+        """Per-URL records as plain dicts"""
+        serialized = []
+        for record in url_records:
+            record_dict = asdict(record)
+            # Statuses leave the coordinator as their lowercase names and
+            # method sets as sorted lists
+            record_dict['status'] = record.status.name.lower()
+            record_dict['methods_attempted'] = sorted(record.methods_attempted)
+            record_dict['methods_successful'] = sorted(record.methods_successful)
+            serialized.append(record_dict)
+        return serialized
+    
+    def _update_statistics(self, url_records: List[URLRecord], status_counts: Counter,
+                           perf_by_method: Dict[str, Dict[str, Any]]):
         """Update internal statistics"""
         
         self.stats['total_urls_processed'] += len(url_records)
-        self.stats['successful_urls'] += len([r for r in url_records if r.status == "success"])
-        self.stats['failed_urls'] += len([r for r in url_records if r.status == "failed"])
+        self.stats['successful_urls'] += status_counts[URLStatus.SUCCESS]
+        self.stats['failed_urls'] += status_counts[URLStatus.FAILED]
         
         # Update method performance stats
-        for method in self.primary_methods + self.secondary_methods:
-            method_name = method.__class__.__name__
-            method_stats = method.get_performance_stats()
-            self.stats['methods_performance'][method_name] = method_stats
+        self.stats['methods_performance'].update(perf_by_method)
     
     def get_performance_summary(self) -> Dict[str, Any]:
         """Get comprehensive performance summary"""
+        methods_performance = self.stats['methods_performance']
         
         return {
             'overall_stats': self.stats,
             'expected_vs_actual': {
                 method_name: {
-                    'expected_success_rate': EXPECTED_SUCCESS_RATES.get(
-                        method_name.lower().replace('engine', ''), 0.0
-                    ),
-                    'actual_success_rate': self.stats['methods_performance'].get(
-                        method_name, {}
-                    ).get('success_rate', 0.0)
+                    'expected_success_rate': self._rate_by_method.get(method_name, 0.0),
+                    'actual_success_rate': method_stats.get('success_rate', 0.0)
                 }
-                for method_name in self.stats['methods_performance'].keys()
+                for method_name, method_stats in methods_performance.items()
             },
-            'configuration': self.config.__dict__,
+            # Copied per call, so later config changes show up but callers
+            # can't mutate the live config through the summary
+            'configuration': dict(self.config.__dict__),
             'timestamp': datetime.now().isoformat()
         }
     
@@ -258,9 +401,16 @@ class BacklinkIndexingCoordinator:
         """Cleanup resources"""
         self.logger.info("Shutting down backlink indexing coordinator")
         
-        # Close browser manager resources
-        await self.browser_manager.shutdown()
+        # Tear down browsers and pooled HTTP connections concurrently; one
+        # failing teardown must not leak the others
+        teardowns = [self.browser_manager.shutdown()]
+        if self.http_session is not None and not self.http_session.closed:
+            teardowns.append(self.http_session.close())
+        
+        for result in await asyncio.gather(*teardowns, return_exceptions=True):
+            if isinstance(result, Exception):
+                self.logger.error(f"Error during shutdown: {result}")
         
-        # Log final statistics
+        # Log final statistics once everything is closed
         summary = self.get_performance_summary()
         self.logger.info(f"Final performance summary: {summary}")
\ No newline at end of file
@@ -3,13 +3,23 @@ Enhanced coordinator for the comprehensive backlink indexing system
 """
 
 import asyncio
+import contextlib
 import logging
-from typing import Dict, Any, List, Optional
+import aiohttp
+from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime
 from concurrent.futures import ThreadPoolExecutor
 import json
 
-from .config import IndexingConfig, URLRecord
+try:
+    import uvloop
+except ImportError:  # uvloop is optional; the stock asyncio loop is the fallback
+    uvloop = None
+
+from .config import IndexingConfig, URLRecord, MethodFlag
+from .bloom_filter import BloomFilter
+from .urls import is_http_url
+from .logging_setup import install_queue_logging
 from ..automation.browser_manager import StealthBrowserManager
 from ..automation.proxy_rotator import ProxyRotator
 from ..automation.user_agent_rotator import UserAgentRotator
@@ -25,10 +35,16 @@ from ..indexing_methods.social_signals import SocialSignalEngine
 from ..monitoring.serp_checker import SERPChecker
 from ..monitoring.success_tracker import SuccessTracker, IndexingAttempt
 
+# Python 3.11+: task scopes that cancel their remaining tasks together
+_TaskGroup = getattr(asyncio, 'TaskGroup', None)
+
 
 class MultiLayerIndexingStrategy:
     """Multi-layered indexing strategy for maximum coverage"""
     
+    # Layers that submit the URL itself, as opposed to amplifying it
+    SUBMISSION_LAYERS = ('primary', 'secondary')
+    
     def __init__(self, coordinator):
         self.coordinator = coordinator
         self.setup_logging()
@@ -46,6 +62,14 @@ class MultiLayerIndexingStrategy:
             'secondary': 0.5,    # 50% success rate to proceed
             'amplification': 0.3  # 30% success rate acceptable
         }
+        
+        # Resolve each method's engine once rather than on every layer run
+        self._engines = {
+            method_name: getattr(coordinator, f"{method_name}_engine")
+            for methods in self.strategy_layers.values()
+            for method_name in methods
+            if hasattr(coordinator, f"{method_name}_engine")
+        }
     
     def setup_logging(self):
         """Configure logging"""
@@ -61,37 +85,26 @@ class MultiLayerIndexingStrategy:
             'overall_success_rate': 0.0,
             'failed_urls': [],
             'successful_urls': [],
+            'submitted_urls': [],
             'timestamp': datetime.now().isoformat()
         }
         
-        # Track URLs through each layer
-        remaining_urls = list(zip(urls, metadata_list))
-        
-        # Execute primary layer
-        if remaining_urls:
-            primary_results = await self.execute_layer(
-                'primary', remaining_urls
-            )
-            strategy_results['layer_results']['primary'] = primary_results
-            
-            # Filter out successful URLs
-            remaining_urls = self.filter_unsuccessful_urls(remaining_urls, primary_results)
-        
-        # Execute secondary layer for remaining URLs
-        if remaining_urls and len(remaining_urls) > 0:
-            secondary_results = await self.execute_layer(
-                'secondary', remaining_urls
-            )
-            strategy_results['layer_results']['secondary'] = secondary_results
-            
-            # Filter again
-            remaining_urls = self.filter_unsuccessful_urls(remaining_urls, secondary_results)
+        # Layers never mutate the pairs they're given (filtering builds a new
+        # list), so one materialized copy serves both branches
+        url_metadata_pairs = list(zip(urls, metadata_list))
         
-        # Execute amplification layer for all URLs (regardless of previous success)
-        amplification_urls = list(zip(urls, metadata_list))  # Reset to all URLs
-        amplification_results = await self.execute_layer(
-            'amplification', amplification_urls
+        # Amplification runs on all URLs regardless of earlier success, so it
+        # starts right away alongside the primary -> secondary chain
+        loop = asyncio.get_running_loop()
+        amplification_task = loop.create_task(
+            self.execute_layer('amplification', url_metadata_pairs)
         )
+        chain_task = loop.create_task(
+            self._execute_filtered_layers(url_metadata_pairs)
+        )
+        chain_results, amplification_results = await asyncio.gather(chain_task, amplification_task)
+        
+        strategy_results['layer_results'].update(chain_results)
         strategy_results['layer_results']['amplification'] = amplification_results
         
         # Calculate overall results
@@ -99,6 +112,23 @@ class MultiLayerIndexingStrategy:
         
         return strategy_results
     
+    async def _execute_filtered_layers(self, remaining_urls: List[tuple]) -> Dict[str, Any]:
+        """Run the primary layer, then the secondary layer on the URLs it missed"""
+        layer_results = {}
+        
+        if remaining_urls:
+            layer_results['primary'] = await self.execute_layer('primary', remaining_urls)
+            
+            # Filter out successful URLs
+            remaining_urls = self.filter_unsuccessful_urls(remaining_urls, layer_results['primary'])
+        
+        # Execute secondary layer for remaining URLs; nothing runs after it,
+        # so its successes only need folding into the overall results
+        if remaining_urls:
+            layer_results['secondary'] = await self.execute_layer('secondary', remaining_urls)
+        
+        return layer_results
+    
     async def execute_layer(self, layer_name: str, url_metadata_pairs: List[tuple]) -> Dict[str, Any]:
         """Execute a specific strategy layer"""
         methods = self.strategy_layers[layer_name]
@@ -109,38 +139,89 @@ class MultiLayerIndexingStrategy:
             'success_rate': 0.0,
             'total_attempts': len(url_metadata_pairs)
         }
-        
-        # Execute all methods in parallel for better performance
-        method_tasks = []
-        for method_name in methods:
-            if hasattr(self.coordinator, f"{method_name}_engine"):
-                engine = getattr(self.coordinator, f"{method_name}_engine")
-                urls = [pair[0] for pair in url_metadata_pairs]
-                task = self.execute_method_batch(engine, method_name, urls)
-                method_tasks.append(task)
-        
-        # Wait for all methods to complete
-        if method_tasks:
-            method_results_list = await asyncio.gather(*method_tasks, return_exceptions=True)
+        successful_urls = set()
+        attempts: List[IndexingAttempt] = []
+        timestamp = datetime.now()
+        
+        # Execute all methods in parallel and fold each one's results in as it
+        # finishes, so fast methods aren't held behind the slowest. A task
+        # group cancels the remaining methods if the layer itself is cancelled
+        # or one of them dies outright
+        urls = [pair[0] for pair in url_metadata_pairs]
+        
+        if len(methods) == 1:
+            # A lone method (amplification) needs no task scope or streaming
+            method_name = methods[0]
+            if method_name in self._engines:
+                result = await self.execute_method_batch(self._engines[method_name], method_name, urls)
+                layer_results['method_results'][method_name] = result
+                self._fold_method_results(method_name, result, timestamp, successful_urls, attempts)
+        else:
+            scope = _TaskGroup() if _TaskGroup is not None else contextlib.nullcontext()
             
-            # Process results
-            for i, method_name in enumerate(methods):
-                if i < len(method_results_list):
-                    result = method_results_list[i]
-                    if not isinstance(result, Exception):
-                        layer_results['method_results'][method_name] = result
-                    else:
-                        self.logger.error(f"Method {method_name} failed: {str(result)}")
-                        layer_results['method_results'][method_name] = {
-                            'success': False,
-                            'error': str(result)
-                        }
+            async with scope:
+                create_task = scope.create_task if _TaskGroup is not None else asyncio.create_task
+                method_tasks = [
+                    create_task(self._run_named_batch(self._engines[method_name], method_name, urls))
+                    for method_name in methods
+                    if method_name in self._engines
+                ]
+                
+                for finished in asyncio.as_completed(method_tasks):
+                    method_name, result = await finished
+                    layer_results['method_results'][method_name] = result
+                    self._fold_method_results(method_name, result, timestamp, successful_urls, attempts)
+                    self.logger.info(
+                        "Layer %s: %s finished with %d/%d successful URLs",
+                        layer_name, method_name, result.get('successful_urls', 0), len(urls)
+                    )
+        
+        # Built in the one pass above so filtering, overall results and the
+        # success tracker needn't rescan every result
+        layer_results['_successful_set'] = frozenset(successful_urls)
+        layer_results['_attempts'] = attempts
         
         # Calculate layer success rate
         self.calculate_layer_success_rate(layer_results)
         
         return layer_results
     
+    def _fold_method_results(self, method_name: str, method_result: Dict[str, Any], timestamp: datetime,
+                             successful_urls: set, attempts: List[IndexingAttempt]):
+        """Note a method's successful URLs and build its tracker attempts in a single pass"""
+        for result in method_result.get('results', ()):
+            url = result.get('url', '')
+            if result.get('success', False):
+                successful_urls.add(result.get('url'))
+            
+            if 'platform_results' in result:
+                # For methods with multiple platforms
+                attempts.extend(
+                    IndexingAttempt(
+                        url=url,
+                        method=method_name,
+                        platform=platform_result.get('platform', 'unknown'),
+                        success=platform_result.get('success', False),
+                        timestamp=timestamp,
+                        error_message=platform_result.get('error', '')
+                    )
+                    for platform_result in result['platform_results']
+                )
+            else:
+                # Single platform result
+                attempts.append(IndexingAttempt(
+                    url=url,
+                    method=method_name,
+                    platform=result.get('platform', 'unknown'),
+                    success=result.get('success', False),
+                    timestamp=timestamp,
+                    error_message=result.get('error', '')
+                ))
+    
+    async def _run_named_batch(self, engine, method_name: str, urls: List[str]) -> Tuple[str, Dict[str, Any]]:
+        """Run a method batch and tag its result with the method name"""
+        return method_name, await self.execute_method_batch(engine, method_name, urls)
+    
     async def execute_method_batch(self, engine, method_name: str, urls: List[str]) -> Dict[str, Any]:
         """Execute a single method on a batch of URLs"""
         try:
@@ -155,9 +236,9 @@ class MultiLayerIndexingStrategy:
                 'success_rate': successful_count / len(urls) if urls else 0.0,
                 'results': results
             }
-            
+        
         except Exception as e:
-            self.logger.error(f"Batch execution failed for {method_name}: {str(e)}")
+            self.logger.error("Batch execution failed for %s: %s", method_name, e)
             return {
                 'method': method_name,
                 'success': False,
@@ -169,19 +250,12 @@ class MultiLayerIndexingStrategy:
         if not layer_results.get('method_results'):
             return url_metadata_pairs
         
-        successful_urls = set()
-        
-        # Collect successful URLs from all methods in the layer
-        for method_result in layer_results['method_results'].values():
-            if 'results' in method_result:
-                for result in method_result['results']:
-                    if result.get('success', False):
-                        successful_urls.add(result.get('url'))
+        successful_urls = layer_results.get('_successful_set', frozenset())
         
         # Return only URLs that weren't successful
         remaining = [pair for pair in url_metadata_pairs if pair[0] not in successful_urls]
         
-        self.logger.info(f"Layer filtered out {len(successful_urls)} successful URLs, {len(remaining)} remaining")
+        self.logger.info("Layer filtered out %d successful URLs, %d remaining", len(successful_urls), len(remaining))
         
         return remaining
     
@@ -207,18 +281,20 @@ class MultiLayerIndexingStrategy:
     
     def calculate_overall_results(self, strategy_results: Dict[str, Any], original_urls: List[str]):
         """Calculate overall strategy results"""
-        all_successful_urls = set()
-        
-        # Collect successful URLs from all layers
-        for layer_result in strategy_results['layer_results'].values():
-            method_results = layer_result.get('method_results', {})
-            for method_result in method_results.values():
-                if 'results' in method_result:
-                    for result in method_result['results']:
-                        if result.get('success', False):
-                            all_successful_urls.add(result.get('url'))
+        # Union the per-layer sets; they are internal and dropped from the
+        # reported layer results
+        layer_sets = {
+            layer_name: layer_result.pop('_successful_set', frozenset())
+            for layer_name, layer_result in strategy_results['layer_results'].items()
+        }
+        all_successful_urls = set().union(*layer_sets.values())
         
         strategy_results['successful_urls'] = list(all_successful_urls)
+        # Amplification only adds social signals, so only the submission
+        # layers count towards a URL being indexed
+        strategy_results['submitted_urls'] = list(set().union(*(
+            layer_sets.get(layer_name, frozenset()) for layer_name in self.SUBMISSION_LAYERS
+        )))
         strategy_results['failed_urls'] = [
             url for url in original_urls if url not in all_successful_urls
         ]
@@ -245,10 +321,33 @@ class EnhancedBacklinkIndexingCoordinator:
         self.forum_commenting_engine = ForumCommentingEngine(config, self.browser_manager)
         self.directory_submission_engine = DirectorySubmissionEngine(config, self.browser_manager)
         self.social_signals_engine = SocialSignalEngine(config, self.browser_manager)
+        self._all_engines = (
+            self.social_bookmarking_engine,
+            self.rss_distribution_engine,
+            self.web2_posting_engine,
+            self.forum_commenting_engine,
+            self.directory_submission_engine,
+            self.social_signals_engine
+        )
+        
+        # One pooled HTTP session shared by every engine, owned by the
+        # outermost "async with coordinator" scope
+        self.http_session = None
+        self._http_loop = None
+        self._scope_depth = 0
+        
+        # Background writer for attempts and the indexed URL filter, started with the session
+        self._persist_queue = None
+        self._persist_task = None
         
         # Initialize monitoring components
         self.serp_checker = SERPChecker(config)
-        self.success_tracker = SuccessTracker(config)
+        self.success_tracker = SuccessTracker()  # DATABASE_URL or its local SQLite default
+        
+        # URLs indexed in earlier runs, skipped before any engine work
+        self.indexed_urls = BloomFilter.load_or_create(
+            config.indexed_urls_bloom_path, config.bloom_capacity, config.bloom_error_rate
+        )
         
         # Initialize strategy coordinator
         self.multi_layer_strategy = MultiLayerIndexingStrategy(self)
@@ -259,63 +358,91 @@ class EnhancedBacklinkIndexingCoordinator:
             'successful_indexing': 0,
             'failed_indexing': 0,
             'session_start': datetime.now(),
-            'methods_used': set()
+            'methods_used': MethodFlag(0)
         }
     
+    @staticmethod
+    def install_fast_loop() -> bool:
+        """Run event loops created from now on on uvloop, when it is installed"""
+        # Opt-in, so an embedding application keeps whatever loop policy it chose
+        if uvloop is None:
+            return False
+        
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+        return True
+    
     def setup_logging(self):
         """Configure logging for the coordinator"""
-        logging.basicConfig(
-            level=logging.INFO,
-            format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-            handlers=[
-                logging.FileHandler('backlink_indexer.log'),
-                logging.StreamHandler()
-            ]
-        )
+        install_queue_logging()
         self.logger = logging.getLogger(f"{__name__}.EnhancedCoordinator")
     
-    async def process_url_collection(self, urls: List[str], metadata_list: List[Dict[str, Any]] = None) -> Dict[str, Any]:
-        """Process a collection of URLs through the comprehensive indexing pipeline"""
+    async def process_url_collection(self, urls: List[str], metadata_list: List[Dict[str, Any]] = None,
+                                     force: bool = False) -> Dict[str, Any]:
+        """Process a collection of URLs through the comprehensive indexing pipeline; force re-runs indexed URLs"""
         start_time = datetime.now()
         self.logger.info(f"Starting comprehensive indexing for {len(urls)} URLs")
         
         # Validate URLs
-        valid_urls = []
-        valid_metadata = []
-        
-        metadata_list = metadata_list or [{}] * len(urls)
-        
-        for i, url in enumerate(urls):
-            try:
-                if await self.validate_url(url):
-                    valid_urls.append(url)
-                    valid_metadata.append(metadata_list[i] if i < len(metadata_list) else {})
-                else:
-                    self.logger.warning(f"Invalid URL skipped: {url}")
-            except Exception as e:
-                self.logger.error(f"URL validation failed for {url}: {str(e)}")
+        metadata_list = metadata_list or []
+        valid_pairs = [
+            (url, metadata_list[i] if i < len(metadata_list) else {})
+            for i, url in enumerate(urls)
+            if is_http_url(url)
+        ]
+        if len(valid_pairs) < len(urls):
+            self.logger.warning(f"Skipped {len(urls) - len(valid_pairs)} invalid URLs")
         
-        if not valid_urls:
+        if not valid_pairs:
             return {
                 'success': False,
                 'error': 'No valid URLs to process',
                 'timestamp': datetime.now().isoformat()
             }
         
-        # Execute multi-layer indexing strategy
-        strategy_results = await self.multi_layer_strategy.execute_layered_strategy(
-            valid_urls, valid_metadata
-        )
-        
-        # Record attempts in success tracker
-        await self.record_indexing_attempts(strategy_results)
-        
-        # Optional: Verify indexing through SERP checking
-        verification_results = None
-        if len(valid_urls) <= 10:  # Only for small batches to avoid rate limiting
+        # Already-indexed URLs would only repeat every engine's work
+        fresh_pairs, skipped_urls = [], []
+        for pair in valid_pairs:
+            if not force and pair[0] in self.indexed_urls:
+                skipped_urls.append(pair[0])
+            else:
+                fresh_pairs.append(pair)
+        if skipped_urls:
+            self.logger.info(f"Skipped {len(skipped_urls)} URLs indexed in earlier runs")
+        
+        if not fresh_pairs:
+            # Same shape as a full run, so callers can render it unchanged
+            empty_strategy = {
+                'overall_success_rate': 0.0,
+                'successful_urls': [],
+                'failed_urls': [],
+                'layer_results': {}
+            }
+            return self._compile_results(start_time, [], empty_strategy, skipped_urls, None)
+        
+        valid_urls = [pair[0] for pair in fresh_pairs]
+        valid_metadata = [pair[1] for pair in fresh_pairs]
+        
+        # A bare call scopes itself so queued attempts are flushed and the
+        # session closed before asyncio.run tears the loop down; inside an
+        # outer scope this only bumps the depth
+        async with self._call_scope():
+            # Execute multi-layer indexing strategy
+            strategy_results = await self.multi_layer_strategy.execute_layered_strategy(
+                valid_urls, valid_metadata
+            )
+            
+            # Remember what got indexed, then queue attempts for the background
+            # writer, which persists both. Mock runs index nothing for real
+            if not self.config.mock_mode:
+                self.indexed_urls.update(strategy_results['submitted_urls'])
+            await self.record_indexing_attempts(strategy_results)
+            
+            # Verify indexing through SERP checking; the checker paces its own
+            # queries and stops at the configured time budget
+            verification_results = None
             try:
                 verification_results = await self.verify_indexing_success(
-                    strategy_results['successful_urls'][:5]  # Check top 5 successful URLs
+                    strategy_results['successful_urls']
                 )
             except Exception as e:
                 self.logger.warning(f"Verification failed: {str(e)}")
@@ -323,81 +450,142 @@ class EnhancedBacklinkIndexingCoordinator:
         # Update session stats
         self.update_session_stats(strategy_results)
         
-        # Compile final results
+        final_results = self._compile_results(start_time, valid_urls, strategy_results, skipped_urls,
+                                              verification_results)
+        self.logger.info(f"Indexing completed: {final_results['overall_success_rate']:.2%} success rate")
+        
+        return final_results
+    
+    def _compile_results(self, start_time: datetime, valid_urls: List[str], strategy_results: Dict[str, Any],
+                         skipped_urls: List[str], verification_results: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """Build the public result of one process_url_collection call"""
         end_time = datetime.now()
-        processing_time = (end_time - start_time).total_seconds()
         
-        final_results = {
+        return {
             'success': True,
             'overall_success_rate': strategy_results['overall_success_rate'],
             'urls_processed': len(valid_urls),
             'successful_urls': len(strategy_results['successful_urls']),
             'failed_urls': len(strategy_results['failed_urls']),
-            'processing_time_seconds': processing_time,
+            'previously_indexed_urls': len(skipped_urls),
+            'skipped_urls': skipped_urls,
+            'processing_time_seconds': (end_time - start_time).total_seconds(),
             'layer_results': strategy_results['layer_results'],
             'verification_results': verification_results,
-            'session_stats': self.session_stats.copy(),
+            'session_stats': self._session_stats_snapshot(),
             'timestamp': end_time.isoformat()
         }
+    
+    async def __aenter__(self) -> 'EnhancedBacklinkIndexingCoordinator':
+        self._scope_depth += 1
+        await self.start()
+        return self
+    
+    async def __aexit__(self, *exc_info):
+        # Nested or concurrent scopes share the session; the last one out
+        # shuts everything down, browser pool included
+        self._scope_depth -= 1
+        if self._scope_depth == 0:
+            await self.shutdown()
+    
+    @contextlib.asynccontextmanager
+    async def _call_scope(self):
+        """Scope for one call: the last one out flushes and closes the session but keeps browsers warm"""
+        self._scope_depth += 1
+        try:
+            await self.start()
+            yield self
+        finally:
+            self._scope_depth -= 1
+            if self._scope_depth == 0:
+                await self.aclose()
+    
+    async def start(self):
+        """Open the shared HTTP session for the running loop and hand it to every engine"""
+        loop = asyncio.get_running_loop()
+        if self.http_session is not None and not self.http_session.closed and self._http_loop is loop:
+            return
         
-        self.logger.info(f"Indexing completed: {final_results['overall_success_rate']:.2%} success rate")
+        # A session can't outlive the loop it was created on
+        connector = aiohttp.TCPConnector(
+            limit=self.config.max_http_connections,
+            limit_per_host=self.config.max_http_connections_per_host,
+            ttl_dns_cache=300,
+            keepalive_timeout=30,
+            enable_cleanup_closed=True
+        )
+        self.http_session = aiohttp.ClientSession(
+            connector=connector,
+            timeout=aiohttp.ClientTimeout(total=self.config.http_timeout)
+        )
+        self._http_loop = loop
         
-        return final_results
+        for engine in self._all_engines:
+            engine.http_session = self.http_session
+        self.serp_checker.http_session = self.http_session
+        
+        self._persist_queue = asyncio.Queue(maxsize=10_000)
+        self._persist_task = loop.create_task(self._persist_loop())
     
-    async def validate_url(self, url: str) -> bool:
-        """Validate URL format and accessibility"""
-        try:
-            from urllib.parse import urlparse
+    async def aclose(self):
+        """Flush pending persistence and close the shared HTTP session; the browser pool stays warm"""
+        if self._persist_task is not None:
+            await self._persist_queue.join()
+            self._persist_task.cancel()
+            await asyncio.gather(self._persist_task, return_exceptions=True)
+            self._persist_task = None
+        
+        if self.http_session is not None and not self.http_session.closed:
+            await self.http_session.close()
+        self.http_session = None
+    
+    async def shutdown(self):
+        """Release everything aclose does plus the pooled browsers"""
+        await self.aclose()
+        await self.browser_manager.browser_pool.close()
+    
+    async def _persist_loop(self):
+        """Drain queued attempt batches and write them out together"""
+        queue = self._persist_queue
+        
+        while True:
+            batches = [await queue.get()]
+            while len(batches) < 512 and not queue.empty():
+                batches.append(queue.get_nowait())
             
-            parsed = urlparse(url)
-            if not parsed.netloc or parsed.scheme not in ['http', 'https']:
-                return False
+            try:
+                await self.success_tracker.record_attempts_batch(
+                    [attempt for batch in batches for attempt in batch]
+                )
+            except Exception as e:
+                self.logger.error(f"Failed to record attempts: {str(e)}")
             
-            # Additional validation could be added here
-            return True
+            try:
+                if self.config.indexed_urls_bloom_path:
+                    await asyncio.to_thread(self.indexed_urls.save, self.config.indexed_urls_bloom_path)
+            except OSError as e:
+                self.logger.warning(f"Could not persist indexed URL filter: {str(e)}")
             
-        except Exception:
-            return False
+            for _ in batches:
+                queue.task_done()
+    
+    def validate_url(self, url: str) -> bool:
+        """Validate URL format"""
+        return is_http_url(url)
     
     async def record_indexing_attempts(self, strategy_results: Dict[str, Any]):
         """Record all indexing attempts in the success tracker"""
         try:
-            for layer_name, layer_result in strategy_results['layer_results'].items():
-                method_results = layer_result.get('method_results', {})
-                
-                for method_name, method_result in method_results.items():
-                    if 'results' in method_result:
-                        for result in method_result['results']:
-                            # Determine platform
-                            platform = result.get('platform', 'unknown')
-                            if 'platform_results' in result:
-                                # For methods with multiple platforms
-                                for platform_result in result['platform_results']:
-                                    platform_name = platform_result.get('platform', 'unknown')
-                                    success = platform_result.get('success', False)
-                                    
-                                    attempt = IndexingAttempt(
-                                        url=result.get('url', ''),
-                                        method=method_name,
-                                        platform=platform_name,
-                                        success=success,
-                                        timestamp=datetime.now(),
-                                        error_message=platform_result.get('error', '')
-                                    )
-                                    
-                                    await self.success_tracker.record_attempt(attempt)
-                            else:
-                                # Single platform result
-                                attempt = IndexingAttempt(
-                                    url=result.get('url', ''),
-                                    method=method_name,
-                                    platform=platform,
-                                    success=result.get('success', False),
-                                    timestamp=datetime.now(),
-                                    error_message=result.get('error', '')
-                                )
-                                
-                                await self.success_tracker.record_attempt(attempt)
+            # Each layer built its attempts while its results streamed in
+            attempts = [
+                attempt
+                for layer_result in strategy_results['layer_results'].values()
+                for attempt in layer_result.pop('_attempts', ())
+            ]
+            
+            # Hand the whole invocation to the background writer
+            await self.start()
+            await self._persist_queue.put(attempts)
         
         except Exception as e:
             self.logger.error(f"Failed to record attempts: {str(e)}")
@@ -405,19 +593,23 @@ class EnhancedBacklinkIndexingCoordinator:
     async def verify_indexing_success(self, urls: List[str]) -> Dict[str, Any]:
         """Verify indexing success through SERP checking"""
         try:
-            verification_results = await self.serp_checker.batch_check_indexing(urls)
+            verification_results = await self.serp_checker.batch_check_indexing(
+                urls, timeout=self.config.verification_timeout
+            )
             
-            # Calculate verification stats
+            # Calculate verification stats over the URLs checked within the budget
+            urls_checked = sum(1 for result in verification_results if not result.get('timed_out'))
             indexed_count = sum(1 for result in verification_results if result.get('indexing_score', 0) > 0)
             
             return {
-                'urls_checked': len(urls),
+                'urls_checked': urls_checked,
+                'urls_timed_out': len(urls) - urls_checked,
                 'indexed_count': indexed_count,
-                'verification_rate': indexed_count / len(urls) if urls else 0.0,
+                'verification_rate': indexed_count / urls_checked if urls_checked else 0.0,
                 'detailed_results': verification_results,
                 'timestamp': datetime.now().isoformat()
             }
-            
+        
         except Exception as e:
             self.logger.error(f"Indexing verification failed: {str(e)}")
             return {'error': str(e)}
@@ -430,7 +622,16 @@ class EnhancedBacklinkIndexingCoordinator:
         
         # Track methods used
         for layer_result in strategy_results['layer_results'].values():
-            self.session_stats['methods_used'].update(layer_result.get('methods_used', []))
+            for method in layer_result.get('methods_used', ()):
+                self.session_stats['methods_used'] |= MethodFlag[method.upper()]
+    
+    def _session_stats_snapshot(self) -> Dict[str, Any]:
+        """Copy of the session stats with the method flags spelled out as names"""
+        methods_used = self.session_stats['methods_used']
+        return {
+            **self.session_stats,
+            'methods_used': [flag.name.lower() for flag in MethodFlag if flag in methods_used]
+        }
     
     async def get_comprehensive_stats(self) -> Dict[str, Any]:
         """Get comprehensive statistics about the indexing system"""
@@ -449,7 +650,7 @@ class EnhancedBacklinkIndexingCoordinator:
                         'last_24h_success_rate': performance.last_24h_success_rate
                     }
                 except Exception as e:
-                    self.logger.debug(f"Could not get stats for {method}: {str(e)}")
+                    self.logger.debug("Could not get stats for %s: %s", method, e)
             
             # Get overall performance
             overall_performance = await self.success_tracker.get_overall_performance()
@@ -459,8 +660,7 @@ class EnhancedBacklinkIndexingCoordinator:
             
             return {
                 'session_stats': {
-                    **self.session_stats,
-                    'methods_used': list(self.session_stats['methods_used']),
+                    **self._session_stats_snapshot(),
                     'session_duration_seconds': session_duration
                 },
                 'method_performance': method_performance,
@@ -472,7 +672,7 @@ class EnhancedBacklinkIndexingCoordinator:
                 },
                 'timestamp': datetime.now().isoformat()
             }
-            
+        
         except Exception as e:
             self.logger.error(f"Failed to get comprehensive stats: {str(e)}")
             return {'error': str(e)}
@@ -512,7 +712,7 @@ class EnhancedBacklinkIndexingCoordinator:
                     optimizations['configuration_changes']['add_more_platforms'] = True
             
             return optimizations
-            
+        
         except Exception as e:
             self.logger.error(f"Performance optimization analysis failed: {str(e)}")
             return {'error': str(e)}
\ No newline at end of file
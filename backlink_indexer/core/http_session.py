@@ -0,0 +1,21 @@
+"""
+HTTP session helpers shared by the SERP checker and indexing engines
+"""
+
+import contextlib
+from typing import AsyncIterator, Optional
+
+import aiohttp
+
+
+@contextlib.asynccontextmanager
+async def use_session(shared: Optional[aiohttp.ClientSession] = None,
+                      **session_kwargs) -> AsyncIterator[aiohttp.ClientSession]:
+    """Yield the coordinator's pooled session when one is injected, else a private one closed on exit"""
+    # The coordinator owns the pooled session and closes it itself
+    if shared is not None:
+        yield shared
+        return
+    
+    async with aiohttp.ClientSession(**session_kwargs) as session:
+        yield session
@@ -0,0 +1,43 @@
+"""
+Process-wide logging setup shared by the coordinators
+"""
+
+import atexit
+import logging
+import logging.handlers
+import queue
+import threading
+from typing import Optional
+
+_install_lock = threading.Lock()
+_listener: Optional[logging.handlers.QueueListener] = None
+
+
+def install_queue_logging(log_file: str = 'backlink_indexer.log', level: int = logging.INFO) -> bool:
+    """Route root logging through a queue drained by a listener thread; True if this call installed it"""
+    global _listener
+    
+    with _install_lock:
+        root = logging.getLogger()
+        
+        # Like basicConfig, only configure a root logger nobody has set up yet;
+        # repeat calls from other coordinators are no-ops
+        if _listener is not None or root.handlers:
+            return False
+        
+        formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+        handlers = [logging.FileHandler(log_file), logging.StreamHandler()]
+        for handler in handlers:
+            handler.setFormatter(formatter)
+        
+        # Records are queued on the event loop thread and written by a
+        # listener thread, so file I/O never blocks in-flight coroutines
+        log_queue = queue.SimpleQueue()
+        root.addHandler(logging.handlers.QueueHandler(log_queue))
+        root.setLevel(level)
+        
+        _listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+        _listener.start()
+        # The listener is process-wide; flush it when the interpreter exits
+        atexit.register(_listener.stop)
+        return True
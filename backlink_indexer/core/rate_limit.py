@@ -0,0 +1,30 @@
+"""
+Rate limiting shared by the SERP checker and indexing engines
+"""
+
+import asyncio
+from typing import Dict, Hashable
+
+
+class SlotRateLimiter:
+    """
+    Spaces calls for each key at least 1 / per_second seconds apart
+    Each caller reserves the next free slot before sleeping, so concurrent
+    callers for one key queue up in order instead of bursting together
+    """
+    
+    def __init__(self, per_second: float):
+        self.per_second = per_second
+        self._next_slot_at: Dict[Hashable, float] = {}
+    
+    async def wait(self, key: Hashable):
+        """Sleep until the next slot for key; a non-positive rate disables pacing"""
+        if self.per_second <= 0:
+            return
+        
+        now = asyncio.get_running_loop().time()
+        slot = max(now, self._next_slot_at.get(key, 0.0))
+        self._next_slot_at[key] = slot + 1.0 / self.per_second
+        
+        if slot > now:
+            await asyncio.sleep(slot - now)
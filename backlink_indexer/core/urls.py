@@ -0,0 +1,15 @@
+"""
+URL checks shared by the coordinators and indexing engines
+"""
+
+import re
+
+# An http(s) scheme, then an authority (everything before the first /, ? or #)
+# that is non-empty and has no whitespace. This is a cheap syntactic check,
+# not a parse: it doesn't validate the host the way urlparse or a resolver would
+URL_RE = re.compile(r'^https?://[^/?#\s]+', re.IGNORECASE)
+
+
+def is_http_url(url) -> bool:
+    """True for strings that look like absolute http(s) URLs; anything else is rejected"""
+    return isinstance(url, str) and URL_RE.match(url) is not None
@@ -2,21 +2,70 @@
 Abstract base class for all indexing methods
 """
 
+import asyncio
 import logging
+import aiohttp
 from abc import ABC, abstractmethod
-from typing import Dict, Any, List
+from bs4 import BeautifulSoup
+from typing import Dict, Any, List, Tuple
 from datetime import datetime
+from selenium.webdriver.support.ui import WebDriverWait
+
+try:
+    from selectolax.parser import HTMLParser
+except ImportError:  # selectolax is optional; BeautifulSoup is the fallback parser
+    HTMLParser = None
+
+from ..core.http_session import use_session
+from ..core.urls import is_http_url
+
+
+def parse_page(html: str) -> Tuple[str, str, str, str]:
+    """Extract title, meta description, meta keywords and visible body text from HTML"""
+    if HTMLParser is not None:
+        tree = HTMLParser(html)
+        for node in tree.css('script, style'):
+            node.decompose()
+        
+        title = tree.css_first('title')
+        description = tree.css_first("meta[name='description']")
+        keywords = tree.css_first("meta[name='keywords']")
+        return (
+            title.text(strip=True) if title else '',
+            (description.attributes.get('content') or '') if description else '',
+            (keywords.attributes.get('content') or '') if keywords else '',
+            tree.body.text(separator=' ') if tree.body else ''
+        )
+    
+    soup = BeautifulSoup(html, 'html.parser')
+    for node in soup(['script', 'style']):
+        node.decompose()
+    
+    description = soup.find('meta', attrs={'name': 'description'})
+    keywords = soup.find('meta', attrs={'name': 'keywords'})
+    return (
+        soup.title.get_text(strip=True) if soup.title else '',
+        (description.get('content') or '') if description else '',
+        (keywords.get('content') or '') if keywords else '',
+        soup.body.get_text(' ') if soup.body else ''
+    )
 
 
 class IndexingMethodBase(ABC):
     """Abstract base class for all indexing methods"""
     
+    # Simple content variation techniques: random prefixes/suffixes
+    _VARIATION_PREFIXES = ("Check out this:", "Found this interesting:", "Take a look at:", "Worth reading:")
+    _VARIATION_SUFFIXES = ("- great content!", "- recommended read", "- very useful", "")
+    
     def __init__(self, config, browser_manager):
         self.config = config
         self.browser_manager = browser_manager
         self.success_rate = 0.0
         self.total_attempts = 0
         self.successful_attempts = 0
+        # Shared aiohttp session injected by the coordinator, if any
+        self.http_session = None
         self.setup_logging()
     
     def setup_logging(self):
@@ -30,36 +79,54 @@ class IndexingMethodBase(ABC):
         pass
     
     async def process_batch(self, urls: List[str]) -> List[Dict[str, Any]]:
-        """Process a batch of URLs"""
-        results = []
+        """Process a batch of URLs concurrently"""
+        semaphore = asyncio.Semaphore(self.config.batch_concurrency)
+        outcomes = await asyncio.gather(
+            *(self._process_in_slot(semaphore, url) for url in urls),
+            return_exceptions=True
+        )
         
-        for url in urls:
-            try:
-                result = await self.process_url(url)
-                results.append(result)
-                self.update_success_metrics(result['success'])
-                
-                # Human-like delay between URLs
-                await self.browser_manager.human_like_delay()
-                
-            except Exception as e:
-                self.logger.error(f"Error processing URL {url}: {str(e)}")
-                results.append({
-                    'url': url,
-                    'success': False,
-                    'error': str(e),
-                    'method': self.__class__.__name__,
-                    'timestamp': datetime.now().isoformat()
-                })
+        # Cancellation and other non-Exception signals must propagate, not become failed rows
+        for outcome in outcomes:
+            if isinstance(outcome, BaseException) and not isinstance(outcome, Exception):
+                raise outcome
         
+        # One timestamp serves every failure in the batch
+        now_iso = datetime.now().isoformat()
+        results = [
+            outcome if not isinstance(outcome, Exception) else self._error_result(url, outcome, now_iso)
+            for url, outcome in zip(urls, outcomes)
+        ]
+        
+        self.update_success_metrics(sum(1 for result in results if result['success']), len(results))
         return results
     
-    def update_success_metrics(self, success: bool):
+    async def _process_in_slot(self, semaphore: asyncio.Semaphore, url: str) -> Dict[str, Any]:
+        """Process one URL while holding a concurrency slot"""
+        async with semaphore:
+            result = await self.process_url(url)
+            
+            # Human-like delay stays per worker so slots keep their jitter
+            await self.browser_manager.human_like_delay()
+            return result
+    
+    def _error_result(self, url: str, error: Exception, timestamp: str) -> Dict[str, Any]:
+        """Build the failure result for a URL whose processing raised"""
+        self.logger.error("Error processing URL %s: %s", url, error)
+        return {
+            'url': url,
+            'success': False,
+            'error': str(error),
+            'method': self.__class__.__name__,
+            'timestamp': timestamp
+        }
+    
+    def update_success_metrics(self, successes: int, total: int = 1):
         """Update success rate metrics"""
-        self.total_attempts += 1
-        if success:
-            self.successful_attempts += 1
-        self.success_rate = self.successful_attempts / self.total_attempts
+        self.total_attempts += total
+        self.successful_attempts += successes
+        if self.total_attempts:
+            self.success_rate = self.successful_attempts / self.total_attempts
     
     def get_performance_stats(self) -> Dict[str, Any]:
         """Get performance statistics for this method"""
@@ -71,32 +138,47 @@ class IndexingMethodBase(ABC):
             'last_updated': datetime.now().isoformat()
         }
     
-    async def validate_url(self, url: str) -> bool:
-        """Basic URL validation"""
+    async def _fetch_page(self, url: str) -> str:
+        """Fetch page HTML without a browser, or '' if that fails"""
         try:
-            from urllib.parse import urlparse
-            parsed = urlparse(url)
-            return bool(parsed.netloc and parsed.scheme in ['http', 'https'])
-        except Exception:
-            return False
+            async with use_session(self.http_session) as session:
+                return await self._read_html(session, url)
+                
+        except Exception as e:
+            self.logger.debug(f"Plain fetch failed for {url}: {str(e)}")
+            return ''
+    
+    async def _read_html(self, session: aiohttp.ClientSession, url: str) -> str:
+        """Read a page's HTML over the given session"""
+        async with session.get(url, timeout=aiohttp.ClientTimeout(total=10)) as response:
+            if response.status != 200:
+                return ''
+            return await response.text()
+    
+    async def _navigate(self, driver, url: str, timeout: float = 10.0):
+        """Load a page in a Selenium driver without blocking the event loop"""
+        # Selenium blocks, so navigate off the event loop and wait for the
+        # page to finish loading instead of a fixed sleep
+        await asyncio.to_thread(driver.get, url)
+        await asyncio.to_thread(self._wait_for_page_load, driver, timeout)
+    
+    @staticmethod
+    def _wait_for_page_load(driver, timeout: float = 10.0):
+        """Block until the document reports it has finished loading"""
+        WebDriverWait(driver, timeout).until(
+            lambda d: d.execute_script("return document.readyState") == 'complete'
+        )
+    
+    def validate_url(self, url: str) -> bool:
+        """Basic URL validation"""
+        return is_http_url(url)
     
     def generate_content_variations(self, base_content: str, num_variations: int = 3) -> List[str]:
         """Generate content variations to avoid duplicate detection"""
-        variations = [base_content]
-        
-        # Simple content variation techniques
-        for i in range(num_variations - 1):
-            variation = base_content
-            
-            # Add random prefixes/suffixes
-            prefixes = ["Check out this:", "Found this interesting:", "Take a look at:", "Worth reading:"]
-            suffixes = ["- great content!", "- recommended read", "- very useful", ""]
-            
-            if i == 0:
-                variation = f"{prefixes[i % len(prefixes)]} {variation}"
-            elif i == 1:
-                variation = f"{variation} {suffixes[i % len(suffixes)]}"
-            
-            variations.append(variation)
-        
-        return variations
\ No newline at end of file
+        # The first extra variation gets a prefix, the second a suffix
+        return [base_content] + [
+            f"{self._VARIATION_PREFIXES[0]} {base_content}" if i == 0
+            else f"{base_content} {self._VARIATION_SUFFIXES[1]}" if i == 1
+            else base_content
+            for i in range(num_variations - 1)
+        ]
\ No newline at end of file
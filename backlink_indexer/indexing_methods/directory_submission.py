@@ -4,10 +4,98 @@ Directory submission engine for automated web directory submissions
 
 import asyncio
 import random
+import re
 import logging
-from typing import Dict, Any, List, Optional
+import numpy as np
+from bs4 import BeautifulSoup
+from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime
-from .base import IndexingMethodBase
+from urllib.parse import urlparse
+from .base import IndexingMethodBase, parse_page
+from ..models import DirectoryEntry, SubmissionData
+
+try:
+    import ahocorasick
+except ImportError:  # pyahocorasick is optional; per-keyword substring checks are the fallback
+    ahocorasick = None
+
+try:
+    from numba import njit
+except ImportError:  # Numba is optional; per-keyword substring checks are the fallback
+    njit = None
+
+_EMAIL_RE = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}\b')
+_PHONE_RE = re.compile(r'\b\d{3}[-.]?\d{3}[-.]?\d{4}\b')
+
+# Sampling limits: the head of a page carries enough signal to categorize it
+# and find its contact details, so huge pages are not scanned end to end
+_CATEGORY_SAMPLE_CHARS = 20_000
+_CONTACT_SAMPLE_CHARS = 200_000
+
+# Keywords that vote for each site category, in tie-break order
+_CATEGORY_KEYWORDS: Dict[str, Tuple[str, ...]] = {
+    'technology': (
+        'software', 'technology', 'development', 'programming', 'digital',
+        'tech', 'app', 'platform', 'system', 'solution'
+    ),
+    'business': (
+        'business', 'company', 'service', 'consulting', 'marketing',
+        'sales', 'corporate', 'professional', 'commercial'
+    ),
+    'health': (
+        'health', 'medical', 'healthcare', 'fitness', 'wellness',
+        'doctor', 'clinic', 'treatment', 'therapy'
+    ),
+    'education': (
+        'education', 'learning', 'course', 'training', 'tutorial',
+        'school', 'university', 'academic', 'study'
+    ),
+    'lifestyle': (
+        'lifestyle', 'travel', 'food', 'entertainment', 'culture',
+        'recreation', 'hobby', 'fashion', 'art'
+    )
+}
+
+
+if njit is not None:
+    @njit(cache=True)
+    def _jit_category_scores(text, keyword_bytes, offsets, categories, buckets, category_count):
+        """Count keyword occurrences per category in one native pass over the text"""
+        scores = np.zeros(category_count, dtype=np.int32)
+        n = text.shape[0]
+        
+        for i in range(n):
+            # Only keywords starting with this byte can match here
+            first = text[i]
+            for k in range(buckets[first], buckets[first + 1]):
+                start = offsets[k]
+                length = offsets[k + 1] - start
+                if i + length > n:
+                    continue
+                j = 1
+                while j < length and text[i + j] == keyword_bytes[start + j]:
+                    j += 1
+                if j == length:
+                    scores[categories[k]] += 1
+        
+        return scores
+    
+    # Keywords are ASCII, so matching UTF-8 bytes finds exactly the same substrings.
+    # They are laid out sorted by first byte, with buckets[b]:buckets[b + 1] spanning byte b
+    _KEYWORDS_BY_FIRST_BYTE = sorted(
+        ((keyword.encode('ascii'), category_id)
+         for category_id, keywords in enumerate(_CATEGORY_KEYWORDS.values())
+         for keyword in keywords),
+        key=lambda entry: entry[0][0]
+    )
+    _KEYWORD_BYTES = np.frombuffer(b''.join(kw for kw, _ in _KEYWORDS_BY_FIRST_BYTE), dtype=np.uint8)
+    _KEYWORD_OFFSETS = np.cumsum([0] + [len(kw) for kw, _ in _KEYWORDS_BY_FIRST_BYTE], dtype=np.int64)
+    _KEYWORD_CATEGORIES = np.array([category_id for _, category_id in _KEYWORDS_BY_FIRST_BYTE], dtype=np.int64)
+    _KEYWORD_BUCKETS = np.searchsorted(
+        np.array([kw[0] for kw, _ in _KEYWORDS_BY_FIRST_BYTE]), np.arange(257)
+    ).astype(np.int64)
+else:
+    _jit_category_scores = None
 
 
 class DirectorySubmissionEngine(IndexingMethodBase):
@@ -114,10 +202,36 @@ class DirectorySubmissionEngine(IndexingMethodBase):
             'contact_email': ['email', 'contact_email', 'admin_email', 'webmaster'],
             'contact_name': ['contact_name', 'admin_name', 'owner_name', 'webmaster_name']
         }
+        
+        # Reverse lookup from a form field name to its data key and alias preference
+        self._field_name_to_key = {
+            alias: (data_key, rank)
+            for data_key, aliases in self.form_field_mappings.items()
+            for rank, alias in enumerate(aliases)
+        }
+        
+        # One automaton matches every category keyword in a single pass over the text
+        self._keyword_automaton = self._build_keyword_automaton()
+        
+        # Directory rankings depend only on the site category, so rank once per category
+        self._sorted_by_category = {
+            category: self._rank_directories(category)
+            for category in (*_CATEGORY_KEYWORDS, 'general')
+        }
+        
+        self._stats = {
+            'total_directories': sum(len(config['directories']) for config in self.directory_platforms.values()),
+            'directory_types': tuple(self.directory_platforms),
+            'categories': tuple(self.directory_categories),
+            'average_authority_score': sum(
+                config['authority_score'] for config in self.directory_platforms.values()
+            ) / len(self.directory_platforms),
+            'form_fields': tuple(self.form_field_mappings)
+        }
     
     async def process_url(self, url: str, metadata: Dict[str, Any] = None) -> Dict[str, Any]:
         """Process URL for directory submissions"""
-        if not await self.validate_url(url):
+        if not self.validate_url(url):
             return {
                 'url': url,
                 'method': 'directory_submission',
@@ -129,28 +243,31 @@ class DirectorySubmissionEngine(IndexingMethodBase):
         # Analyze website for categorization
         site_analysis = await self.analyze_website_for_categorization(url)
         
-        # Generate submission data
-        submission_data = await self.generate_submission_data(url, site_analysis, metadata)
+        # Generate submission data; the domain is parsed once here
+        domain = urlparse(url).netloc.removeprefix('www.')
+        submission_data = self.generate_submission_data(url, domain, site_analysis, metadata)
         
         # Find appropriate directories
-        suitable_directories = await self.find_suitable_directories(site_analysis)
+        directories = self.find_suitable_directories(site_analysis)
+        
+        # Submissions are independent, so run them together under a cap
+        semaphore = asyncio.Semaphore(self.config.max_concurrent_submissions)
+        outcomes = await asyncio.gather(
+            *(self._submit_with_jitter(semaphore, url, directory_info, submission_data, i)
+              for i, directory_info in enumerate(directories)),
+            return_exceptions=True
+        )
         
         results = []
-        for directory_info in suitable_directories[:5]:  # Limit to top 5 directories
-            try:
-                result = await self.submit_to_directory(url, directory_info, submission_data)
-                results.append(result)
-                
-                # Respect submission intervals
-                await self.browser_manager.human_like_delay('slow')
-                
-            except Exception as e:
-                self.logger.error(f"Failed to submit to directory {directory_info['url']}: {str(e)}")
-                results.append({
-                    'directory': directory_info['url'],
+        for directory_info, outcome in zip(directories, outcomes):
+            if isinstance(outcome, Exception):
+                self.logger.error(f"Failed to submit to directory {directory_info.url}: {str(outcome)}")
+                outcome = {
+                    'directory': directory_info.url,
                     'success': False,
-                    'error': str(e)
-                })
+                    'error': str(outcome)
+                }
+            results.append(outcome)
         
         overall_success = any(result.get('success', False) for result in results)
         
@@ -160,10 +277,19 @@ class DirectorySubmissionEngine(IndexingMethodBase):
             'success': overall_success,
             'directory_results': results,
             'site_category': site_analysis.get('category', 'general'),
-            'submission_data': submission_data,
+            'submission_data': submission_data.as_dict(),
             'timestamp': datetime.now().isoformat()
         }
     
+    async def _submit_with_jitter(self, semaphore: asyncio.Semaphore, url: str, directory_info: DirectoryEntry,
+                                  submission_data: SubmissionData, position: int) -> Dict[str, Any]:
+        """Submit to one directory after a staggered start"""
+        # Respect submission intervals: starts are spread out rather than in lockstep
+        await asyncio.sleep(position * random.uniform(1, 3))
+        
+        async with semaphore:
+            return await self.submit_to_directory(url, directory_info, submission_data)
+    
     async def analyze_website_for_categorization(self, url: str) -> Dict[str, Any]:
         """Analyze website to determine appropriate directory category"""
         analysis = {
@@ -175,134 +301,169 @@ class DirectorySubmissionEngine(IndexingMethodBase):
             'contact_info': {}
         }
         
+        # A plain HTTP fetch covers most sites; only fall back to a browser
+        # when the page needs JavaScript to render any content
+        html = '' if self.config.require_js_rendering else await self._fetch_page(url)
+        if html:
+            title, description, keywords_content, body_text = parse_page(html)
+            if body_text.strip():
+                analysis['title'] = title
+                analysis['description'] = description
+                analysis['keywords'] = [kw.strip() for kw in keywords_content.split(',') if kw.strip()]
+                self._categorize(body_text[:_CATEGORY_SAMPLE_CHARS].lower(), analysis)
+                self._extract_contact_info(html, analysis)
+                return analysis
+        
+        await self._analyze_with_browser(url, analysis)
+        return analysis
+    
+    async def _analyze_with_browser(self, url: str, analysis: Dict[str, Any]):
+        """Analyze a JavaScript-rendered page in a stealth browser"""
         try:
-            driver = self.browser_manager.create_stealth_browser()
-            driver.get(url)
-            await asyncio.sleep(3)
-            
-            # Extract basic information
-            try:
-                analysis['title'] = driver.title or ''
-                
-                # Meta description
-                meta_desc = driver.find_element("css selector", "meta[name='description']")
-                analysis['description'] = meta_desc.get_attribute('content') or ''
+            async with self.browser_manager.browser_pool.acquire() as driver:
+                await self._navigate(driver, url)
                 
-                # Meta keywords
+                # Extract basic information
                 try:
-                    meta_keywords = driver.find_element("css selector", "meta[name='keywords']")
-                    keywords_content = meta_keywords.get_attribute('content') or ''
-                    analysis['keywords'] = [kw.strip() for kw in keywords_content.split(',') if kw.strip()]
-                except:
-                    pass
-                
-            except Exception as e:
-                self.logger.debug(f"Meta extraction failed: {str(e)}")
-            
-            # Analyze content for category determination
-            try:
-                body_text = driver.find_element("tag name", "body").text.lower()
+                    analysis['title'] = driver.title or ''
+                    
+                    # Meta description
+                    meta_desc = driver.find_element("css selector", "meta[name='description']")
+                    analysis['description'] = meta_desc.get_attribute('content') or ''
+                    
+                    # Meta keywords
+                    try:
+                        meta_keywords = driver.find_element("css selector", "meta[name='keywords']")
+                        keywords_content = meta_keywords.get_attribute('content') or ''
+                        analysis['keywords'] = [kw.strip() for kw in keywords_content.split(',') if kw.strip()]
+                    except:
+                        pass
                 
-                # Category scoring
-                category_scores = {
-                    'technology': self._count_keywords(body_text, [
-                        'software', 'technology', 'development', 'programming', 'digital',
-                        'tech', 'app', 'platform', 'system', 'solution'
-                    ]),
-                    'business': self._count_keywords(body_text, [
-                        'business', 'company', 'service', 'consulting', 'marketing',
-                        'sales', 'corporate', 'professional', 'commercial'
-                    ]),
-                    'health': self._count_keywords(body_text, [
-                        'health', 'medical', 'healthcare', 'fitness', 'wellness',
-                        'doctor', 'clinic', 'treatment', 'therapy'
-                    ]),
-                    'education': self._count_keywords(body_text, [
-                        'education', 'learning', 'course', 'training', 'tutorial',
-                        'school', 'university', 'academic', 'study'
-                    ]),
-                    'lifestyle': self._count_keywords(body_text, [
-                        'lifestyle', 'travel', 'food', 'entertainment', 'culture',
-                        'recreation', 'hobby', 'fashion', 'art'
-                    ])
-                }
+                except Exception as e:
+                    self.logger.debug(f"Meta extraction failed: {str(e)}")
                 
-                if category_scores:
-                    best_category = max(category_scores.items(), key=lambda x: x[1])
-                    if best_category[1] > 0:
-                        analysis['category'] = best_category[0]
+                # Analyze content for category determination
+                try:
+                    body_text = driver.find_element("tag name", "body").text[:_CATEGORY_SAMPLE_CHARS].lower()
+                    self._categorize(body_text, analysis)
+                except Exception as e:
+                    self.logger.debug(f"Content analysis failed: {str(e)}")
                 
-            except Exception as e:
-                self.logger.debug(f"Content analysis failed: {str(e)}")
+                self._extract_contact_info(driver.page_source, analysis)
+        
+        except Exception as e:
+            self.logger.error(f"Website analysis failed: {str(e)}")
+    
+    def _categorize(self, body_text: str, analysis: Dict[str, Any]):
+        """Pick the category whose keywords appear most in the lowercased body text"""
+        # Category scoring: how often each category's keywords occur
+        if self._keyword_automaton is not None:
+            category_scores = dict.fromkeys(_CATEGORY_KEYWORDS, 0)
+            for _, (category, _) in self._keyword_automaton.iter(body_text):
+                category_scores[category] += 1
+        elif _jit_category_scores is not None:
+            scores = _jit_category_scores(
+                np.frombuffer(body_text.encode('utf-8'), dtype=np.uint8),
+                _KEYWORD_BYTES, _KEYWORD_OFFSETS, _KEYWORD_CATEGORIES, _KEYWORD_BUCKETS,
+                len(_CATEGORY_KEYWORDS)
+            )
+            category_scores = dict(zip(_CATEGORY_KEYWORDS, scores.tolist()))
+        else:
+            category_scores = {
+                category: self._count_keywords(body_text, keywords)
+                for category, keywords in _CATEGORY_KEYWORDS.items()
+            }
+        
+        if category_scores:
+            best_category = max(category_scores.items(), key=lambda x: x[1])
+            if best_category[1] > 0:
+                analysis['category'] = best_category[0]
+    
+    def _extract_contact_info(self, page_source: str, analysis: Dict[str, Any]):
+        """Pull the first email address and phone number out of the page source"""
+        try:
+            contact_info = {}
+            page_source = page_source[:_CONTACT_SAMPLE_CHARS]
             
-            # Extract contact information
-            try:
-                contact_info = {}
-                
-                # Look for email addresses
-                import re
-                email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-                emails = re.findall(email_pattern, driver.page_source)
-                if emails:
-                    contact_info['email'] = emails[0]
-                
-                # Look for phone numbers (simplified)
-                phone_pattern = r'\b\d{3}[-.]?\d{3}[-.]?\d{4}\b'
-                phones = re.findall(phone_pattern, driver.page_source)
-                if phones:
-                    contact_info['phone'] = phones[0]
-                
-                analysis['contact_info'] = contact_info
-                
-            except Exception as e:
-                self.logger.debug(f"Contact extraction failed: {str(e)}")
+            # Look for email addresses; only the first match is kept
+            email = _EMAIL_RE.search(page_source)
+            if email:
+                contact_info['email'] = email.group()
             
-            driver.quit()
+            # Look for phone numbers (simplified)
+            phone = _PHONE_RE.search(page_source)
+            if phone:
+                contact_info['phone'] = phone.group()
             
+            analysis['contact_info'] = contact_info
+        
         except Exception as e:
-            self.logger.error(f"Website analysis failed: {str(e)}")
+            self.logger.debug(f"Contact extraction failed: {str(e)}")
+    
+    @staticmethod
+    def _build_keyword_automaton():
+        """Build an Aho-Corasick automaton over the category keywords, if available"""
+        if ahocorasick is None:
+            return None
         
-        return analysis
+        automaton = ahocorasick.Automaton()
+        for category, keywords in _CATEGORY_KEYWORDS.items():
+            for keyword in keywords:
+                automaton.add_word(keyword, (category, keyword))
+        automaton.make_automaton()
+        return automaton
     
-    def _count_keywords(self, text: str, keywords: List[str]) -> int:
+    def _count_keywords(self, text: str, keywords: Tuple[str, ...]) -> int:
         """Count occurrences of keywords in text"""
-        return sum(1 for keyword in keywords if keyword in text)
+        return sum(text.count(keyword) for keyword in keywords)
     
-    async def generate_submission_data(self, url: str, site_analysis: Dict[str, Any], metadata: Dict[str, Any] = None) -> Dict[str, str]:
-        """Generate submission data for directory forms"""
+    def generate_submission_data(self, url: str, domain: str, site_analysis: Dict[str, Any],
+                                 metadata: Dict[str, Any] = None) -> SubmissionData:
+        """Generate submission data for directory forms; domain feeds the default title and email"""
         metadata = metadata or {}
         
-        # Extract domain name for default title
-        from urllib.parse import urlparse
-        domain = urlparse(url).netloc.replace('www.', '')
-        
-        submission_data = {
-            'url': url,
-            'title': site_analysis.get('title') or metadata.get('title') or domain.title(),
-            'description': site_analysis.get('description') or metadata.get('description') or 
-                         f"Professional website offering quality services and solutions. Visit {domain} for more information.",
-            'keywords': ', '.join(site_analysis.get('keywords', [])[:10]) or metadata.get('keywords', ''),
-            'category': site_analysis.get('category', 'business'),
-            'contact_email': site_analysis.get('contact_info', {}).get('email') or 
-                           metadata.get('contact_email', f'admin@{domain}'),
-            'contact_name': metadata.get('contact_name', 'Website Administrator')
-        }
+        description = (
+            site_analysis.get('description') or metadata.get('description') or
+            f"Professional website offering quality services and solutions. Visit {domain} for more information."
+        )
         
         # Ensure description is appropriate length (usually 25-250 characters)
-        if len(submission_data['description']) < 25:
-            submission_data['description'] = f"{submission_data['description']} Quality services and professional solutions available at {domain}."
-        elif len(submission_data['description']) > 250:
-            submission_data['description'] = submission_data['description'][:247] + '...'
+        if len(description) < 25:
+            description = f"{description} Quality services and professional solutions available at {domain}."
+        elif len(description) > 250:
+            description = description[:247] + '...'
         
-        return submission_data
+        return SubmissionData(
+            url=url,
+            title=site_analysis.get('title') or metadata.get('title') or domain.title(),
+            description=description,
+            keywords=', '.join(site_analysis.get('keywords', [])[:10]) or metadata.get('keywords', ''),
+            category=site_analysis.get('category', 'business'),
+            contact_email=site_analysis.get('contact_info', {}).get('email') or
+                          metadata.get('contact_email', f'admin@{domain}'),
+            contact_name=metadata.get('contact_name', 'Website Administrator')
+        )
     
-    async def find_suitable_directories(self, site_analysis: Dict[str, Any]) -> List[Dict[str, Any]]:
-        """Find directories suitable for the website"""
+    def find_suitable_directories(self, site_analysis: Dict[str, Any]) -> Tuple[DirectoryEntry, ...]:
+        """Find the top directories suitable for the website"""
         category = site_analysis.get('category', 'business')
+        directories = self._sorted_by_category.get(category)
+        # An empty ranking is a valid cached answer; only unknown categories are ranked here
+        if directories is None:
+            directories = self._rank_directories(category)
+        return directories
+    
+    def _rank_directories(self, category: str) -> Tuple[DirectoryEntry, ...]:
+        """Flatten the directory platforms and keep the most suitable for a category"""
         suitable_directories = []
+        min_authority_score = self.config.min_authority_score
         
-        # Select directories based on category and quality
+        # Select directories based on category and quality; authority is set
+        # per platform type, so a type below the threshold is skipped whole
         for directory_type, directory_config in self.directory_platforms.items():
+            if directory_config['authority_score'] < min_authority_score:
+                continue
+            
             for directory_url in directory_config['directories']:
                 
                 # Calculate suitability score
@@ -312,71 +473,70 @@ class DirectorySubmissionEngine(IndexingMethodBase):
                 if category in directory_type or 'niche' in directory_type:
                     suitability_score += 10
                 
-                suitable_directories.append({
-                    'url': directory_url,
-                    'type': directory_type,
-                    'authority_score': directory_config['authority_score'],
-                    'submission_type': directory_config['submission_type'],
-                    'suitability_score': suitability_score,
-                    'category_based': directory_config['category_based']
-                })
+                suitable_directories.append(DirectoryEntry(
+                    url=directory_url,
+                    type=directory_type,
+                    authority_score=directory_config['authority_score'],
+                    submission_type=directory_config['submission_type'],
+                    suitability_score=suitability_score,
+                    category_based=directory_config['category_based']
+                ))
         
         # Sort by suitability score
-        suitable_directories.sort(key=lambda x: x['suitability_score'], reverse=True)
+        suitable_directories.sort(key=lambda x: x.suitability_score, reverse=True)
         
-        return suitable_directories
+        return tuple(suitable_directories[:5])  # Limit to top 5 directories
     
-    async def submit_to_directory(self, url: str, directory_info: Dict[str, Any], submission_data: Dict[str, str]) -> Dict[str, Any]:
-        """Submit website to a specific directory"""
+    async def submit_to_directory(self, url: str, directory_info: DirectoryEntry, submission_data: SubmissionData,
+                                  driver=None) -> Dict[str, Any]:
+        """Submit website to a specific directory, in the caller's browser or a pooled one"""
         try:
             # In mock mode, just simulate the submission
             if hasattr(self.config, 'mock_mode') and self.config.mock_mode:
                 await asyncio.sleep(random.uniform(2, 5))  # Simulate form filling time
                 
-                self.logger.info(f"[MOCK] Would submit to directory: {directory_info['url']}")
+                self.logger.info(f"[MOCK] Would submit to directory: {directory_info.url}")
                 return {
-                    'directory': directory_info['url'],
+                    'directory': directory_info.url,
                     'success': True,
-                    'submission_type': directory_info['submission_type'],
-                    'authority_score': directory_info['authority_score'],
+                    'submission_type': directory_info.submission_type,
+                    'authority_score': directory_info.authority_score,
                     'mock_mode': True,
-                    'submission_data': submission_data
+                    'submission_data': submission_data.as_dict()
                 }
             
+            if driver is None:
+                # Borrow a warm browser shared across URLs rather than launching one
+                async with self.browser_manager.browser_pool.acquire() as pooled_driver:
+                    return await self.submit_to_directory(url, directory_info, submission_data, pooled_driver)
+            
             # Actual submission implementation would go here
-            driver = self.browser_manager.create_stealth_browser()
+            # Navigate to directory
+            await self._navigate(driver, directory_info.url)
             
-            try:
-                # Navigate to directory
-                driver.get(directory_info['url'])
-                await asyncio.sleep(random.uniform(2, 4))
-                
-                # Look for submission form or "Add URL" link
-                submission_form = await self.find_submission_form(driver)
-                
-                if not submission_form:
-                    return {
-                        'directory': directory_info['url'],
-                        'success': False,
-                        'error': 'Submission form not found'
-                    }
-                
-                # Fill and submit form
-                success = await self.fill_submission_form(driver, submission_data, directory_info)
-                
+            # Look for submission form or "Add URL" link
+            submission_form = await self.find_submission_form(driver)
+            
+            if not submission_form:
                 return {
-                    'directory': directory_info['url'],
-                    'success': success,
-                    'submission_type': directory_info['submission_type'],
-                    'authority_score': directory_info['authority_score']
+                    'directory': directory_info.url,
+                    'success': False,
+                    'error': 'Submission form not found'
                 }
-                
-            finally:
-                driver.quit()
             
+            # Fill and submit form
+            success = await self.fill_submission_form(driver, submission_data, directory_info)
+            
+            return {
+                'directory': directory_info.url,
+                'success': success,
+                'submission_type': directory_info.submission_type,
+                'authority_score': directory_info.authority_score
+            }
+        
         except Exception as e:
             return {
-                'directory': directory_info['url'],
+                'directory': directory_info.url,
                 'success': False,
                 'error': str(e)
             }
@@ -412,56 +572,37 @@ class DirectorySubmissionEngine(IndexingMethodBase):
                 return True
             
             return False
-            
+        
         except Exception as e:
             self.logger.debug(f"Form finding failed: {str(e)}")
             return False
     
-    async def fill_submission_form(self, driver, submission_data: Dict[str, str], directory_info: Dict[str, Any]) -> bool:
+    async def fill_submission_form(self, driver, submission_data: SubmissionData, directory_info: DirectoryEntry) -> bool:
         """Fill out the directory submission form"""
         try:
+            # Fetch every candidate field in one round-trip and match it locally
+            # rather than probing selector by selector
+            fields = self._match_form_fields(
+                driver.find_elements("css selector", "input[name], textarea[name], select[name]")
+            )
+            
             # Find and fill form fields
-            for data_key, value in submission_data.items():
+            for data_key, value in submission_data.as_dict().items():
                 if not value:
                     continue
                 
-                possible_field_names = self.form_field_mappings.get(data_key, [data_key])
-                
-                field_filled = False
-                for field_name in possible_field_names:
+                field = fields.get(data_key)
+                if field is not None:
                     try:
-                        # Try different field selectors
-                        field_selectors = [
-                            f"input[name='{field_name}']",
-                            f"textarea[name='{field_name}']",
-                            f"select[name='{field_name}']",
-                            f"#{field_name}",
-                            f".{field_name}"
-                        ]
-                        
-                        for selector in field_selectors:
-                            try:
-                                field = driver.find_element("css selector", selector)
-                                
-                                if field.tag_name.lower() == 'select':
-                                    # Handle select fields (categories)
-                                    await self.handle_category_selection(field, value, submission_data.get('category'))
-                                else:
-                                    # Regular input/textarea
-                                    field.clear()
-                                    await self.browser_manager.human_like_typing(field, value)
-                                
-                                field_filled = True
-                                break
-                                
-                            except:
-                                continue
-                        
-                        if field_filled:
-                            break
-                            
+                        if field.tag_name.lower() == 'select':
+                            # Handle select fields (categories)
+                            await self.handle_category_selection(field, value, submission_data.category)
+                        else:
+                            # Regular input/textarea
+                            field.clear()
+                            await self.browser_manager.human_like_typing(field, value)
                     except Exception as e:
-                        continue
+                        self.logger.debug(f"Could not fill {data_key} field: {str(e)}")
                 
                 # Brief pause between fields
                 await asyncio.sleep(random.uniform(0.5, 1.5))
@@ -484,58 +625,71 @@ class DirectorySubmissionEngine(IndexingMethodBase):
                     continue
             
             return False
-            
+        
         except Exception as e:
             self.logger.error(f"Form filling failed: {str(e)}")
             return False
     
+    def _match_form_fields(self, elements) -> Dict[str, Any]:
+        """Map each data key to its best form element by name, preferring earlier aliases"""
+        # Matching on name alone keeps it to one attribute read per element;
+        # ids and classes seldom carry the semantic field names
+        best = {}
+        for element in elements:
+            field_name = element.get_attribute('name') or ''
+            if not field_name:
+                continue
+            # Unmapped names can still match a data key of the same name
+            data_key, rank = self._field_name_to_key.get(field_name, (field_name, 0))
+            if data_key not in best or rank < best[data_key][0]:
+                best[data_key] = (rank, element)
+        
+        return {data_key: element for data_key, (_, element) in best.items()}
+    
     async def handle_category_selection(self, select_element, value: str, category: str):
         """Handle category selection in dropdown"""
         try:
             from selenium.webdriver.support.ui import Select
             select = Select(select_element)
             
-            # Get available options
-            options = [option.text.lower() for option in select.options]
+            # Read every option from one innerHTML fetch instead of a
+            # webdriver round-trip per option; opt_value is None when the
+            # option has no value attribute, since it submits its text instead
+            options = []
+            for option in BeautifulSoup(select_element.get_attribute('innerHTML') or '', 'html.parser').find_all('option'):
+                text = ' '.join(option.get_text().split())
+                options.append((option.get('value'), text))
+            
+            # Keyed by lowercase text in document order; the first duplicate wins
+            options_lc = {}
+            for opt_value, text in options:
+                options_lc.setdefault(text.lower(), (opt_value, text))
             
             # Find best matching category
             category_matches = self.directory_categories.get(category, [])
             
             best_match = None
             for cat_option in category_matches:
-                for option_text in options:
-                    if cat_option.lower() in option_text:
-                        best_match = option_text
-                        break
-                if best_match:
+                cat_option = cat_option.lower()
+                best_match = next((option for text, option in options_lc.items() if cat_option in text), None)
+                if best_match is not None:
                     break
             
-            if best_match:
-                select.select_by_visible_text(best_match)
-            else:
-                # Select first non-empty option
-                if len(select.options) > 1:
-                    select.select_by_index(1)
+            # Select first non-empty option when nothing matches
+            if best_match is None and len(options) > 1:
+                best_match = options[1]
             
+            if best_match is not None:
+                opt_value, text = best_match
+                if opt_value is None:
+                    select.select_by_visible_text(text)
+                else:
+                    select.select_by_value(opt_value)
+        
         except Exception as e:
             self.logger.debug(f"Category selection failed: {str(e)}")
     
     def get_directory_stats(self) -> Dict[str, Any]:
         """Get statistics about available directories"""
-        total_directories = sum(
-            len(config['directories']) 
-            for config in self.directory_platforms.values()
-        )
-        
-        avg_authority = sum(
-            config['authority_score'] 
-            for config in self.directory_platforms.values()
-        ) / len(self.directory_platforms)
-        
-        return {
-            'total_directories': total_directories,
-            'directory_types': list(self.directory_platforms.keys()),
-            'categories': list(self.directory_categories.keys()),
-            'average_authority_score': avg_authority,
-            'form_fields': list(self.form_field_mappings.keys())
-        }
\ No newline at end of file
+        # Directory tables are fixed after construction, so the stats are computed once
+        return dict(self._stats)
\ No newline at end of file
@@ -5,14 +5,35 @@ Advanced forum commenting engine for contextual backlink creation
 import asyncio
 import random
 import logging
+import time
+from collections import OrderedDict
 from typing import Dict, Any, List, Optional
 from datetime import datetime
-from .base import IndexingMethodBase
+from urllib.parse import urldefrag
+from .base import IndexingMethodBase, parse_page
+
+try:
+    import ahocorasick
+except ImportError:  # pyahocorasick is optional; per-keyword substring checks are the fallback
+    ahocorasick = None
+
+# Natural variations of a comment: (prefix, suffix, lowercase the comment)
+_COMMENT_VARIATIONS = (
+    ('Actually, ', '', True),
+    ('', ' Hope this helps!', False),
+    ('', ' Thanks for bringing this up.', False),
+    ('', '', False),  # No modification
+    ('Interesting topic! ', '', False)
+)
 
 
 class ForumCommentingEngine(IndexingMethodBase):
     """Advanced forum commenting automation with contextual relevance"""
     
+    # Recent content analyses are reused: target URLs repeat across runs
+    _ANALYSIS_CACHE_SIZE = 1024
+    _ANALYSIS_CACHE_TTL = 3600.0  # seconds
+    
     def __init__(self, config, browser_manager):
         super().__init__(config, browser_manager)
         
@@ -90,6 +111,12 @@ class ForumCommentingEngine(IndexingMethodBase):
             ]
         }
         
+        # Templates pre-split around {url}, so comments are joined rather than formatted
+        self._compiled_templates = {
+            strategy: [tuple(template.split('{url}')) for template in templates]
+            for strategy, templates in self.comment_templates.items()
+        }
+        
         # Content analysis keywords for context matching
         self.content_keywords = {
             'tech': ['technology', 'software', 'programming', 'development', 'coding', 'algorithm'],
@@ -99,10 +126,19 @@ class ForumCommentingEngine(IndexingMethodBase):
             'education': ['learning', 'course', 'tutorial', 'guide', 'study', 'academic'],
             'lifestyle': ['travel', 'food', 'culture', 'entertainment', 'hobby', 'lifestyle']
         }
+        
+        # One automaton finds every content keyword in a single pass over the text
+        self._keyword_automaton = self._build_keyword_automaton()
+        
+        # Canonical URL -> (expiry on the monotonic clock, analysis), least recent first
+        self._analysis_cache = OrderedDict()
+        
+        # Platform -> (tokens left, loop time of last refill); one bucket per platform rate limit
+        self._platform_buckets = {}
     
     async def process_url(self, url: str, metadata: Dict[str, Any] = None) -> Dict[str, Any]:
         """Process URL for forum commenting placement"""
-        if not await self.validate_url(url):
+        if not self.validate_url(url):
             return {
                 'url': url,
                 'method': 'forum_commenting',
@@ -117,22 +153,21 @@ class ForumCommentingEngine(IndexingMethodBase):
         # Find relevant forums and posts
         relevant_opportunities = await self.find_relevant_posting_opportunities(content_analysis)
         
-        results = []
-        for opportunity in relevant_opportunities[:3]:  # Limit to top 3 opportunities
-            try:
-                result = await self.create_contextual_comment(url, opportunity, content_analysis)
-                results.append(result)
-                
-                # Respect rate limits
-                await self.browser_manager.human_like_delay('slow')
-                
-            except Exception as e:
-                self.logger.error(f"Failed to comment on {opportunity['platform']}: {str(e)}")
-                results.append({
+        # Platforms are rate limited independently, so opportunities run concurrently
+        opportunities = relevant_opportunities[:3]  # Limit to top 3 opportunities
+        results = await asyncio.gather(
+            *(self._comment_with_limit(url, opportunity, content_analysis) for opportunity in opportunities),
+            return_exceptions=True
+        )
+        
+        for index, (opportunity, result) in enumerate(zip(opportunities, results)):
+            if isinstance(result, Exception):
+                self.logger.error(f"Failed to comment on {opportunity['platform']}: {str(result)}")
+                results[index] = {
                     'platform': opportunity['platform'],
                     'success': False,
-                    'error': str(e)
-                })
+                    'error': str(result)
+                }
         
         overall_success = any(result.get('success', False) for result in results)
         
@@ -145,8 +180,39 @@ class ForumCommentingEngine(IndexingMethodBase):
             'timestamp': datetime.now().isoformat()
         }
     
+    async def _comment_with_limit(self, target_url: str, opportunity: Dict[str, Any],
+                                  content_analysis: Dict[str, Any]) -> Dict[str, Any]:
+        """Post a comment once its platform's rate limit allows"""
+        # Mock comments are never posted, so they skip the hourly limits
+        if not self.config.mock_mode:
+            await self._wait_for_platform_token(opportunity['platform'])
+        return await self.create_contextual_comment(target_url, opportunity, content_analysis)
+    
+    async def _wait_for_platform_token(self, platform: str):
+        """Take a token from the platform's bucket of rate_limit comments per hour"""
+        platform_config = self.forum_platforms.get(platform)
+        rate_limit = platform_config['rate_limit'] if platform_config else 0
+        if rate_limit <= 0:
+            return
+        
+        # Refill, then take a token; a negative balance reserves a future token so concurrent callers queue up
+        refill_rate = rate_limit / 3600.0
+        now = asyncio.get_running_loop().time()
+        tokens, refilled_at = self._platform_buckets.get(platform, (rate_limit, now))
+        tokens = min(rate_limit, tokens + (now - refilled_at) * refill_rate) - 1
+        self._platform_buckets[platform] = (tokens, now)
+        
+        if tokens < 0:
+            await asyncio.sleep(-tokens / refill_rate)
+    
     async def analyze_url_content(self, url: str) -> Dict[str, Any]:
-        """Analyze URL content to determine context and category"""
+        """Analyze URL content to determine context and category, reusing recent analyses"""
+        cache_key = urldefrag(url).url
+        cached = self._analysis_cache.get(cache_key)
+        if cached is not None and cached[0] > time.monotonic():
+            self._analysis_cache.move_to_end(cache_key)
+            return {**cached[1], 'keywords': list(cached[1]['keywords'])}
+        
         analysis = {
             'category': 'general',
             'keywords': [],
@@ -155,54 +221,119 @@ class ForumCommentingEngine(IndexingMethodBase):
             'relevance_score': 0.5
         }
         
+        # Mock mode never touches the network or a browser
+        if self.config.mock_mode:
+            return analysis
+        
+        # A plain HTTP fetch covers static pages; only JavaScript-rendered
+        # pages need a browser. Failed analyses are not cached
+        if await self._analyze_static(url, analysis) or await self._analyze_with_browser(url, analysis):
+            self._cache_analysis(cache_key, analysis)
+        
+        return analysis
+    
+    def _cache_analysis(self, cache_key: str, analysis: Dict[str, Any]):
+        """Remember an analysis for the TTL, evicting the least recently used"""
+        self._analysis_cache[cache_key] = (
+            time.monotonic() + self._ANALYSIS_CACHE_TTL,
+            {**analysis, 'keywords': list(analysis['keywords'])}
+        )
+        self._analysis_cache.move_to_end(cache_key)
+        while len(self._analysis_cache) > self._ANALYSIS_CACHE_SIZE:
+            self._analysis_cache.popitem(last=False)
+    
+    async def _analyze_static(self, url: str, analysis: Dict[str, Any]) -> bool:
+        """Analyze the page from a plain fetch; False if it has no static content"""
+        html = await self._fetch_page(url)
+        if not html:
+            return False
+        
+        title, description, _, body_text = parse_page(html)
+        if not body_text.strip():
+            return False
+        
+        analysis['title'] = title
+        analysis['description'] = description
+        self._score_content(body_text.lower(), analysis)
+        return True
+    
+    async def _analyze_with_browser(self, url: str, analysis: Dict[str, Any]) -> bool:
+        """Analyze a JavaScript-rendered page in a pooled browser"""
         try:
-            # Create browser instance for content analysis
-            driver = self.browser_manager.create_stealth_browser()
-            
-            # Navigate to URL
-            driver.get(url)
-            await asyncio.sleep(2)
-            
-            # Extract title and meta description
-            try:
-                analysis['title'] = driver.title or ''
-                
-                meta_desc = driver.find_element("css selector", "meta[name='description']")
-                analysis['description'] = meta_desc.get_attribute('content') or ''
-            except:
-                pass
-            
-            # Extract text content for keyword analysis
-            try:
-                body_text = driver.find_element("tag name", "body").text.lower()
-                
-                # Categorize content based on keywords
-                category_scores = {}
-                for category, keywords in self.content_keywords.items():
-                    score = sum(1 for keyword in keywords if keyword in body_text)
-                    if score > 0:
-                        category_scores[category] = score
+            # Borrow a warm browser from the shared pool rather than launching one
+            async with self.browser_manager.browser_pool.acquire() as driver:
+                await self._navigate(driver, url)
                 
-                if category_scores:
-                    analysis['category'] = max(category_scores.items(), key=lambda x: x[1])[0]
-                    analysis['relevance_score'] = min(max(category_scores.values()) / 10.0, 1.0)
+                # Extract title and meta description
+                try:
+                    analysis['title'] = driver.title or ''
+                    
+                    meta_desc = driver.find_element("css selector", "meta[name='description']")
+                    analysis['description'] = meta_desc.get_attribute('content') or ''
+                except:
+                    pass
                 
-                # Extract most relevant keywords
-                found_keywords = []
-                for category, keywords in self.content_keywords.items():
-                    found_keywords.extend([kw for kw in keywords if kw in body_text])
-                
-                analysis['keywords'] = found_keywords[:10]  # Top 10 keywords
-                
-            except Exception as e:
-                self.logger.debug(f"Content extraction failed: {str(e)}")
-            
-            driver.quit()
+                # Extract text content for keyword analysis
+                try:
+                    body_text = driver.find_element("tag name", "body").text.lower()
+                    self._score_content(body_text, analysis)
+                    return True
+                except Exception as e:
+                    self.logger.debug(f"Content extraction failed: {str(e)}")
             
         except Exception as e:
             self.logger.error(f"URL content analysis failed: {str(e)}")
         
-        return analysis
+        return False
+    
+    def _build_keyword_automaton(self):
+        """Build an Aho-Corasick automaton over the content keywords, if available"""
+        if ahocorasick is None:
+            return None
+        
+        automaton = ahocorasick.Automaton()
+        for keywords in self.content_keywords.values():
+            for keyword in keywords:
+                automaton.add_word(keyword, keyword)
+        automaton.make_automaton()
+        return automaton
+    
+    def _find_keywords(self, body_text: str) -> set:
+        """Every content keyword that occurs in the text"""
+        if self._keyword_automaton is not None:
+            return {keyword for _, keyword in self._keyword_automaton.iter(body_text)}
+        return {
+            keyword
+            for keywords in self.content_keywords.values()
+            for keyword in keywords
+            if keyword in body_text
+        }
+    
+    def _score_content(self, body_text: str, analysis: Dict[str, Any]):
+        """Categorize lowercased body text and collect the keywords it mentions"""
+        # Scan the text once; scoring and extraction both read the found set
+        found = self._find_keywords(body_text)
+        
+        # Categorize content based on keywords
+        category_scores = {}
+        for category, keywords in self.content_keywords.items():
+            score = sum(1 for keyword in keywords if keyword in found)
+            if score > 0:
+                category_scores[category] = score
+        
+        if category_scores:
+            analysis['category'] = max(category_scores.items(), key=lambda x: x[1])[0]
+            analysis['relevance_score'] = min(max(category_scores.values()) / 10.0, 1.0)
+        
+        # Extract most relevant keywords, in keyword-table order
+        found_keywords = [
+            keyword
+            for keywords in self.content_keywords.values()
+            for keyword in keywords
+            if keyword in found
+        ]
+        
+        analysis['keywords'] = found_keywords[:10]  # Top 10 keywords
     
     async def find_relevant_posting_opportunities(self, content_analysis: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Find relevant forum posts and discussions for commenting"""
@@ -313,27 +444,17 @@ class ForumCommentingEngine(IndexingMethodBase):
     
     def generate_contextual_comment(self, url: str, strategy: str, content_analysis: Dict[str, Any]) -> str:
         """Generate a contextual comment based on strategy and content analysis"""
-        templates = self.comment_templates.get(strategy, self.comment_templates['contextual_discussion'])
+        templates = self._compiled_templates.get(strategy, self._compiled_templates['contextual_discussion'])
         
-        # Select random template
-        template = random.choice(templates)
-        
-        # Fill in the URL
-        comment = template.format(url=url)
+        # Select random template and fill in the URL
+        comment = url.join(random.choice(templates))
         
         # Add natural variations
-        variations = [
-            lambda text: f"Actually, {text.lower()}",
-            lambda text: f"{text} Hope this helps!",
-            lambda text: f"{text} Thanks for bringing this up.",
-            lambda text: text,  # No modification
-            lambda text: f"Interesting topic! {text}"
-        ]
-        
-        variation_func = random.choice(variations)
-        final_comment = variation_func(comment)
+        prefix, suffix, lowercase = random.choice(_COMMENT_VARIATIONS)
+        if lowercase:
+            comment = comment.lower()
         
-        return final_comment
+        return prefix + comment + suffix
     
     async def validate_posting_opportunity(self, opportunity: Dict[str, Any]) -> bool:
         """Validate that a posting opportunity is still available and appropriate"""
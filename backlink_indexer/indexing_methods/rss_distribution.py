@@ -4,12 +4,65 @@ RSS Feed Distribution Engine
 
 import asyncio
 import aiohttp
-import xml.etree.ElementTree as ET
 from typing import Dict, Any, List
 from datetime import datetime, timedelta
 import hashlib
 import os
+import re
+from functools import lru_cache
+from urllib.parse import urlparse
+from xml.sax.saxutils import escape
 from .base import IndexingMethodBase
+from ..core.http_session import use_session
+from ..core.rate_limit import SlotRateLimiter
+
+# RSS dates, e.g. 'Sat, 17 Oct 2026 12:00:00 GMT'
+_RSS_DATE_FORMAT = '%a, %d %b %Y %H:%M:%S GMT'
+
+# Feeds always have the same shape, so they are rendered from prebuilt
+# templates; only escaped per-feed values are substituted
+_FEED_TEMPLATE = (
+    "<?xml version='1.0' encoding='utf-8'?>\n"
+    '<rss version="2.0"><channel>'
+    '<title>{title}</title><link>{link}</link><description>{description}</description>'
+    '<language>en-us</language><lastBuildDate>{date}</lastBuildDate>'
+    '{items}</channel></rss>'
+)
+_ITEM_TEMPLATE = (
+    '<item><title>{title}</title><link>{link}</link><description>{description}</description>'
+    '<pubDate>{date}</pubDate><guid>{link}</guid></item>'
+)
+
+# Additional items to make feeds look natural, serialized once around their date
+_FILLER_ITEMS = (
+    ('Industry News and Updates', 'Latest developments in the industry', 'https://example.com/news'),
+    ('Best Practices Guide', 'Comprehensive guide to best practices', 'https://example.com/guide'),
+    ('Resource Collection', 'Useful resources and tools', 'https://example.com/resources')
+)
+_DATE_SLOT = '\x00'
+_FILLER_ITEMS_PARTS = ''.join(
+    _ITEM_TEMPLATE.format(title=escape(title), link=escape(url), description=escape(description), date=_DATE_SLOT)
+    for title, description, url in _FILLER_ITEMS
+).split(_DATE_SLOT)
+
+# Sitemaps grow by splicing <url> blocks in before the closing tag, never by reparsing
+_SITEMAP_HEAD = (
+    "<?xml version='1.0' encoding='utf-8'?>\n"
+    '<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">'
+)
+_SITEMAP_TAIL = '</urlset>'
+_SITEMAP_ENTRY_TEMPLATE = (
+    '<url><loc>{loc}</loc><lastmod>{lastmod}</lastmod>'
+    '<changefreq>daily</changefreq><priority>0.8</priority></url>'
+)
+_SITEMAP_TAIL_WINDOW = 256  # bytes read back from the end to find the closing tag
+_SITEMAP_LOC_RE = re.compile(r'<loc>([^<]*)</loc>')
+
+
+@lru_cache(maxsize=4096)
+def _domain_of(url: str) -> str:
+    """Host of a URL without its www. prefix; feeds repeat the same URLs"""
+    return urlparse(url).netloc.replace('www.', '')
 
 
 class RSSDistributionEngine(IndexingMethodBase):
@@ -22,13 +75,16 @@ class RSSDistributionEngine(IndexingMethodBase):
             'http://www.pingler.com/ping',
             'http://feedshark.brainbliss.com/ping'
         ]
+        self.ping_limiter = SlotRateLimiter(per_second=5.0)  # per aggregator, across concurrent feeds
         self.rss_directory = 'generated_feeds'
+        # Escaped <loc> values already in the sitemap, read from disk on first use
+        self._sitemap_locs = None
         os.makedirs(self.rss_directory, exist_ok=True)
     
     async def process_url(self, url: str, metadata: Dict[str, Any] = None) -> Dict[str, Any]:
         """Create RSS feeds containing the URL and distribute them"""
         
-        if not await self.validate_url(url):
+        if not self.validate_url(url):
             return {
                 'url': url,
                 'method': 'rss_distribution',
@@ -74,90 +130,28 @@ class RSSDistributionEngine(IndexingMethodBase):
     async def generate_rss_feed(self, target_url: str, metadata: Dict = None) -> str:
         """Generate RSS feed XML containing the target URL"""
         
-        # Create RSS feed structure
-        rss = ET.Element('rss', version='2.0')
-        channel = ET.SubElement(rss, 'channel')
-        
-        # Feed metadata
-        title = ET.SubElement(channel, 'title')
-        title.text = metadata.get('title', 'Quality Content Feed')
-        
-        link = ET.SubElement(channel, 'link')
-        link.text = target_url
-        
-        description = ET.SubElement(channel, 'description')
-        description.text = metadata.get('description', 'Curated quality content and resources')
-        
-        language = ET.SubElement(channel, 'language')
-        language.text = 'en-us'
-        
-        last_build_date = ET.SubElement(channel, 'lastBuildDate')
-        last_build_date.text = datetime.now().strftime('%a, %d %b %Y %H:%M:%S GMT')
-        
-        # Create main item for target URL
-        item = ET.SubElement(channel, 'item')
-        
-        item_title = ET.SubElement(item, 'title')
-        item_title.text = self._generate_item_title(target_url, metadata)
-        
-        item_link = ET.SubElement(item, 'link')
-        item_link.text = target_url
-        
-        item_description = ET.SubElement(item, 'description')
-        item_description.text = self._generate_item_description(target_url, metadata)
-        
-        pub_date = ET.SubElement(item, 'pubDate')
-        pub_date.text = datetime.now().strftime('%a, %d %b %Y %H:%M:%S GMT')
-        
-        guid = ET.SubElement(item, 'guid')
-        guid.text = target_url
-        
-        # Add additional quality items to make feed look natural
-        await self._add_filler_items(channel, target_url)
-        
-        # Convert to string
-        return ET.tostring(rss, encoding='unicode', xml_declaration=True)
-    
-    async def _add_filler_items(self, channel: ET.Element, target_url: str):
-        """Add additional items to make feed look natural"""
-        
-        filler_items = [
-            {
-                'title': 'Industry News and Updates',
-                'description': 'Latest developments in the industry',
-                'url': 'https://example.com/news'
-            },
-            {
-                'title': 'Best Practices Guide',
-                'description': 'Comprehensive guide to best practices',
-                'url': 'https://example.com/guide'
-            },
-            {
-                'title': 'Resource Collection',
-                'description': 'Useful resources and tools',
-                'url': 'https://example.com/resources'
-            }
-        ]
-        
-        for item_data in filler_items:
-            item = ET.SubElement(channel, 'item')
-            
-            title = ET.SubElement(item, 'title')
-            title.text = item_data['title']
-            
-            link = ET.SubElement(item, 'link')
-            link.text = item_data['url']
-            
-            description = ET.SubElement(item, 'description')
-            description.text = item_data['description']
-            
-            # Make dates slightly older
-            pub_date = ET.SubElement(item, 'pubDate')
-            old_date = datetime.now() - timedelta(days=1, hours=2)
-            pub_date.text = old_date.strftime('%a, %d %b %Y %H:%M:%S GMT')
-            
-            guid = ET.SubElement(item, 'guid')
-            guid.text = item_data['url']
+        now = datetime.now()
+        pub_date = now.strftime(_RSS_DATE_FORMAT)
+        link = escape(target_url)
+        
+        # Main item for target URL
+        item = _ITEM_TEMPLATE.format(
+            title=escape(self._generate_item_title(target_url, metadata)),
+            link=link,
+            description=escape(self._generate_item_description(target_url, metadata)),
+            date=pub_date
+        )
+        
+        # Filler items are dated slightly older
+        old_date = (now - timedelta(days=1, hours=2)).strftime(_RSS_DATE_FORMAT)
+        
+        return _FEED_TEMPLATE.format(
+            title=escape(metadata.get('title', 'Quality Content Feed')),
+            link=link,
+            description=escape(metadata.get('description', 'Curated quality content and resources')),
+            date=pub_date,
+            items=item + old_date.join(_FILLER_ITEMS_PARTS)
+        )
     
     async def save_rss_feed(self, feed_content: str, target_url: str) -> str:
         """Save RSS feed to file and return path"""
@@ -177,28 +171,35 @@ class RSSDistributionEngine(IndexingMethodBase):
     async def distribute_feed(self, feed_path: str) -> List[Dict[str, Any]]:
         """Distribute RSS feed to aggregators"""
         
-        results = []
         feed_url = self._get_feed_url(feed_path)
         
-        async with aiohttp.ClientSession() as session:
-            for aggregator in self.feed_aggregators:
-                try:
-                    result = await self._ping_aggregator(session, aggregator, feed_url)
-                    results.append(result)
-                    
-                    # Rate limiting between pings
-                    await asyncio.sleep(2)
-                    
-                except Exception as e:
-                    self.logger.error(f"Failed to ping {aggregator}: {str(e)}")
-                    results.append({
-                        'aggregator': aggregator,
-                        'success': False,
-                        'error': str(e)
-                    })
+        async with use_session(self.http_session) as session:
+            return await self._ping_aggregators(session, feed_url)
+    
+    async def _ping_aggregators(self, session: aiohttp.ClientSession, feed_url: str) -> List[Dict[str, Any]]:
+        """Ping every aggregator concurrently over one session"""
+        results = await asyncio.gather(
+            *(self._ping_with_limit(session, aggregator, feed_url) for aggregator in self.feed_aggregators),
+            return_exceptions=True
+        )
+        
+        for index, (aggregator, result) in enumerate(zip(self.feed_aggregators, results)):
+            if isinstance(result, Exception):
+                self.logger.error(f"Failed to ping {aggregator}: {str(result)}")
+                results[index] = {
+                    'aggregator': aggregator,
+                    'success': False,
+                    'error': str(result)
+                }
         
         return results
     
+    async def _ping_with_limit(self, session: aiohttp.ClientSession,
+                               aggregator: str, feed_url: str) -> Dict[str, Any]:
+        """Ping an aggregator once its rate limit allows"""
+        await self.ping_limiter.wait(aggregator)
+        return await self._ping_aggregator(session, aggregator, feed_url)
+    
     async def _ping_aggregator(self, session: aiohttp.ClientSession, 
                               aggregator: str, feed_url: str) -> Dict[str, Any]:
         """Ping a specific aggregator with the RSS feed"""
@@ -245,39 +246,54 @@ class RSSDistributionEngine(IndexingMethodBase):
         sitemap_path = os.path.join(self.rss_directory, 'sitemap.xml')
         feed_url = self._get_feed_url(feed_path)
         
+        loc = escape(feed_url)
+        entry = _SITEMAP_ENTRY_TEMPLATE.format(
+            loc=loc,
+            lastmod=datetime.now().strftime('%Y-%m-%d')
+        ).encode('utf-8')
+        
         try:
-            # Load existing sitemap or create new one
-            if os.path.exists(sitemap_path):
-                tree = ET.parse(sitemap_path)
-                root = tree.getroot()
-            else:
-                root = ET.Element('urlset')
-                root.set('xmlns', 'http://www.sitemaps.org/schemas/sitemap/0.9')
-            
-            # Add new URL entry
-            url_elem = ET.SubElement(root, 'url')
-            
-            loc = ET.SubElement(url_elem, 'loc')
-            loc.text = feed_url
-            
-            lastmod = ET.SubElement(url_elem, 'lastmod')
-            lastmod.text = datetime.now().strftime('%Y-%m-%d')
-            
-            changefreq = ET.SubElement(url_elem, 'changefreq')
-            changefreq.text = 'daily'
-            
-            priority = ET.SubElement(url_elem, 'priority')
-            priority.text = '0.8'
-            
-            # Save sitemap
-            tree = ET.ElementTree(root)
-            tree.write(sitemap_path, encoding='utf-8', xml_declaration=True)
+            # Appending never rereads the file, so duplicates are caught here
+            if self._sitemap_locs is None:
+                self._sitemap_locs = self._read_sitemap_locs(sitemap_path)
+            if loc in self._sitemap_locs:
+                return
             
+            self._append_sitemap_entry(sitemap_path, entry)
+            self._sitemap_locs.add(loc)
             self.logger.info(f"Sitemap updated: {sitemap_path}")
             
         except Exception as e:
             self.logger.error(f"Failed to update sitemap: {str(e)}")
     
+    @staticmethod
+    def _read_sitemap_locs(sitemap_path: str) -> set:
+        """Every <loc> value in an existing sitemap, still XML-escaped"""
+        if not os.path.exists(sitemap_path):
+            return set()
+        with open(sitemap_path, encoding='utf-8') as f:
+            return set(_SITEMAP_LOC_RE.findall(f.read()))
+    
+    @staticmethod
+    def _append_sitemap_entry(sitemap_path: str, entry: bytes):
+        """Insert one <url> block before the sitemap's closing tag, creating the file if needed"""
+        if os.path.exists(sitemap_path):
+            with open(sitemap_path, 'r+b') as f:
+                # Only the tail is read; the closing tag is rewritten after the new entry
+                size = f.seek(0, os.SEEK_END)
+                start = max(0, size - _SITEMAP_TAIL_WINDOW)
+                f.seek(start)
+                closing = f.read().rfind(b'</')
+                if closing != -1:
+                    f.seek(start + closing)
+                    tail = f.read()
+                    f.seek(start + closing)
+                    f.write(entry + tail)
+                    return
+        
+        with open(sitemap_path, 'w', encoding='utf-8') as f:
+            f.write(_SITEMAP_HEAD + entry.decode('utf-8') + _SITEMAP_TAIL)
+    
     def _generate_item_title(self, url: str, metadata: Dict = None) -> str:
         """Generate appropriate title for RSS item"""
         
@@ -286,9 +302,7 @@ class RSSDistributionEngine(IndexingMethodBase):
         
         # Extract domain for title
         try:
-            from urllib.parse import urlparse
-            domain = urlparse(url).netloc.replace('www.', '')
-            return f"Quality Content from {domain}"
+            return f"Quality Content from {_domain_of(url)}"
         except:
             return "Interesting Content Resource"
     
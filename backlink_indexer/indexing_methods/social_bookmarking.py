@@ -47,7 +47,7 @@ class SocialBookmarkingEngine(IndexingMethodBase):
     async def process_url(self, url: str, metadata: Dict[str, Any] = None) -> Dict[str, Any]:
         """Submit URL to social bookmarking platforms"""
         
-        if not await self.validate_url(url):
+        if not self.validate_url(url):
             return {
                 'url': url,
                 'method': 'social_bookmarking',
@@ -106,7 +106,7 @@ class SocialSignalEngine(IndexingMethodBase):
     
     async def process_url(self, url: str, metadata: Dict[str, Any] = None) -> Dict[str, Any]:
         """Process URL for social signal amplification"""
-        if not await self.validate_url(url):
+        if not self.validate_url(url):
             return {
                 'url': url,
                 'method': 'social_signals',
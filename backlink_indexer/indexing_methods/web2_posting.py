@@ -64,7 +64,7 @@ class Web2PostingEngine(IndexingMethodBase):
     async def process_url(self, url: str, metadata: Dict[str, Any] = None) -> Dict[str, Any]:
         """Create posts on Web 2.0 platforms featuring the URL"""
         
-        if not await self.validate_url(url):
+        if not self.validate_url(url):
             return {
                 'url': url,
                 'method': 'web2_posting',
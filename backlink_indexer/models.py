@@ -74,6 +74,46 @@ class IndexingResult:
     metadata: Optional[Dict[str, Any]] = None
 
 
+@dataclass
+class IndexingAttempt:
+    """A single platform-level attempt made by an indexing method"""
+    url: str
+    method: str
+    platform: str
+    success: bool
+    timestamp: datetime
+    error_message: str = ""
+
+
+@dataclass(slots=True, frozen=True)
+class DirectoryEntry:
+    """A web directory ranked for a site category"""
+    url: str
+    type: str
+    authority_score: int
+    submission_type: str
+    suitability_score: int
+    category_based: bool
+    
+    def as_dict(self) -> Dict[str, Any]:
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
+@dataclass(slots=True)
+class SubmissionData:
+    """Values entered into a directory submission form"""
+    url: str
+    title: str
+    description: str
+    keywords: str
+    category: str
+    contact_email: str
+    contact_name: str
+    
+    def as_dict(self) -> Dict[str, str]:
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
 @dataclass
 class MethodPerformance:
     """Performance metrics for an indexing method"""
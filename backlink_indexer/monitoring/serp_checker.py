@@ -13,6 +13,8 @@ from urllib.parse import quote, urljoin
 from bs4 import BeautifulSoup
 from fake_useragent import UserAgent
 from ..models import SERPResult
+from ..core.http_session import use_session
+from ..core.rate_limit import SlotRateLimiter
 from ..anti_detection.stealth_browser import StealthBrowserManager
 
 
@@ -27,6 +29,11 @@ class SERPChecker:
         self.user_agent = UserAgent()
         self.browser_manager = StealthBrowserManager(config)
         self.session_timeout = aiohttp.ClientTimeout(total=30)
+        # Shared aiohttp session injected by the coordinator, if any
+        self.http_session = None
+        
+        # Per-engine pacing so concurrent checks don't trip rate limits
+        self.query_limiter = SlotRateLimiter(per_second=2.0)
         self.logger = logging.getLogger(__name__)
         
         self.search_engines = {
@@ -60,7 +67,8 @@ class SERPChecker:
             }
         }
     
-    async def check_url_indexed(self, url: str, search_engines: List[str] = None) -> Dict[str, SERPResult]:
+    async def check_url_indexed(self, url: str, search_engines: List[str] = None,
+                                pause_between_queries: bool = True) -> Dict[str, SERPResult]:
         """Check if URL is indexed across multiple search engines"""
         
         if search_engines is None:
@@ -96,8 +104,10 @@ class SERPChecker:
                     
                     engine_results.append(serp_result)
                     
-                    # Add delay between queries to avoid rate limiting
-                    await asyncio.sleep(random.uniform(2, 5))
+                    # Add delay between queries to avoid rate limiting; batch
+                    # checks rely on the per-engine query slots alone
+                    if pause_between_queries:
+                        await asyncio.sleep(random.uniform(2, 5))
                     
                 except Exception as e:
                     self.logger.error(f"Error checking {url} on {engine}: {str(e)}")
@@ -135,6 +145,8 @@ class SERPChecker:
         engine_config = self.search_engines[engine]
         search_url = engine_config['url']
         
+        await self.query_limiter.wait(engine)
+        
         # Format query parameters
         params = {}
         for key, value in engine_config['params'].items():
@@ -151,14 +163,8 @@ class SERPChecker:
         }
         
         try:
-            async with aiohttp.ClientSession(timeout=self.session_timeout) as session:
-                async with session.get(search_url, params=params, headers=headers) as response:
-                    if response.status == 200:
-                        html = await response.text()
-                        return self._parse_search_results(html, engine_config)
-                    else:
-                        self.logger.error(f"Search request failed with status {response.status}")
-                        return {'results': []}
+            async with use_session(self.http_session, timeout=self.session_timeout) as session:
+                return await self._fetch_results(session, search_url, params, headers, engine_config)
                         
         except asyncio.TimeoutError:
             self.logger.error(f"Search timeout for {engine}")
@@ -167,6 +173,19 @@ class SERPChecker:
             self.logger.error(f"Search error for {engine}: {str(e)}")
             return {'results': []}
     
+    async def _fetch_results(self, session: aiohttp.ClientSession, search_url: str,
+                             params: Dict[str, Any], headers: Dict[str, str],
+                             engine_config: Dict) -> Dict[str, Any]:
+        """Fetch one results page over the given session and parse it"""
+        async with session.get(search_url, params=params, headers=headers,
+                               timeout=self.session_timeout) as response:
+            if response.status == 200:
+                html = await response.text()
+                return self._parse_search_results(html, engine_config)
+            else:
+                self.logger.error(f"Search request failed with status {response.status}")
+                return {'results': []}
+    
     def _parse_search_results(self, html: str, engine_config: Dict) -> Dict[str, Any]:
         """Parse search engine results HTML"""
         
@@ -286,6 +305,55 @@ class SERPChecker:
         
         return results
     
+    async def batch_check_indexing(self, urls: List[str], search_engines: List[str] = None,
+                                   concurrency: int = 8, timeout: Optional[float] = None) -> List[Dict[str, Any]]:
+        """
+        Check many URLs concurrently and score how widely each is indexed
+        Checks still running after timeout seconds are cancelled and marked timed_out
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+        
+        async def check(url: str) -> Dict[str, Any]:
+            async with semaphore:
+                engine_results = await self.check_url_indexed(url, search_engines, pause_between_queries=False)
+            
+            found_on = {
+                engine: any(result.found for result in serp_results)
+                for engine, serp_results in engine_results.items()
+            }
+            return {
+                'url': url,
+                'engines': found_on,
+                'indexing_score': sum(found_on.values()) / len(found_on) if found_on else 0.0
+            }
+        
+        tasks = [asyncio.create_task(check(url)) for url in urls]
+        if not tasks:
+            return []
+        
+        # The query slots pace every check, so the time budget is what keeps
+        # large batches from holding the caller
+        _, pending = await asyncio.wait(tasks, timeout=timeout)
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+        
+        if pending:
+            self.logger.warning(f"SERP check budget of {timeout}s ran out with {len(pending)} URLs unchecked")
+        
+        checked = []
+        for url, task in zip(urls, tasks):
+            if task in pending:
+                result = {'url': url, 'engines': {}, 'indexing_score': 0.0, 'timed_out': True}
+            elif task.exception() is not None:
+                self.logger.error(f"Error checking {url}: {str(task.exception())}")
+                result = {'url': url, 'engines': {}, 'indexing_score': 0.0, 'error': str(task.exception())}
+            else:
+                result = task.result()
+            checked.append(result)
+        
+        return checked
+    
     async def verify_indexing_success(self, urls: List[str], 
                                     min_engines: int = 2) -> Dict[str, bool]:
         """Verify if URLs are successfully indexed across minimum number of engines"""
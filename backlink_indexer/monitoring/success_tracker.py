@@ -3,14 +3,16 @@ Success tracking and analytics for backlink indexing
 Stores metrics in PostgreSQL and provides comprehensive reporting
 """
 
+import asyncio
+import json
 import logging
 from datetime import datetime, timedelta
 from typing import List, Dict, Any, Optional, Tuple
-from sqlalchemy import create_model, Column, Integer, String, Boolean, Float, DateTime, Text, Index
+from sqlalchemy import Column, Integer, String, Boolean, Float, DateTime, Text, Index
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy import func
-from ..models import IndexingResult, IndexingMethod, MethodPerformance
+from ..models import IndexingResult, IndexingAttempt, IndexingMethod, MethodPerformance
 import os
 
 Base = declarative_base()
@@ -196,6 +198,41 @@ class SuccessTracker:
         finally:
             session.close()
     
+    async def record_attempts_batch(self, attempts: List[IndexingAttempt]):
+        """Record a batch of indexing attempts with one multi-row insert"""
+        if not attempts:
+            return
+        
+        # The database round-trip is blocking, keep it off the event loop
+        await asyncio.to_thread(self._insert_attempts, attempts)
+    
+    def _insert_attempts(self, attempts: List[IndexingAttempt]):
+        """Insert attempts in a single transaction"""
+        session = self.Session()
+        
+        try:
+            session.bulk_insert_mappings(IndexingResultRecord, [
+                {
+                    'url': attempt.url,
+                    'method': attempt.method,
+                    'success': attempt.success,
+                    'timestamp': attempt.timestamp,
+                    'error_message': attempt.error_message or None,
+                    'metadata': json.dumps({'platform': attempt.platform})
+                }
+                for attempt in attempts
+            ])
+            session.commit()
+            
+            self.logger.info(f"Recorded {len(attempts)} attempts in batch")
+            
+        except Exception as e:
+            session.rollback()
+            self.logger.error(f"Error recording attempts batch: {str(e)}")
+            raise
+        finally:
+            session.close()
+    
     def get_historical_data(self, start_date: datetime, end_date: datetime) -> List[IndexingResult]:
         """Retrieve historical indexing results within date range"""
         session = self.Session()
@@ -156,10 +156,14 @@ def api_process_urls():
         
         # Initialize coordinator with mock mode for demo
         config.mock_mode = True  # Enable mock mode for demo
-        coordinator = EnhancedBacklinkIndexingCoordinator(config)
+        
+        async def process_urls():
+            # The scope closes the coordinator's HTTP session and browsers before the loop ends
+            async with EnhancedBacklinkIndexingCoordinator(config) as coordinator:
+                return await coordinator.process_url_collection(urls, [metadata] * len(urls))
         
         # Process URLs
-        results = asyncio.run(coordinator.process_url_collection(urls, [metadata] * len(urls)))
+        results = asyncio.run(process_urls())
         
         return jsonify({
             'success': True,
@@ -237,8 +241,12 @@ def test_system():
                 'mock_results': True
             })
         
+        async def run_test():
+            async with coordinator:
+                return await coordinator.process_url_collection(test_urls)
+        
         # Run test
-        test_results = asyncio.run(coordinator.process_url_collection(test_urls))
+        test_results = asyncio.run(run_test())
         
         return render_template('backlink/test_results.html', results=test_results)
         
@@ -0,0 +1,72 @@
+"""
+Tests for the persistent Bloom filter
+"""
+
+from backlink_indexer.core.bloom_filter import BloomFilter, _HEADER
+
+
+class TestBloomFilterPersistence:
+    """Saved filters load back only into the same geometry"""
+    
+    def test_header_round_trip(self, tmp_path):
+        """A saved filter reloads with its header and every added item intact"""
+        path = tmp_path / 'indexed.bloom'
+        bloom = BloomFilter(1000, 1e-3)
+        items = [f'https://example.com/page-{i}' for i in range(500)]
+        bloom.update(items)
+        bloom.save(str(path))
+        
+        data = path.read_bytes()
+        assert _HEADER.unpack_from(data) == (bloom.num_bits, bloom.num_hashes)
+        assert len(data) == _HEADER.size + (bloom.num_bits + 7) // 8
+        
+        loaded = BloomFilter.load_or_create(str(path), 1000, 1e-3)
+        assert all(item in loaded for item in items)
+    
+    def test_different_geometry_starts_empty(self, tmp_path):
+        """A file saved with another capacity is ignored rather than misread"""
+        path = tmp_path / 'indexed.bloom'
+        bloom = BloomFilter(1000, 1e-3)
+        bloom.add('https://example.com/')
+        bloom.save(str(path))
+        
+        loaded = BloomFilter.load_or_create(str(path), 5000, 1e-3)
+        assert 'https://example.com/' not in loaded
+    
+    def test_mismatched_header_starts_empty(self, tmp_path):
+        """A body of the right length behind a different header is ignored"""
+        path = tmp_path / 'indexed.bloom'
+        bloom = BloomFilter(1000, 1e-3)
+        bloom.add('https://example.com/')
+        path.write_bytes(_HEADER.pack(bloom.num_bits, bloom.num_hashes + 1) + bytes(bloom._bits))
+        
+        loaded = BloomFilter.load_or_create(str(path), 1000, 1e-3)
+        assert 'https://example.com/' not in loaded
+    
+    def test_missing_path_starts_empty(self, tmp_path):
+        """No file, or persistence disabled, gives an empty filter"""
+        assert 'x' not in BloomFilter.load_or_create(str(tmp_path / 'absent.bloom'), 100)
+        assert 'x' not in BloomFilter.load_or_create('', 100)
+
+
+class TestBloomFilterAccuracy:
+    """Membership has no false negatives and about the configured false-positive rate"""
+    
+    def test_false_positive_rate_within_target(self):
+        """At capacity, unseen items test positive at roughly error_rate"""
+        capacity, error_rate = 10_000, 0.01
+        bloom = BloomFilter(capacity, error_rate)
+        bloom.update(f'https://example.com/added-{i}' for i in range(capacity))
+        
+        probes = 20_000
+        false_positives = sum(f'https://example.org/unseen-{i}' in bloom for i in range(probes))
+        
+        assert false_positives / probes < error_rate * 2
+    
+    def test_no_false_negatives(self):
+        """Every added item tests positive"""
+        bloom = BloomFilter(100, 1e-4)
+        items = [f'https://example.com/{i}' for i in range(100)]
+        bloom.update(items)
+        
+        assert all(item in bloom for item in items)
@@ -0,0 +1,162 @@
+"""
+Tests for the bounded browser pool
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+from selenium.common.exceptions import WebDriverException
+
+from backlink_indexer.automation.browser_manager import BrowserPool, MockBrowser
+
+
+class FakeDriver:
+    """Driver stand-in whose reset can be made to fail"""
+    
+    def __init__(self, reset_fails: bool = False):
+        self.reset_fails = reset_fails
+        self.resets = 0
+    
+    def delete_all_cookies(self):
+        if self.reset_fails:
+            raise RuntimeError('browser crashed')
+        self.resets += 1
+    
+    def execute_script(self, script, element=None):
+        pass
+
+
+class FakeBrowserManager:
+    """Browser manager that launches drivers from a factory and records cleanups"""
+    
+    def __init__(self, factory, mock_mode: bool = False):
+        self.config = SimpleNamespace(mock_mode=mock_mode)
+        self.factory = factory
+        self.launched = []
+        self.cleaned_up = []
+    
+    def create_stealth_browser(self):
+        driver = self.factory()
+        self.launched.append(driver)
+        return driver
+    
+    def cleanup_driver(self, driver):
+        self.cleaned_up.append(driver)
+
+
+class TestBrowserPoolExhaustion:
+    """Borrowers beyond the pool size wait for a browser to come back"""
+    
+    @pytest.mark.asyncio
+    async def test_borrowers_share_the_pool_size(self):
+        """Three borrowers of a two-browser pool launch only two browsers"""
+        manager = FakeBrowserManager(FakeDriver)
+        pool = BrowserPool(manager, size=2)
+        in_use = []
+        peak = 0
+        
+        async def borrow():
+            nonlocal peak
+            async with pool.acquire() as driver:
+                in_use.append(driver)
+                peak = max(peak, len(in_use))
+                await asyncio.sleep(0.02)
+                in_use.remove(driver)
+        
+        await asyncio.gather(borrow(), borrow(), borrow())
+        
+        assert len(manager.launched) == 2
+        assert peak == 2
+    
+    @pytest.mark.asyncio
+    async def test_returned_browser_is_reset_and_reused(self):
+        """A returned browser is reset and handed to the next borrower"""
+        manager = FakeBrowserManager(FakeDriver)
+        pool = BrowserPool(manager, size=1)
+        
+        async with pool.acquire() as first:
+            pass
+        async with pool.acquire() as second:
+            pass
+        
+        assert second is first
+        assert first.resets == 2
+    
+    @pytest.mark.asyncio
+    async def test_close_quits_every_browser(self):
+        """close() cleans up every launched browser"""
+        manager = FakeBrowserManager(FakeDriver)
+        pool = BrowserPool(manager, size=3)
+        await pool.warm()
+        await pool.close()
+        
+        assert sorted(map(id, manager.cleaned_up)) == sorted(map(id, manager.launched))
+
+
+class TestBrowserPoolDiscard:
+    """Browsers that can't be reset, or are mock fallbacks, never go back out"""
+    
+    @pytest.mark.asyncio
+    async def test_failed_reset_discards_and_replaces(self):
+        """A browser whose reset fails is quit and a fresh one is launched"""
+        manager = FakeBrowserManager(lambda: FakeDriver(reset_fails=True))
+        pool = BrowserPool(manager, size=1)
+        
+        async with pool.acquire() as first:
+            pass
+        async with pool.acquire() as second:
+            pass
+        
+        assert second is not first
+        assert manager.cleaned_up == [first, second]
+        assert pool._drivers == []
+    
+    @pytest.mark.asyncio
+    async def test_waiter_wakes_after_discard(self):
+        """A borrower waiting on a full pool gets a replacement when a browser is discarded"""
+        manager = FakeBrowserManager(lambda: FakeDriver(reset_fails=True))
+        pool = BrowserPool(manager, size=1)
+        
+        async def borrow():
+            async with pool.acquire() as driver:
+                await asyncio.sleep(0.02)
+                return driver
+        
+        drivers = await asyncio.wait_for(asyncio.gather(borrow(), borrow()), timeout=2.0)
+        
+        assert drivers[0] is not drivers[1]
+        assert len(manager.launched) == 2
+    
+    @pytest.mark.asyncio
+    async def test_mock_fallback_rejected_outside_mock_mode(self):
+        """Without mock mode, a launch that only yields mocks raises after retrying"""
+        manager = FakeBrowserManager(MockBrowser)
+        pool = BrowserPool(manager, size=1)
+        
+        with pytest.raises(WebDriverException):
+            async with pool.acquire():
+                pass
+        
+        assert len(manager.launched) == pool.launch_attempts
+        assert pool._drivers == []
+        assert pool._launching == 0
+    
+    @pytest.mark.asyncio
+    async def test_mock_fallback_retried_until_real_browser(self):
+        """A mock fallback is retried and the next real browser is used"""
+        drivers = iter([MockBrowser(), FakeDriver()])
+        manager = FakeBrowserManager(lambda: next(drivers))
+        pool = BrowserPool(manager, size=1)
+        
+        async with pool.acquire() as driver:
+            assert isinstance(driver, FakeDriver)
+    
+    @pytest.mark.asyncio
+    async def test_mock_browsers_allowed_in_mock_mode(self):
+        """In mock mode the pool lends out mock browsers"""
+        manager = FakeBrowserManager(MockBrowser, mock_mode=True)
+        pool = BrowserPool(manager, size=1)
+        
+        async with pool.acquire() as driver:
+            assert isinstance(driver, MockBrowser)
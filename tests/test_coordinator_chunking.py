@@ -0,0 +1,46 @@
+"""
+Tests for the coordinator's adaptive chunk sizing
+"""
+
+import pytest
+
+from backlink_indexer.core.coordinator import BacklinkIndexingCoordinator
+
+
+@pytest.fixture
+def coordinator(test_config):
+    test_config.initial_chunk_size = 64
+    test_config.max_chunk_size = 128
+    test_config.chunk_url_latency_target = 1.0
+    return BacklinkIndexingCoordinator(test_config)
+
+
+class TestAdaptChunkSize:
+    """Chunks shrink after failures and grow while they stay fast"""
+    
+    def test_errors_halve_the_chunk(self, coordinator):
+        """Any method error halves the chunk size"""
+        coordinator._adapt_chunk_size(64, elapsed=1.0, method_errors=1)
+        assert coordinator._chunk_size == 32
+    
+    def test_errors_stop_at_the_minimum(self, coordinator):
+        """Repeated failures never shrink the chunk below the minimum"""
+        for _ in range(10):
+            coordinator._adapt_chunk_size(coordinator._chunk_size, elapsed=1.0, method_errors=3)
+        assert coordinator._chunk_size == coordinator._MIN_CHUNK_SIZE
+    
+    def test_fast_chunks_grow(self, coordinator):
+        """A chunk at or under the per-URL latency target grows by half"""
+        coordinator._adapt_chunk_size(64, elapsed=64 * 1.0, method_errors=0)
+        assert coordinator._chunk_size == 96
+    
+    def test_growth_stops_at_the_maximum(self, coordinator):
+        """Growth is capped at max_chunk_size"""
+        for _ in range(10):
+            coordinator._adapt_chunk_size(coordinator._chunk_size, elapsed=0.1, method_errors=0)
+        assert coordinator._chunk_size == coordinator.config.max_chunk_size
+    
+    def test_slow_chunks_keep_their_size(self, coordinator):
+        """A chunk over the latency target without errors leaves the size alone"""
+        coordinator._adapt_chunk_size(64, elapsed=64 * 2.0, method_errors=0)
+        assert coordinator._chunk_size == 64
@@ -0,0 +1,44 @@
+"""
+Tests for the coordinator's public result payloads
+"""
+
+import asyncio
+
+import pytest
+
+from backlink_indexer.core.coordinator import BacklinkIndexingCoordinator
+
+
+@pytest.fixture
+def coordinator(test_config):
+    """Coordinator in mock mode"""
+    return BacklinkIndexingCoordinator(test_config)
+
+
+class TestProcessUrlCollectionResults:
+    """Per-URL records are part of the default result"""
+    
+    def test_records_included_by_default(self, coordinator):
+        """Callers get url_records without asking for them"""
+        results = asyncio.run(coordinator.process_url_collection([]))
+        assert results['url_records'] == []
+    
+    def test_records_can_be_skipped(self, coordinator):
+        """include_records=False leaves the records out"""
+        results = asyncio.run(coordinator.process_url_collection([], include_records=False))
+        assert 'url_records' not in results
+
+
+class TestPerformanceSummary:
+    """The summary reports the configuration as it is when asked"""
+    
+    def test_configuration_reflects_later_changes(self, coordinator):
+        """Changing the config after construction shows up in the summary"""
+        coordinator.config.max_chunk_size = 7
+        assert coordinator.get_performance_summary()['configuration']['max_chunk_size'] == 7
+    
+    def test_configuration_is_a_copy(self, coordinator):
+        """Editing the reported configuration leaves the live config alone"""
+        summary = coordinator.get_performance_summary()
+        summary['configuration']['max_chunk_size'] = 3
+        assert coordinator.config.max_chunk_size != 3
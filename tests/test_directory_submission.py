@@ -0,0 +1,91 @@
+"""
+Tests for directory submission browser handling
+"""
+
+import asyncio
+import contextlib
+import dataclasses
+import time
+
+import pytest
+
+from backlink_indexer.automation.browser_manager import StealthBrowserManager
+from backlink_indexer.indexing_methods.directory_submission import DirectorySubmissionEngine
+from backlink_indexer.models import DirectoryEntry, SubmissionData
+
+
+class SlowDriver:
+    """Driver whose navigation blocks the calling thread like Selenium's"""
+    
+    def __init__(self, load_time: float):
+        self.load_time = load_time
+        self.visited = []
+    
+    def get(self, url):
+        time.sleep(self.load_time)
+        self.visited.append(url)
+    
+    def execute_script(self, script, *args):
+        return 'complete'
+
+
+@pytest.fixture
+def engine(test_config):
+    """Directory engine in mock mode"""
+    return DirectorySubmissionEngine(test_config, StealthBrowserManager(test_config))
+
+
+class TestNavigation:
+    """Page loads run off the event loop"""
+    
+    @pytest.mark.asyncio
+    async def test_concurrent_navigations_overlap(self, engine):
+        """Blocking page loads in different drivers run in parallel"""
+        drivers = [SlowDriver(0.3) for _ in range(4)]
+        
+        start = time.perf_counter()
+        await asyncio.gather(*(engine._navigate(driver, 'https://example.com/') for driver in drivers))
+        elapsed = time.perf_counter() - start
+        
+        assert elapsed < 0.3 * 2
+        assert all(driver.visited == ['https://example.com/'] for driver in drivers)
+
+
+
+class TestPooledSubmission:
+    """Submissions without a caller driver borrow one from the pool"""
+    
+    @pytest.mark.asyncio
+    async def test_submit_without_driver_uses_pool(self, test_config, monkeypatch):
+        """A missing driver is acquired from the browser pool outside mock mode"""
+        config = dataclasses.replace(test_config, mock_mode=False)
+        engine = DirectorySubmissionEngine(config, StealthBrowserManager(config))
+        pooled = SlowDriver(0)
+        
+        @contextlib.asynccontextmanager
+        async def acquire():
+            yield pooled
+        
+        async def found(driver):
+            return True
+        
+        async def filled(driver, submission_data, directory_info):
+            return driver is pooled
+        
+        monkeypatch.setattr(engine.browser_manager.browser_pool, 'acquire', acquire)
+        monkeypatch.setattr(engine, 'find_submission_form', found)
+        monkeypatch.setattr(engine, 'fill_submission_form', filled)
+        
+        directory = DirectoryEntry(
+            url='https://directory.example.com/', type='general', authority_score=50,
+            submission_type='form', suitability_score=50, category_based=False
+        )
+        submission = SubmissionData(
+            url='https://example.com/', title='Example', description='Example site', keywords='example',
+            category='general', contact_email='owner@example.com', contact_name='Owner'
+        )
+        
+        result = await engine.submit_to_directory('https://example.com/', directory, submission)
+        
+        assert result['success'] is True
+        assert pooled.visited == ['https://directory.example.com/']
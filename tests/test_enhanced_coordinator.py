@@ -0,0 +1,164 @@
+"""
+Tests for the enhanced coordinator's session scope and attempt persistence
+"""
+
+import asyncio
+from datetime import datetime
+
+import pytest
+
+from backlink_indexer.core.enhanced_coordinator import EnhancedBacklinkIndexingCoordinator
+from backlink_indexer.monitoring.success_tracker import IndexingAttempt
+
+
+@pytest.fixture
+def coordinator(test_config, temp_database, monkeypatch):
+    """Coordinator whose strategy, SERP checks and tracker writes are stubbed out"""
+    monkeypatch.setenv('DATABASE_URL', temp_database)
+    test_config.indexed_urls_bloom_path = ''
+    coordinator = EnhancedBacklinkIndexingCoordinator(test_config)
+    coordinator.recorded = []
+    
+    async def fake_strategy(urls, metadata_list):
+        attempts = [
+            IndexingAttempt(url=url, method='rss_distribution', platform='test', success=True,
+                            timestamp=datetime.now(), error_message='')
+            for url in urls
+        ]
+        return {
+            'urls_processed': len(urls),
+            'layer_results': {'primary': {'methods_used': ['rss_distribution'], '_attempts': attempts}},
+            'successful_urls': list(urls),
+            'submitted_urls': [url for url in urls if 'amplified-only' not in url],
+            'failed_urls': [],
+            'overall_success_rate': 1.0
+        }
+    
+    async def fake_batch_check(urls, *args, **kwargs):
+        return [{'url': url, 'engines': {}, 'indexing_score': 0.0} for url in urls]
+    
+    async def slow_record(attempts):
+        # Slower than the rest of the pipeline, so only a flush can wait for it
+        await asyncio.sleep(0.2)
+        coordinator.recorded.extend(attempts)
+    
+    coordinator.multi_layer_strategy.execute_layered_strategy = fake_strategy
+    coordinator.serp_checker.batch_check_indexing = fake_batch_check
+    coordinator.success_tracker.record_attempts_batch = slow_record
+    return coordinator
+
+
+class TestAttemptPersistence:
+    """Queued attempts reach the SuccessTracker before the caller's loop ends"""
+    
+    def test_bare_call_flushes_before_asyncio_run_returns(self, coordinator, sample_urls):
+        """A call outside any scope flushes its attempts and closes the session"""
+        results = asyncio.run(coordinator.process_url_collection(sample_urls))
+        
+        assert results['urls_processed'] == len(sample_urls)
+        assert sorted(attempt.url for attempt in coordinator.recorded) == sorted(sample_urls)
+        assert coordinator.http_session is None
+    
+    def test_scoped_call_flushes_on_scope_exit(self, coordinator, sample_urls):
+        """Inside an outer scope the session stays open until that scope exits"""
+        async def run():
+            async with coordinator:
+                await coordinator.process_url_collection(sample_urls)
+                session_open = not coordinator.http_session.closed
+            return session_open
+        
+        assert asyncio.run(run())
+        assert sorted(attempt.url for attempt in coordinator.recorded) == sorted(sample_urls)
+        assert coordinator.http_session is None
+    
+    
+    def test_bare_calls_keep_the_browser_pool_warm(self, coordinator, sample_urls, monkeypatch):
+        """Only the explicit outermost scope closes the browser pool"""
+        pool_closes = []
+        
+        async def close_pool():
+            pool_closes.append(True)
+        
+        monkeypatch.setattr(coordinator.browser_manager.browser_pool, 'close', close_pool)
+        
+        asyncio.run(coordinator.process_url_collection(sample_urls))
+        asyncio.run(coordinator.process_url_collection(sample_urls))
+        assert pool_closes == []
+        
+        async def run():
+            async with coordinator:
+                await coordinator.process_url_collection(sample_urls)
+        
+        asyncio.run(run())
+        assert pool_closes == [True]
+
+
+class TestIndexedUrlFilter:
+    """Only real submission-layer successes make later runs skip a URL"""
+    
+    def test_persistence_is_off_by_default(self):
+        """No filter file is written unless a path is configured"""
+        from backlink_indexer.core.config import IndexingConfig
+        assert IndexingConfig().indexed_urls_bloom_path == ''
+    
+    def test_mock_runs_are_not_remembered(self, coordinator, sample_urls):
+        """Mock-mode successes never reach the filter, so a rerun processes every URL"""
+        asyncio.run(coordinator.process_url_collection(sample_urls))
+        results = asyncio.run(coordinator.process_url_collection(sample_urls))
+        
+        assert results['urls_processed'] == len(sample_urls)
+        assert results['skipped_urls'] == []
+    
+    def test_only_submission_successes_are_skipped(self, coordinator):
+        """A URL only amplification succeeded on is processed again"""
+        coordinator.config.mock_mode = False
+        urls = ['https://example.com/submitted', 'https://example.com/amplified-only']
+        asyncio.run(coordinator.process_url_collection(urls))
+        
+        results = asyncio.run(coordinator.process_url_collection(urls))
+        
+        assert results['skipped_urls'] == ['https://example.com/submitted']
+        assert results['urls_processed'] == 1
+    
+    def test_all_skipped_keeps_the_result_shape(self, coordinator):
+        """A run with nothing left to do still reports every result key"""
+        coordinator.config.mock_mode = False
+        urls = ['https://example.com/submitted']
+        full = asyncio.run(coordinator.process_url_collection(urls))
+        skipped = asyncio.run(coordinator.process_url_collection(urls))
+        
+        assert set(skipped) == set(full)
+        assert skipped['overall_success_rate'] == 0.0
+        assert skipped['urls_processed'] == 0
+        assert skipped['skipped_urls'] == urls
+    
+    def test_force_bypasses_the_filter(self, coordinator):
+        """force=True reprocesses URLs the filter remembers"""
+        coordinator.config.mock_mode = False
+        urls = ['https://example.com/submitted']
+        asyncio.run(coordinator.process_url_collection(urls))
+        
+        results = asyncio.run(coordinator.process_url_collection(urls, force=True))
+        
+        assert results['urls_processed'] == 1
+        assert results['skipped_urls'] == []
+
+
+class TestSubmittedUrls:
+    """calculate_overall_results separates submission successes from amplification"""
+    
+    def test_amplification_successes_are_not_submitted(self, coordinator):
+        """successful_urls covers every layer; submitted_urls only primary and secondary"""
+        strategy_results = {
+            'layer_results': {
+                'primary': {'_successful_set': frozenset({'https://a.example/'})},
+                'secondary': {'_successful_set': frozenset({'https://b.example/'})},
+                'amplification': {'_successful_set': frozenset({'https://a.example/', 'https://c.example/'})}
+            }
+        }
+        urls = ['https://a.example/', 'https://b.example/', 'https://c.example/', 'https://d.example/']
+        coordinator.multi_layer_strategy.calculate_overall_results(strategy_results, urls)
+        
+        assert sorted(strategy_results['successful_urls']) == urls[:3]
+        assert sorted(strategy_results['submitted_urls']) == urls[:2]
+        assert strategy_results['failed_urls'] == urls[3:]
@@ -0,0 +1,54 @@
+"""
+Tests for batch processing in the indexing method base class
+"""
+
+import asyncio
+
+import pytest
+
+from backlink_indexer.automation.browser_manager import StealthBrowserManager
+from backlink_indexer.indexing_methods.base import IndexingMethodBase
+
+
+class ScriptedMethod(IndexingMethodBase):
+    """Method whose per-URL outcome is looked up from a table"""
+    
+    def __init__(self, config, outcomes):
+        super().__init__(config, StealthBrowserManager(config))
+        self.outcomes = outcomes
+    
+    async def process_url(self, url, metadata=None):
+        outcome = self.outcomes[url]
+        if isinstance(outcome, BaseException):
+            raise outcome
+        return outcome
+
+
+class TestProcessBatch:
+    """Failures become result rows, cancellation propagates"""
+    
+    @pytest.mark.asyncio
+    async def test_errors_become_failed_results(self, test_config):
+        """An ordinary exception is reported as a failed row for its URL"""
+        method = ScriptedMethod(test_config, {
+            'https://a.example.com/': {'url': 'https://a.example.com/', 'success': True},
+            'https://b.example.com/': RuntimeError('boom'),
+        })
+        
+        results = await method.process_batch(['https://a.example.com/', 'https://b.example.com/'])
+        
+        assert results[0]['success'] is True
+        assert results[1]['success'] is False
+        assert results[1]['error'] == 'boom'
+    
+    @pytest.mark.asyncio
+    async def test_cancellation_is_reraised(self, test_config):
+        """A cancelled URL task cancels the batch instead of counting as a failure"""
+        method = ScriptedMethod(test_config, {
+            'https://a.example.com/': {'url': 'https://a.example.com/', 'success': True},
+            'https://b.example.com/': asyncio.CancelledError(),
+        })
+        
+        with pytest.raises(asyncio.CancelledError):
+            await method.process_batch(['https://a.example.com/', 'https://b.example.com/'])
+        assert method.total_attempts == 0
@@ -0,0 +1,56 @@
+"""
+Tests for the pre-sampled random pool
+"""
+
+from backlink_indexer.automation.random_pool import RandomPool
+
+
+class TestRandomPoolRefill:
+    """The ring buffer serves exactly size draws per block"""
+    
+    def test_refills_only_after_last_draw(self):
+        """A block is used up before a new one is sampled"""
+        pool = RandomPool(size=4)
+        first_block = pool._pool
+        
+        draws = [pool.random() for _ in range(4)]
+        assert draws == first_block
+        assert pool._pool is first_block
+        
+        pool.random()
+        assert pool._pool is not first_block
+        assert pool._index == 1
+    
+    def test_draws_stay_in_unit_interval(self):
+        """Draws across several refills stay in [0, 1)"""
+        pool = RandomPool(size=8)
+        assert all(0.0 <= pool.random() < 1.0 for _ in range(100))
+
+
+class TestRandomPoolBoundaries:
+    """Derived draws reach both ends of their ranges"""
+    
+    def _pool_serving(self, values):
+        """Pool whose next draws are exactly the given values"""
+        pool = RandomPool(size=len(values))
+        pool._pool = list(values)
+        pool._index = 0
+        return pool
+    
+    def test_randint_is_inclusive(self):
+        """The lowest and highest samples map to low and high"""
+        pool = self._pool_serving([0.0, 1.0 - 1e-12])
+        assert pool.randint(1, 6) == 1
+        assert pool.randint(1, 6) == 6
+    
+    def test_choice_covers_first_and_last(self):
+        """The lowest and highest samples pick the first and last element"""
+        pool = self._pool_serving([0.0, 1.0 - 1e-12])
+        assert pool.choice('abc') == 'a'
+        assert pool.choice('abc') == 'c'
+    
+    def test_uniform_scales_draws(self):
+        """uniform maps [0, 1) onto [low, high)"""
+        pool = self._pool_serving([0.0, 0.5])
+        assert pool.uniform(2.0, 4.0) == 2.0
+        assert pool.uniform(2.0, 4.0) == 3.0
@@ -0,0 +1,81 @@
+"""
+Tests for the RSS engine's in-place sitemap append
+"""
+
+import xml.etree.ElementTree as ET
+
+import pytest
+
+from backlink_indexer.indexing_methods.rss_distribution import RSSDistributionEngine
+
+_NS = '{http://www.sitemaps.org/schemas/sitemap/0.9}'
+
+
+@pytest.fixture
+def engine(test_config, tmp_path, monkeypatch):
+    """RSS engine writing its feeds and sitemap under a temporary directory"""
+    monkeypatch.chdir(tmp_path)
+    return RSSDistributionEngine(test_config, None)
+
+
+def sitemap_locs(engine):
+    """Parse the engine's sitemap and return its <loc> values in order"""
+    root = ET.parse(f'{engine.rss_directory}/sitemap.xml').getroot()
+    assert root.tag == f'{_NS}urlset'
+    return [url.find(f'{_NS}loc').text for url in root.findall(f'{_NS}url')]
+
+
+class TestSitemapAppend:
+    """Appending keeps the sitemap well-formed and free of duplicate <url> entries"""
+    
+    @pytest.mark.asyncio
+    async def test_appends_stay_valid_xml(self, engine):
+        """Each append leaves a parseable sitemap with the entries in order"""
+        for name in ('a', 'b', 'c&d'):
+            await engine.create_sitemap_entry(f'generated_feeds/feed_{name}.xml')
+        
+        assert sitemap_locs(engine) == [
+            'https://example.com/feeds/feed_a.xml',
+            'https://example.com/feeds/feed_b.xml',
+            'https://example.com/feeds/feed_c&d.xml'
+        ]
+    
+    @pytest.mark.asyncio
+    async def test_repeated_feed_is_listed_once(self, engine):
+        """Appending the same feed twice leaves one <url> entry"""
+        await engine.create_sitemap_entry('generated_feeds/feed_a.xml')
+        await engine.create_sitemap_entry('generated_feeds/feed_b.xml')
+        await engine.create_sitemap_entry('generated_feeds/feed_a.xml')
+        
+        locs = sitemap_locs(engine)
+        assert len(locs) == len(set(locs)) == 2
+    
+    @pytest.mark.asyncio
+    async def test_existing_entries_are_not_duplicated(self, engine, test_config):
+        """A fresh engine reads the entries already on disk before appending"""
+        await engine.create_sitemap_entry('generated_feeds/feed_a.xml')
+        
+        restarted = RSSDistributionEngine(test_config, None)
+        await restarted.create_sitemap_entry('generated_feeds/feed_a.xml')
+        await restarted.create_sitemap_entry('generated_feeds/feed_b.xml')
+        
+        assert sitemap_locs(engine) == [
+            'https://example.com/feeds/feed_a.xml',
+            'https://example.com/feeds/feed_b.xml'
+        ]
+    
+    @pytest.mark.asyncio
+    async def test_appends_to_element_tree_sitemap(self, engine):
+        """A sitemap written by ElementTree takes new entries before its closing tag"""
+        root = ET.Element('urlset')
+        root.set('xmlns', 'http://www.sitemaps.org/schemas/sitemap/0.9')
+        ET.SubElement(ET.SubElement(root, 'url'), 'loc').text = 'https://example.com/feeds/feed_a.xml'
+        ET.ElementTree(root).write(f'{engine.rss_directory}/sitemap.xml', encoding='utf-8', xml_declaration=True)
+        
+        await engine.create_sitemap_entry('generated_feeds/feed_a.xml')
+        await engine.create_sitemap_entry('generated_feeds/feed_b.xml')
+        
+        assert sitemap_locs(engine) == [
+            'https://example.com/feeds/feed_a.xml',
+            'https://example.com/feeds/feed_b.xml'
+        ]
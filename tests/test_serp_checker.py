@@ -0,0 +1,66 @@
+"""
+Tests for batched SERP verification pacing
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from backlink_indexer.monitoring.serp_checker import SERPChecker
+
+
+@pytest.fixture
+def fast_checker(test_config):
+    """SERP checker whose searches return empty results after a short round trip"""
+    checker = SERPChecker(test_config)
+    checker.query_limiter.per_second = 200.0
+    checker.http_session = object()  # any injected session skips opening a real one
+    
+    async def fake_fetch(session, search_url, params, headers, engine_config):
+        await asyncio.sleep(0.01)
+        return {'results': []}
+    
+    checker._fetch_results = fake_fetch
+    return checker
+
+
+class TestBatchCheckIndexing:
+    """batch_check_indexing is paced only by query slots and bounded by its time budget"""
+    
+    @pytest.mark.asyncio
+    async def test_batch_skips_per_query_sleep(self, fast_checker):
+        """Without the 2-5s pause per query, a small batch finishes in well under a second"""
+        start = time.perf_counter()
+        results = await fast_checker.batch_check_indexing(
+            ['https://example.com/a', 'https://example.com/b'], timeout=10.0
+        )
+        elapsed = time.perf_counter() - start
+        
+        assert elapsed < 1.0
+        assert [result['url'] for result in results] == ['https://example.com/a', 'https://example.com/b']
+        assert not any(result.get('timed_out') for result in results)
+    
+    @pytest.mark.asyncio
+    async def test_wall_time_stays_flat_as_batch_grows(self, fast_checker):
+        """Larger batches stop at the time budget instead of growing with the URL count"""
+        fast_checker.query_limiter.per_second = 20.0
+        budget = 0.5
+        
+        timings = {}
+        for count in (10, 100, 400):
+            urls = [f'https://example.com/page-{i}' for i in range(count)]
+            start = time.perf_counter()
+            results = await fast_checker.batch_check_indexing(urls, timeout=budget)
+            timings[count] = time.perf_counter() - start
+            
+            assert len(results) == count
+            assert any(result.get('timed_out') for result in results)
+        
+        assert max(timings.values()) < budget + 0.5
+        assert timings[400] < timings[10] * 2
+    
+    @pytest.mark.asyncio
+    async def test_empty_batch(self, fast_checker):
+        """An empty batch returns immediately"""
+        assert await fast_checker.batch_check_indexing([], timeout=1.0) == []
@@ -0,0 +1,96 @@
+"""
+Tests for stealth typing and anti-detection script injection
+"""
+
+import numpy as np
+import pytest
+
+from backlink_indexer.automation.stealth_features import StealthFeatures
+
+
+class FakeDriver:
+    """Records the CDP commands and scripts sent to it"""
+    
+    def __init__(self, focus_sticks: bool = True):
+        self.focus_sticks = focus_sticks
+        self.cdp_commands = []
+        self.scripts = []
+    
+    def execute_cdp_cmd(self, command, params):
+        self.cdp_commands.append((command, params))
+    
+    def execute_script(self, script, *args):
+        self.scripts.append(script)
+        if 'activeElement' in script:
+            return self.focus_sticks
+        return []
+
+
+class FakeElement:
+    """Element whose typed keys are recorded"""
+    
+    def __init__(self, driver):
+        self.parent = driver
+        self.keys = []
+    
+    def send_keys(self, text):
+        self.keys.append(text)
+
+
+@pytest.fixture
+def features(test_config):
+    """StealthFeatures with a flat keystroke schedule"""
+    features = StealthFeatures(test_config)
+    # No delays or typos, so each call types the text as one run
+    features._keystroke_schedule = lambda text, speed_range: (
+        np.zeros(len(text)), np.zeros(len(text), dtype=bool)
+    )
+    return features
+
+
+class TestHumanTyping:
+    """Text goes to the target element even when another field holds focus"""
+    
+    @pytest.mark.asyncio
+    async def test_inserts_text_once_element_is_focused(self, features):
+        """A focused element gets the text through one CDP insertText"""
+        driver = FakeDriver(focus_sticks=True)
+        element = FakeElement(driver)
+        
+        await features.simulate_human_typing(element, 'hello')
+        
+        assert driver.cdp_commands == [("Input.insertText", {"text": 'hello'})]
+        assert element.keys == []
+    
+    @pytest.mark.asyncio
+    async def test_falls_back_to_send_keys_without_focus(self, features):
+        """If focus doesn't land on the element, send_keys targets it directly"""
+        driver = FakeDriver(focus_sticks=False)
+        element = FakeElement(driver)
+        
+        await features.simulate_human_typing(element, 'hello')
+        
+        assert driver.cdp_commands == []
+        assert element.keys == ['hello']
+
+
+class TestAntiDetectionInjection:
+    """The bundle is registered once per driver and re-run on the current page"""
+    
+    def test_registers_bundle_once_per_driver(self, features):
+        """Repeated injection adds no further new-document registrations"""
+        driver = FakeDriver()
+        for _ in range(3):
+            features.inject_anti_detection_scripts(driver)
+        
+        registrations = [c for c, _ in driver.cdp_commands if c == "Page.addScriptToEvaluateOnNewDocument"]
+        assert len(registrations) == 1
+        assert len(driver.scripts) == 3
+    
+    def test_each_driver_gets_its_own_registration(self, features):
+        """A new driver is registered even after another one was"""
+        first, second = FakeDriver(), FakeDriver()
+        features.inject_anti_detection_scripts(first)
+        features.inject_anti_detection_scripts(second)
+        
+        assert len(first.cdp_commands) == len(second.cdp_commands) == 1
@@ -0,0 +1,28 @@
+"""
+Tests for browser fingerprint generation
+"""
+
+from backlink_indexer.automation.user_agent_rotator import UserAgentRotator
+
+
+class TestFingerprints:
+    """Single and batch fingerprints share one layout"""
+    
+    def test_single_matches_batch_layout(self, test_config):
+        """The single-item fingerprint has the same keys as a batch entry"""
+        rotator = UserAgentRotator(test_config)
+        single = rotator.generate_browser_fingerprint()
+        batch = rotator.generate_browser_fingerprints(3)
+        
+        assert len(batch) == 3
+        assert all(entry.keys() == single.keys() for entry in batch)
+        assert single['viewport'] == {'width': single['screen']['width'], 'height': single['screen']['height']}
+    
+    def test_batch_advances_rotation_once(self, test_config):
+        """A batch moves the rotation counter as far as the same number of single draws"""
+        rotator = UserAgentRotator(test_config)
+        interval = test_config.user_agent_rotation_interval
+        
+        rotator.generate_browser_fingerprints(interval + 3)
+        
+        assert rotator.rotation_counter == 3